@@ -131,6 +131,79 @@ class LevelEventHandler:
             print(f"❌ 종료 중 오류: {e}")
             return False
 
+class MapEventRelay:
+    """맵 이벤트 리스너 전달 전용 (LevelEventHandler와 달리 출력/저장 훅 없음)
+
+    외부 리스너(예: validator.level_validator의 debounced 검증)가 있을 때만
+    on_map_opened / on_map_changed 델리게이트에 연결하고, 마지막 리스너가 해제되면 연결을 끊습니다.
+    map_changed는 WorldTearDown(3)을 포함해 모든 플래그를 그대로 전달합니다.
+    """
+    
+    def __init__(self):
+        self.subsystem = None
+        self._listeners = {"map_opened": [], "map_changed": []}
+    
+    @property
+    def is_bound(self):
+        return self.subsystem is not None
+    
+    def add_listener(self, event_name: str, callback):
+        """리스너 등록 (델리게이트에 연결하지 못하면 False)"""
+        if event_name not in self._listeners:
+            raise ValueError(f"지원하지 않는 이벤트: {event_name}")
+        if not self._bind():
+            return False
+        if callback not in self._listeners[event_name]:
+            self._listeners[event_name].append(callback)
+        return True
+    
+    def remove_listener(self, event_name: str, callback):
+        """리스너 해제 (남은 리스너가 없으면 델리게이트 연결 해제)"""
+        listeners = self._listeners.get(event_name, [])
+        if callback in listeners:
+            listeners.remove(callback)
+        if not any(self._listeners.values()):
+            self._unbind()
+    
+    def _bind(self):
+        if self.subsystem is not None:
+            return True
+        try:
+            subsystem = unreal.get_editor_subsystem(unreal.LevelEditorSubsystem)
+            if not subsystem:
+                return False
+            subsystem.on_map_opened.add_callable(self.on_map_opened)
+            subsystem.on_map_changed.add_callable(self.on_map_changed)
+            self.subsystem = subsystem
+            return True
+        except Exception as e:
+            print(f"❌ 맵 이벤트 연결 실패: {e}")
+            return False
+    
+    def _unbind(self):
+        if self.subsystem is None:
+            return
+        try:
+            self.subsystem.on_map_opened.remove_callable(self.on_map_opened)
+            self.subsystem.on_map_changed.remove_callable(self.on_map_changed)
+        except Exception as e:
+            print(f"❌ 맵 이벤트 연결 해제 실패: {e}")
+        self.subsystem = None
+    
+    def _notify(self, event_name: str, *args):
+        """등록된 리스너 호출 (리스너 오류가 다른 리스너를 막지 않도록 개별 처리)"""
+        for callback in list(self._listeners.get(event_name, [])):
+            try:
+                callback(*args)
+            except Exception as e:
+                print(f"❌ {event_name} 리스너 오류: {e}")
+    
+    def on_map_opened(self, filename: str, as_template: bool):
+        self._notify("map_opened", filename, as_template)
+    
+    def on_map_changed(self, map_change_flags: int):
+        self._notify("map_changed", map_change_flags)
+
 # 전역 딕셔너리를 사용한 핸들러 저장
 import builtins
 if not hasattr(builtins, '_maidcat_handlers'):
@@ -169,6 +242,26 @@ def stop_level_events():
         pass
     return True
 
+def _get_relay():
+    """리스너 전달용 MapEventRelay 가져오기 (reload 후에도 같은 인스턴스 유지)"""
+    if 'map_event_relay' not in builtins._maidcat_handlers:
+        builtins._maidcat_handlers['map_event_relay'] = MapEventRelay()
+    return builtins._maidcat_handlers['map_event_relay']
+
+def add_level_event_listener(event_name: str, callback):
+    """맵 이벤트 리스너 등록 (디버그 출력용 LevelEventHandler는 시작하지 않음)
+
+    Args:
+        event_name: "map_opened" (filename, as_template) 또는 "map_changed" (map_change_flags)
+        callback: 이벤트 인자를 그대로 받는 함수
+    """
+    return _get_relay().add_listener(event_name, callback)
+
+def remove_level_event_listener(event_name: str, callback):
+    """맵 이벤트 리스너 해제"""
+    if 'map_event_relay' in builtins._maidcat_handlers:
+        builtins._maidcat_handlers['map_event_relay'].remove_listener(event_name, callback)
+
 def get_level_events_status():
     """레벨 이벤트 핸들러 상태 출력"""
     try:
@@ -10,6 +10,7 @@ MaidCat 플러그인 시작 시 실행되는 핵심 초기화 스크립트
 
 사용법:
     MaidCatInitializer.initialize()  # 핵심 초기화
+    python -m util.bytecode_bundle  # (빌드 단계) 바이트코드 번들 생성
     MaidCatInitializer.install_dependencies()  # 의존성 설치
     MaidCatInitializer.setup_dev_environment()  # 개발환경 설정
 """
@@ -68,6 +69,38 @@ class MaidCatInitializer:
         else:
             print(f"모든 필요한 경로가 이미 설정됨")
     
+    @staticmethod
+    def install_bytecode_bundle():
+        """미리 컴파일한 바이트코드 번들이 있고 엔진 Python과 맞으면 우선 사용"""
+        plugin_python_path = MaidCatInitializer.get_plugin_path() / "Content" / "Python"
+        
+        try:
+            from util.bytecode_bundle import install_bundle
+            finder, problem = install_bundle(plugin_python_path)
+            if finder:
+                print(f"   {finder.format_stats()}")
+            else:
+                print(f"   💡 바이트코드 번들 사용 안 함: {problem}")
+        except Exception as e:
+            print(f"   ⚠️  바이트코드 번들 설치 실패 (소스 import 사용): {e}")
+    
+    @staticmethod
+    def install_module_index():
+        """MaidCat Python 폴더 모듈 인덱스 finder 설치 (플러그인 모듈 import 시 sys.path 탐색 생략)"""
+        plugin_python_path = MaidCatInitializer.get_plugin_path() / "Content" / "Python"
+        project_path = Path(unreal.Paths.project_dir())
+        roots = [
+            plugin_python_path,
+            project_path / "TA" / "TAPython" / "Python",
+        ]
+        
+        try:
+            from util.module_index import install_module_index
+            finder = install_module_index([str(root) for root in roots])
+            print(f"   {finder.format_stats()}")
+        except Exception as e:
+            print(f"   ⚠️  모듈 인덱스 설치 실패 (기본 import 사용): {e}")
+    
     @staticmethod
     def check_basic_environment():
         """기본 환경 상태 확인"""
@@ -101,94 +134,133 @@ class MaidCatInitializer:
     
     @staticmethod
     def run_startup_modules():
-        """startup 폴더의 모듈들 자동 실행 (성능 모니터링 포함)"""
-        print("\n🚀 startup 모듈들 실행 중...")
+        """startup 작업 실행 (부팅 필수 작업은 즉시, 나머지는 슬레이트 틱에서 지연 실행)"""
+        print("\n🚀 startup 작업 실행 중...")
         
         startup_path = MaidCatInitializer.get_plugin_path() / "Content" / "Python" / "startup"
         if not startup_path.exists():
             print("   ⚠️  startup 폴더를 찾을 수 없습니다")
             return
         
-        # startup 폴더의 Python 파일들 찾기
-        startup_files = list(startup_path.glob("*.py"))
+        # import 트리 프로파일러 (startup 패키지 import와 작업을 실행하는 동안만 기록)
+        profiler = MaidCatInitializer.start_import_profiler()
         
-        # 제외할 파일들 (테스트나 특수 목적)
-        exclude_files = {
-            "test_context_menu.py",  # 테스트 파일
-            "setup_python.py",      # 별도로 호출되는 설정 파일
-            "__init__.py"           # 초기화 파일
-        }
+        import_start_time = time.perf_counter()
+        try:
+            import startup
+            from util.startup_scheduler import StartupTask, get_scheduler
+        except Exception as e:
+            print(f"   ❌ startup 작업 목록 로드 실패: {e}")
+            if profiler:
+                profiler.stop()
+            return
+        finally:
+            if profiler:
+                profiler.pause()
+        import_duration = (time.perf_counter() - import_start_time) * 1000
         
-        executed_count = 0
-        failed_count = 0
-        total_start_time = time.time()
-        execution_times = []
+        scheduler = get_scheduler()
+        if scheduler.tasks:
+            # init_unreal을 다시 실행한 경우 → 작업은 한 번만 실행
+            print("   ⏭️  startup 작업이 이미 등록되어 있습니다")
+            if profiler:
+                profiler.stop()
+            if not scheduler.is_finished:
+                scheduler.start_deferred()
+            return
         
-        for py_file in startup_files:
-            file_name = py_file.name
-            
-            if file_name in exclude_files:
-                print(f"   ⏭️  건너뜀: {file_name} (제외 목록)")
+        if profiler:
+            profiler.add_section("startup (import)", import_duration)
+            scheduler.task_context = profiler.recording
+        
+        # 선언된 작업 + 선언되지 않은 startup/*.py (기존처럼 import 후 main() 호출)
+        tasks = startup.get_startup_tasks()
+        declared_modules = {task.module_name for task in tasks}
+        for py_file in sorted(startup_path.glob("*.py")):
+            module_stem = py_file.stem
+            module_name = f"startup.{module_stem}"
+            if module_stem == "__init__" or module_name in declared_modules:
+                continue
+            if module_stem in startup.MANUAL_MODULES:
+                print(f"   ⏭️  건너뜀: {py_file.name} (수동 실행 모듈)")
                 continue
+            tasks.append(StartupTask(module_stem, module_name, description=f"{py_file.name} (자동 발견)"))
+        
+        def on_task_finished(task):
+            phase = "부팅" if task.is_critical else "지연"
+            if task.error:
+                print(f"   ❌ [{phase}] {task.name}: 실행 실패 ({task.duration_ms:.1f}ms) - {task.error}")
+            else:
+                print(f"   ✅ [{phase}] {task.name}: {task.duration_ms:.1f}ms")
+            if profiler:
+                profiler.add_section(task.name, task.duration_ms, status=task.state)
+        
+        scheduler.on_task_finished = on_task_finished
+        scheduler.add_all(tasks)
+        
+        boot_start_time = time.time()
+        critical_count = scheduler.run_critical()
+        boot_duration = (time.time() - boot_start_time) * 1000
+        deferred_count = len(scheduler.get_pending())
+        print(f"   ⏱️  부팅 작업 {critical_count}개: {boot_duration:.1f}ms, 지연 작업 {deferred_count}개는 에디터 준비 후 실행")
+        
+        scheduler.start_deferred(
+            on_finished=lambda finished: MaidCatInitializer.report_startup_tasks(finished, profiler))
+    
+    @staticmethod
+    def report_startup_tasks(scheduler, profiler=None):
+        """모든 startup 작업 완료 후 결과 및 성능 요약"""
+        tasks = list(scheduler.tasks.values())
+        succeeded = [task for task in tasks if task.state == "done"]
+        failed = [task for task in tasks if task.state in ("failed", "skipped")]
+        total_duration = sum(task.duration_ms for task in tasks)
+        
+        print("\n📊 startup 작업 완료:")
+        print(scheduler.format_summary())
+        print(f"   📊 실행 결과: ✅ {len(succeeded)}개 성공, ❌ {len(failed)}개 실패")
+        print(f"   ⏱️  총 실행 시간: {total_duration:.1f}ms")
+        
+        # 성능 경고 (100ms 이상 걸리는 작업)
+        slow_tasks = [task for task in tasks if task.duration_ms > 100]
+        if slow_tasks:
+            print(f"   ⚠️  느린 작업 ({len(slow_tasks)}개):")
+            for task in sorted(slow_tasks, key=lambda task: task.duration_ms, reverse=True):
+                print(f"      🐌 {task.name}: {task.duration_ms:.1f}ms")
+        
+        if profiler:
+            MaidCatInitializer.finish_import_profiler(profiler)
+    
+    @staticmethod
+    def start_import_profiler():
+        """import 트리 프로파일러 시작 (사용할 수 없으면 None)"""
+        try:
+            from util.startup_profiler import StartupProfiler
+            profiler = StartupProfiler()
+            profiler.start()
+            return profiler
+        except Exception as e:
+            print(f"   ⚠️  import 프로파일러 시작 실패: {e}")
+            return None
+    
+    @staticmethod
+    def finish_import_profiler(profiler, min_ms: float = 5.0):
+        """프로파일러 종료 → import 트리 출력 → 기록 저장 및 회귀 경고"""
+        try:
+            from util.startup_profiler import get_default_profile_path, format_regressions
+            profiler.stop()
             
-            module_start_time = time.time()
+            print(f"   🌳 import 트리 ({min_ms:.0f}ms 이상):")
+            for line in profiler.format_tree(min_ms=min_ms).splitlines():
+                print(f"      {line}")
             
-            try:
-                # 모듈명에서 .py 제거
-                module_name = f"startup.{file_name[:-3]}"
-                
-                # 모듈 import 및 실행
-                import importlib
-                module = importlib.import_module(module_name)
-                
-                # main 함수가 있으면 실행
-                if hasattr(module, 'main'):
-                    main_start_time = time.time()
-                    module.main()
-                    main_end_time = time.time()
-                    main_duration = (main_end_time - main_start_time) * 1000
-                    
-                    module_end_time = time.time()
-                    total_duration = (module_end_time - module_start_time) * 1000
-                    
-                    print(f"   ✅ {file_name}: main() 실행됨 ({main_duration:.1f}ms, 총 {total_duration:.1f}ms)")
-                    execution_times.append((file_name, total_duration))
-                else:
-                    module_end_time = time.time()
-                    total_duration = (module_end_time - module_start_time) * 1000
-                    
-                    print(f"   💡 {file_name}: import됨 ({total_duration:.1f}ms, main 함수 없음)")
-                    execution_times.append((file_name, total_duration))
-                
-                executed_count += 1
-                
-            except Exception as e:
-                module_end_time = time.time()
-                total_duration = (module_end_time - module_start_time) * 1000
-                
-                print(f"   ❌ {file_name}: 실행 실패 ({total_duration:.1f}ms) - {e}")
-                failed_count += 1
-        
-        total_end_time = time.time()
-        total_execution_time = (total_end_time - total_start_time) * 1000
-        
-        # 실행 결과 및 성능 요약
-        print(f"   📊 실행 결과: ✅ {executed_count}개 성공, ❌ {failed_count}개 실패")
-        print(f"   ⏱️  총 실행 시간: {total_execution_time:.1f}ms")
-        
-        # 성능 경고 (100ms 이상 걸리는 모듈)
-        slow_modules = [(name, duration) for name, duration in execution_times if duration > 100]
-        if slow_modules:
-            print(f"   ⚠️  느린 모듈 ({len(slow_modules)}개):")
-            for name, duration in sorted(slow_modules, key=lambda x: x[1], reverse=True):
-                print(f"      🐌 {name}: {duration:.1f}ms")
-        
-        # 가장 빠른/느린 모듈 표시
-        if execution_times:
-            fastest = min(execution_times, key=lambda x: x[1])
-            slowest = max(execution_times, key=lambda x: x[1])
-            print(f"   🚀 가장 빠름: {fastest[0]} ({fastest[1]:.1f}ms)")
-            print(f"   🐌 가장 느림: {slowest[0]} ({slowest[1]:.1f}ms)")
+            profile_path = get_default_profile_path()
+            regressions = profiler.save_and_compare(profile_path)
+            if regressions:
+                unreal.log_warning(format_regressions(regressions))
+            print(f"   💾 시작 프로파일 저장: {profile_path}")
+        except Exception as e:
+            profiler.stop()
+            print(f"   ⚠️  import 프로파일 저장 실패: {e}")
     
     @staticmethod
     def initialize():
@@ -199,6 +271,10 @@ class MaidCatInitializer:
             # Python 경로 설정 (필수)
             MaidCatInitializer.setup_python_paths()
             
+            # 바이트코드 번들 → 플러그인 모듈 인덱스 순으로 import 처리 (sys.path가 확정된 뒤 설치)
+            MaidCatInitializer.install_bytecode_bundle()
+            MaidCatInitializer.install_module_index()
+            
             # 기본 환경 확인
             MaidCatInitializer.check_basic_environment()
             
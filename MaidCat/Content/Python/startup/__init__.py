@@ -1,49 +1,66 @@
 """
 MaidCat Startup Module
-MaidCat 프로젝트 시작 시 자동 로드되는 모듈들
+MaidCat 프로젝트 시작 시 실행되는 작업 선언
 
-이 패키지의 모든 모듈들은 Unreal Engine 시작 시 자동으로 로드됩니다.
+시작 작업은 get_startup_tasks()에 우선순위/의존성과 함께 선언하고,
+init_unreal.py의 MaidCatInitializer.run_startup_modules()가 util.startup_scheduler로 실행합니다.
+- PRIORITY_CRITICAL: UClass/UStruct 등록처럼 에셋 로딩 전에 필요한 작업 → 부팅 중 실행
+- 그 외: 메뉴/컨텍스트 메뉴 등록 → 에디터가 조작 가능해진 뒤 슬레이트 틱에서 실행
+
+이 폴더에 새 .py 파일을 추가하면 선언하지 않아도 PRIORITY_NORMAL 작업으로 실행됩니다.
+(모듈 import 후 main()이 있으면 호출, MANUAL_MODULES는 제외)
+
+패키지 import만으로는 아무것도 실행하지 않습니다.
 """
 
 import unreal
 
+from util.startup_scheduler import (
+    StartupTask, PRIORITY_CRITICAL, PRIORITY_HIGH, PRIORITY_NORMAL, get_scheduler,
+)
+
+# 자동 실행하지 않는 모듈 (직접 호출하는 설정/래퍼 모듈)
+MANUAL_MODULES = {
+    "setup_python",         # MaidCatInitializer.setup_dev_environment()에서 호출
+    "extend_editor",        # 메뉴 등록을 한 번에 실행하는 래퍼 (개별 작업으로 선언됨)
+    "test_context_menu",    # 테스트 파일
+}
+
+
+def get_startup_tasks():
+    """MaidCat 시작 작업 목록"""
+    return [
+        # Blueprint에서 참조하는 UStruct/UClass → 에셋 로딩 전에 등록되어야 함
+        StartupTask("bp_struct", "startup.bp_struct", priority=PRIORITY_CRITICAL,
+                    description="Blueprint Struct 등록"),
+        StartupTask("bp_func", "startup.bp_func:initialize_maidcat_library", priority=PRIORITY_CRITICAL,
+                    description="Blueprint Function Library 등록"),
+        StartupTask("bp_material_migration",
+                    "startup.bp_material_migration:initialize_material_migration_library",
+                    priority=PRIORITY_CRITICAL, description="Material Migration Library 등록"),
+
+        # 에디터 메뉴 (에디터가 뜬 뒤 실행)
+        StartupTask("python_context_menu", "editor.python_context:register", priority=PRIORITY_HIGH,
+                    description="Python 폴더 컨텍스트 메뉴"),
+        StartupTask("asset_context_menu", "editor.asset_context:register", priority=PRIORITY_NORMAL,
+                    description="애셋 컨텍스트 메뉴"),
+        StartupTask("mi_context_menu", "editor.mi_context:register", priority=PRIORITY_NORMAL,
+                    description="MI 에디터 컨텍스트 메뉴"),
+        StartupTask("asset_editor_menu", "editor.asset_editor:register", priority=PRIORITY_NORMAL,
+                    description="애셋 에디터 툴바/프리셋 메뉴"),
+    ]
+
+
 def initialize_maidcat():
-    """MaidCat 초기화"""
+    """MaidCat 시작 작업을 모두 즉시 실행 (이미 실행된 작업은 건너뜀)"""
     unreal.log("🐱 MaidCat 프로젝트 초기화 시작...")
-    
-    # Blueprint Function Library 초기화
-    try:
-        from . import bp_func
-        if hasattr(bp_func, 'initialize_maidcat_library'):
-            bp_func.initialize_maidcat_library()
-    except ImportError as e:
-        unreal.log_warning(f"bp_func 모듈 로드 실패: {e}")
-    
-    # Material Migration Blueprint Library 초기화
-    try:
-        from . import bp_material_migration
-        if hasattr(bp_material_migration, 'initialize_material_migration_library'):
-            bp_material_migration.initialize_material_migration_library()
-    except ImportError as e:
-        unreal.log_warning(f"bp_material_migration 모듈 로드 실패: {e}")
-    
-    # Blueprint Struct 초기화
-    try:
-        from . import bp_struct
-        unreal.log("✅ bp_struct 모듈 로드됨")
-    except ImportError as e:
-        unreal.log_warning(f"bp_struct 모듈 로드 실패: {e}")
-    
-    # Editor Extensions 초기화
-    try:
-        from . import extend_editor
-        unreal.log("✅ extend_editor 모듈 로드됨")
-    except ImportError as e:
-        unreal.log_warning(f"extend_editor 모듈 로드 실패: {e}")
-    
-    unreal.log("🎉 MaidCat 프로젝트 초기화 완료!")
 
+    scheduler = get_scheduler()
+    scheduler.add_all(get_startup_tasks())
+    scheduler.run_all()
 
-# 자동 초기화
-if __name__ != "__main__":
-    initialize_maidcat()
\ No newline at end of file
+    for task in scheduler.tasks.values():
+        if task.error:
+            unreal.log_warning(f"{task.name} 작업 실패: {task.error}")
+
+    unreal.log("🎉 MaidCat 프로젝트 초기화 완료!")
@@ -1,6 +1,6 @@
 """
 Editor Extension Initialization
-에디터 확장 초기화 모듈 (래퍼)
+에디터 확장 초기화 모듈 (래퍼, 수동으로 한 번에 등록할 때 사용)
 - Python 폴더 메뉴 기능 -> python_context.py
 - 애셋 메뉴 기능 -> asset_context.py
 """
@@ -32,5 +32,6 @@ def initialize():
         unreal.log_error(f"❌ 에디터 확장 시스템 초기화 실패: {e}")
 
 
-# 스크립트 로드 시 자동 실행
-initialize()
+# 시작 시에는 startup.get_startup_tasks()의 메뉴 작업들이 지연 실행하므로 import만으로는 실행하지 않음
+if __name__ == "__main__":
+    initialize()
@@ -0,0 +1,415 @@
+"""
+Console Cat Profile Benchmark 🐱
+두 CVar 프로필(매크로)의 성능을 A/B로 비교하는 하네스
+
+진행 순서:
+    프로필 A 적용 → warmup 프레임 대기 → N 프레임 샘플링
+    → 프로필 B 적용 → warmup 프레임 대기 → N 프레임 샘플링
+    → restore_commands 실행 (snapshot_cvar_commands로 만든 시작 전 CVar 값 복원)
+    → 지표별 평균/분산과 차이(B - A) 계산 → 매크로 JSON 옆 ConsoleCatBenchmarks.jsonl에 기록
+
+기본 샘플러는 프레임 시간과 함께 stat unit의 Game/Draw(Render)/GPU/RHI 스레드 평균을 기록합니다.
+
+에디터에서는 슬레이트 틱마다 tick()이 호출되므로 에디터를 멈추지 않습니다.
+샘플러는 교체할 수 있어 unreal 없이도 (run_blocking + 가짜 샘플러) 동작을 확인할 수 있습니다.
+
+사용법:
+    benchmark = ProfileBenchmark(
+        ("Low", ["sg.ShadowQuality 0"]), ("High", ["sg.ShadowQuality 3"]),
+        executor=lambda commands: data_manager.execute_commands(commands, record=False), frames=120,
+        restore_commands=snapshot_cvar_commands(["sg.ShadowQuality 0", "sg.ShadowQuality 3"]))
+    benchmark.start(on_finished=lambda result: print(format_result(result)))
+"""
+
+import json
+import math
+import statistics
+import time
+from pathlib import Path
+
+
+BENCHMARK_FILE_NAME = "ConsoleCatBenchmarks.jsonl"
+
+DEFAULT_WARMUP_FRAMES = 30
+DEFAULT_SAMPLE_FRAMES = 120
+
+# stat unit에 표시되는 스레드별 시간 (Draw = 렌더 스레드)
+UNIT_STAT_GROUP = "Unit"
+UNIT_STAT_NAMES = ("STAT_UnitFrame", "STAT_UnitGame", "STAT_UnitRender", "STAT_UnitGPU", "STAT_UnitRHIT")
+
+# 진행 단계
+PHASE_IDLE = "idle"
+PHASE_WARMUP_A = "warmup_a"
+PHASE_SAMPLE_A = "sample_a"
+PHASE_WARMUP_B = "warmup_b"
+PHASE_SAMPLE_B = "sample_b"
+PHASE_DONE = "done"
+
+
+# ============================================================================
+# 샘플러
+# ============================================================================
+
+class FrameSampler:
+    """프레임 하나의 지표를 측정하는 샘플러 기본 클래스
+
+    sample()은 {지표 이름: 밀리초} dict를 반환합니다. (측정할 수 없으면 None)
+    """
+
+    def start(self):
+        pass
+
+    def sample(self, delta_seconds):
+        raise NotImplementedError
+
+    def stop(self):
+        pass
+
+
+class SlateFrameSampler(FrameSampler):
+    """에디터 프레임 시간 샘플러 (stat fps에 해당)
+
+    슬레이트 틱 간격으로 frame_ms를 측정하고, stat_names가 있으면
+    AutomationLibrary의 stat 평균값(stat unit 계열)을 함께 기록합니다.
+    """
+
+    def __init__(self, stat_group=None, stat_names=None):
+        self.stat_group = stat_group
+        self.stat_names = list(stat_names or [])
+
+    def start(self):
+        if self.stat_group:
+            import unreal
+            try:
+                unreal.AutomationLibrary.enable_stat_group_with_name(self.stat_group)
+            except Exception as e:
+                unreal.log_warning(f"⚠️ stat 그룹 활성화 실패 ({self.stat_group}): {e}")
+                self.stat_names = []
+
+    def sample(self, delta_seconds):
+        values = {"frame_ms": delta_seconds * 1000.0}
+        if self.stat_names:
+            import unreal
+            for stat_name in self.stat_names:
+                try:
+                    values[stat_name] = unreal.AutomationLibrary.get_stat_inc_average(stat_name)
+                except Exception:
+                    pass
+        return values
+
+    def stop(self):
+        if self.stat_group:
+            import unreal
+            try:
+                unreal.AutomationLibrary.disable_stat_group_with_name(self.stat_group)
+            except Exception:
+                pass
+
+
+def create_stat_unit_sampler():
+    """프레임 시간 + stat unit(Game/Draw/GPU/RHI) 평균을 기록하는 샘플러"""
+    return SlateFrameSampler(stat_group=UNIT_STAT_GROUP, stat_names=UNIT_STAT_NAMES)
+
+
+class CallableSampler(FrameSampler):
+    """함수로 지표를 만드는 샘플러 (테스트/로컬 대체용)
+
+    Args:
+        sample_function: (delta_seconds) → {지표 이름: 값} 함수
+    """
+
+    def __init__(self, sample_function):
+        self.sample_function = sample_function
+
+    def sample(self, delta_seconds):
+        return self.sample_function(delta_seconds)
+
+
+# ============================================================================
+# CVar 스냅샷
+# ============================================================================
+
+def parse_cvar_command(command):
+    """"이름 값" 형식의 CVar 설정 명령어 → (이름, 값), 아니면 None (stat fps 같은 토글 명령어)"""
+    parts = command.split()
+    if len(parts) != 2:
+        return None
+    return parts[0], parts[1]
+
+
+def read_console_variable(name, value_text):
+    """현재 CVar 값을 명령어 값 문자열로 읽기 (설정할 값의 형식으로 타입 판단, 읽을 수 없으면 None)"""
+    import unreal
+    library = unreal.SystemLibrary
+    try:
+        if value_text.lower() in ("true", "false"):
+            return "true" if library.get_console_variable_bool_value(name) else "false"
+        try:
+            int(value_text)
+            return str(library.get_console_variable_int_value(name))
+        except ValueError:
+            float(value_text)
+            return repr(library.get_console_variable_float_value(name))
+    except Exception:
+        return None
+
+
+def snapshot_cvar_commands(commands, reader=read_console_variable):
+    """commands가 바꾸는 CVar의 현재 값을 되돌리는 명령어 목록 (프로필 적용 전에 호출)
+
+    Args:
+        commands: 프로필 A/B 명령어 전체
+        reader: (이름, 설정할 값 문자열) → 현재 값 문자열 또는 None
+    """
+    restore_commands = []
+    seen = set()
+    for command in commands:
+        parsed = parse_cvar_command(command.strip())
+        if parsed is None or parsed[0].lower() in seen:
+            continue
+        name, value_text = parsed
+        seen.add(name.lower())
+        current = reader(name, value_text)
+        if current is not None:
+            restore_commands.append(f"{name} {current}")
+    return restore_commands
+
+
+# ============================================================================
+# 통계
+# ============================================================================
+
+def summarize_samples(samples):
+    """샘플 목록 [{지표: 값}, ...]을 지표별 통계로 요약"""
+    metrics = {}
+    for sample in samples:
+        for name, value in sample.items():
+            metrics.setdefault(name, []).append(float(value))
+
+    summary = {}
+    for name, values in metrics.items():
+        variance = statistics.variance(values) if len(values) > 1 else 0.0
+        ordered = sorted(values)
+        summary[name] = {
+            "count": len(values),
+            "mean": statistics.fmean(values) if hasattr(statistics, "fmean") else statistics.mean(values),
+            "variance": variance,
+            "stdev": math.sqrt(variance),
+            "min": ordered[0],
+            "max": ordered[-1],
+            "p95": ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))],
+        }
+    return summary
+
+
+def compare_summaries(summary_a, summary_b):
+    """두 요약의 지표별 차이 (B - A)
+
+    delta_stderr는 두 평균 차이의 표준 오차 sqrt(varA/nA + varB/nB)입니다.
+    |delta| 가 표준 오차의 2배를 넘으면 significant=True로 표시합니다.
+    """
+    deltas = {}
+    for name in summary_a.keys() & summary_b.keys():
+        a = summary_a[name]
+        b = summary_b[name]
+        delta = b["mean"] - a["mean"]
+        stderr = math.sqrt(a["variance"] / a["count"] + b["variance"] / b["count"])
+        deltas[name] = {
+            "delta": delta,
+            "delta_percent": (delta / a["mean"] * 100.0) if a["mean"] else None,
+            "delta_stderr": stderr,
+            "significant": abs(delta) > 2 * stderr if stderr else delta != 0,
+        }
+    return deltas
+
+
+def format_result(result):
+    """결과를 사람이 읽을 수 있는 문자열로 변환"""
+    lines = [f"📏 {result['profile_a']} → {result['profile_b']} ({result['frames']} 프레임)"]
+    for name in sorted(result["deltas"]):
+        a = result["summary_a"][name]
+        b = result["summary_b"][name]
+        delta = result["deltas"][name]
+        percent = f" ({delta['delta_percent']:+.1f}%)" if delta["delta_percent"] is not None else ""
+        mark = "" if delta["significant"] else " (오차 범위 내)"
+        lines.append(
+            f"  {name}: {a['mean']:.2f}±{a['stdev']:.2f} → {b['mean']:.2f}±{b['stdev']:.2f} "
+            f"= {delta['delta']:+.2f}{percent}{mark}")
+    return "\n".join(lines)
+
+
+def save_benchmark_result(result, directory):
+    """결과를 directory/ConsoleCatBenchmarks.jsonl에 한 줄로 추가 (파일 경로 반환)"""
+    path = Path(directory) / BENCHMARK_FILE_NAME
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(result, ensure_ascii=False))
+        f.write("\n")
+    return path
+
+
+# ============================================================================
+# 하네스
+# ============================================================================
+
+class ProfileBenchmark:
+    """프로필 A/B 벤치마크
+
+    Args:
+        profile_a: (이름, [명령어...])
+        profile_b: (이름, [명령어...])
+        executor: 명령어 목록을 한 번에 실행하는 함수
+                  (ConsoleCatDataManager.execute_commands, 사용 횟수에 반영되지 않도록 record=False)
+        sampler: FrameSampler (None이면 stat unit 샘플러)
+        frames: 프로필별 샘플링 프레임 수
+        warmup_frames: 프로필 적용 후 샘플링 전에 건너뛸 프레임 수 (셰이더/스트리밍 안정화)
+        restore_commands: 완료/중단 후 실행할 명령어 (snapshot_cvar_commands 결과, None이면 프로필 B 상태 유지)
+    """
+
+    def __init__(self, profile_a, profile_b, executor, sampler=None,
+                 frames=DEFAULT_SAMPLE_FRAMES, warmup_frames=DEFAULT_WARMUP_FRAMES,
+                 restore_commands=None):
+        self.profile_a = profile_a
+        self.profile_b = profile_b
+        self.executor = executor
+        self.sampler = sampler or create_stat_unit_sampler()
+        self.frames = max(1, int(frames))
+        self.warmup_frames = max(0, int(warmup_frames))
+        self.restore_commands = restore_commands
+
+        self.phase = PHASE_IDLE
+        self.result = None
+        self._frame_in_phase = 0
+        self._samples = {"a": [], "b": []}
+        self._tick_handle = None
+        self._on_finished = None
+        self._started_at = None
+
+    # ------------------------------------------------------------------------
+    # 진행
+    # ------------------------------------------------------------------------
+
+    @property
+    def progress(self):
+        """진행률 (0.0 ~ 1.0)"""
+        per_profile = self.warmup_frames + self.frames
+        done = {
+            PHASE_IDLE: 0,
+            PHASE_WARMUP_A: self._frame_in_phase,
+            PHASE_SAMPLE_A: self.warmup_frames + self._frame_in_phase,
+            PHASE_WARMUP_B: per_profile + self._frame_in_phase,
+            PHASE_SAMPLE_B: per_profile + self.warmup_frames + self._frame_in_phase,
+            PHASE_DONE: 2 * per_profile,
+        }[self.phase]
+        return done / (2 * per_profile)
+
+    def _enter(self, phase):
+        self.phase = phase
+        self._frame_in_phase = 0
+        if phase == PHASE_WARMUP_A:
+            self.executor(self.profile_a[1])
+        elif phase == PHASE_WARMUP_B:
+            self.executor(self.profile_b[1])
+
+    def begin(self):
+        """프로필 A 적용 후 측정 시작 (틱은 호출하는 쪽에서 공급)"""
+        self._samples = {"a": [], "b": []}
+        self.result = None
+        self._started_at = time.strftime("%Y-%m-%dT%H:%M:%S")
+        self.sampler.start()
+        self._enter(PHASE_WARMUP_A)
+
+    def tick(self, delta_seconds):
+        """프레임 하나 진행 (완료되면 True)"""
+        if self.phase in (PHASE_IDLE, PHASE_DONE):
+            return self.phase == PHASE_DONE
+
+        if self.phase in (PHASE_WARMUP_A, PHASE_WARMUP_B):
+            if self._frame_in_phase >= self.warmup_frames:
+                self._enter(PHASE_SAMPLE_A if self.phase == PHASE_WARMUP_A else PHASE_SAMPLE_B)
+            else:
+                self._frame_in_phase += 1
+                return False
+
+        sample = self.sampler.sample(delta_seconds)
+        if sample:
+            self._samples["a" if self.phase == PHASE_SAMPLE_A else "b"].append(sample)
+        self._frame_in_phase += 1
+
+        if self._frame_in_phase >= self.frames:
+            if self.phase == PHASE_SAMPLE_A:
+                self._enter(PHASE_WARMUP_B)
+            else:
+                self._finish()
+                return True
+        return False
+
+    def _restore(self):
+        if self.restore_commands:
+            self.executor(self.restore_commands)
+
+    def _finish(self):
+        self.sampler.stop()
+        self._restore()
+
+        summary_a = summarize_samples(self._samples["a"])
+        summary_b = summarize_samples(self._samples["b"])
+        self.result = {
+            "started": self._started_at,
+            "profile_a": self.profile_a[0],
+            "profile_b": self.profile_b[0],
+            "commands_a": list(self.profile_a[1]),
+            "commands_b": list(self.profile_b[1]),
+            "frames": self.frames,
+            "warmup_frames": self.warmup_frames,
+            "summary_a": summary_a,
+            "summary_b": summary_b,
+            "deltas": compare_summaries(summary_a, summary_b),
+        }
+        self.phase = PHASE_DONE
+
+    def run_blocking(self, delta_seconds=1.0 / 60.0):
+        """틱을 직접 공급하여 끝까지 실행 (에디터 밖 / 테스트용)"""
+        self.begin()
+        while not self.tick(delta_seconds):
+            pass
+        return self.result
+
+    # ------------------------------------------------------------------------
+    # 에디터 슬레이트 틱 연동
+    # ------------------------------------------------------------------------
+
+    def start(self, on_finished=None):
+        """슬레이트 틱 콜백으로 실행 (완료 시 on_finished(result) 호출)"""
+        import unreal
+
+        self._on_finished = on_finished
+        self.begin()
+        self._tick_handle = unreal.register_slate_post_tick_callback(self._on_slate_tick)
+
+    def cancel(self):
+        """진행 중인 벤치마크 중단"""
+        self._unregister()
+        if self.phase not in (PHASE_IDLE, PHASE_DONE):
+            self.sampler.stop()
+            self._restore()
+        self.phase = PHASE_IDLE
+
+    def _unregister(self):
+        if self._tick_handle is not None:
+            import unreal
+            unreal.unregister_slate_post_tick_callback(self._tick_handle)
+            self._tick_handle = None
+
+    def _on_slate_tick(self, delta_seconds):
+        try:
+            finished = self.tick(delta_seconds)
+        except Exception as e:
+            print(f"❌ 벤치마크 실패: {e}")
+            self.cancel()
+            return
+
+        if finished:
+            self._unregister()
+            if self._on_finished:
+                self._on_finished(self.result)
@@ -0,0 +1,195 @@
+"""
+Console Cat Command Store 🐱
+스코프별 콘솔 명령어 데이터를 하나의 SQLite 파일로 보관하는 저장소
+
+특징:
+- data_generator가 만든 *_commands_kr.json 파일을 수정 시간(mtime) 기준으로 가져옴
+  (바뀐 파일만 다시 파싱, 나머지는 stat만 수행)
+- 시작 시에는 스코프 목록과 개수만 조회하고, 명령어는 탭이 처음 열릴 때 스코프 단위로 읽음
+- 반환하는 명령어 dict는 매번 새로 만들며 'scope' 키를 포함 (원본 JSON은 수정하지 않음)
+
+sqlite3를 사용할 수 없는 환경에서는 SQLITE_AVAILABLE이 False가 되며,
+ConsoleCatDataManager가 스코프별 JSON 파일을 직접 읽습니다.
+"""
+
+import json
+from pathlib import Path
+
+try:
+    import sqlite3
+    SQLITE_AVAILABLE = True
+except ImportError:
+    SQLITE_AVAILABLE = False
+
+
+STORE_FILE_NAME = "console_commands.db"
+SCHEMA_VERSION = 1
+
+# 명령어 dict에서 별도 컬럼으로 저장하는 필드 (나머지는 extra JSON 컬럼)
+COMMAND_FIELDS = ('command', 'command_kr', 'help', 'help_kr')
+
+
+def scope_from_filename(json_file):
+    """JSON 파일명에서 스코프 이름 추출 (r_commands_kr_TEST.json → r)"""
+    return Path(json_file).stem.replace('_commands_kr', '').replace('_TEST', '')
+
+
+def list_json_sources(data_dir):
+    """데이터 폴더의 스코프 JSON 파일 목록 (이름순)"""
+    data_dir = Path(data_dir)
+    if not data_dir.exists():
+        return []
+    return sorted(data_dir.glob("*_commands_kr*.json"))
+
+
+class CommandStore:
+    """SQLite 기반 콘솔 명령어 저장소"""
+
+    def __init__(self, data_dir, file_name=STORE_FILE_NAME):
+        self.data_dir = Path(data_dir)
+        self.path = self.data_dir / file_name
+        self._conn = None
+
+    # ------------------------------------------------------------------------
+    # 연결 / 스키마
+    # ------------------------------------------------------------------------
+
+    def _connect(self):
+        if self._conn is not None:
+            return self._conn
+
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.path))
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            conn.executescript("""
+                DROP TABLE IF EXISTS sources;
+                DROP TABLE IF EXISTS commands;
+            """)
+        conn.executescript(f"""
+            CREATE TABLE IF NOT EXISTS sources (
+                file TEXT PRIMARY KEY,
+                scope TEXT NOT NULL,
+                mtime REAL NOT NULL,
+                size INTEGER NOT NULL,
+                count INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS commands (
+                source TEXT NOT NULL,
+                scope TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                command TEXT NOT NULL,
+                command_kr TEXT,
+                help TEXT,
+                help_kr TEXT,
+                extra TEXT
+            );
+            CREATE INDEX IF NOT EXISTS commands_scope ON commands (scope, source, position);
+            PRAGMA user_version = {SCHEMA_VERSION};
+        """)
+        self._conn = conn
+        return conn
+
+    def close(self):
+        """연결 닫기"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    # ------------------------------------------------------------------------
+    # JSON 동기화
+    # ------------------------------------------------------------------------
+
+    def sync_from_json(self):
+        """데이터 폴더의 JSON 파일과 저장소 동기화 (다시 가져온 파일 수 반환)
+
+        mtime과 크기가 같은 파일은 파싱하지 않습니다. 삭제된 JSON 파일의 명령어는 제거합니다.
+        """
+        conn = self._connect()
+        stored = {row[0]: (row[1], row[2]) for row in conn.execute("SELECT file, mtime, size FROM sources")}
+
+        imported = 0
+        present = set()
+        for json_file in list_json_sources(self.data_dir):
+            stat = json_file.stat()
+            present.add(json_file.name)
+            if stored.get(json_file.name) == (stat.st_mtime, stat.st_size):
+                continue
+
+            try:
+                with open(json_file, 'r', encoding='utf-8') as f:
+                    commands = json.load(f)
+            except Exception as e:
+                print(f"❌ {json_file} 로드 실패: {e}")
+                continue
+
+            self._write_source(json_file.name, scope_from_filename(json_file), commands,
+                               stat.st_mtime, stat.st_size)
+            imported += 1
+
+        for file_name in set(stored) - present:
+            self._delete_source(file_name)
+
+        conn.commit()
+        return imported
+
+    def _delete_source(self, file_name):
+        conn = self._connect()
+        conn.execute("DELETE FROM commands WHERE source = ?", (file_name,))
+        conn.execute("DELETE FROM sources WHERE file = ?", (file_name,))
+
+    def _write_source(self, file_name, scope, commands, mtime, size):
+        self._delete_source(file_name)
+        rows = []
+        for position, cmd in enumerate(commands):
+            extra = {key: value for key, value in cmd.items() if key not in COMMAND_FIELDS and key != 'scope'}
+            rows.append((
+                file_name, scope, position,
+                cmd.get('command', ''), cmd.get('command_kr', ''),
+                cmd.get('help', ''), cmd.get('help_kr', ''),
+                json.dumps(extra, ensure_ascii=False) if extra else None,
+            ))
+        conn = self._connect()
+        conn.executemany("INSERT INTO commands VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        conn.execute("INSERT INTO sources VALUES (?, ?, ?, ?, ?)", (file_name, scope, mtime, size, len(rows)))
+
+    # ------------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------------
+
+    def list_scopes(self):
+        """스코프별 명령어 개수 {scope: count} (명령어 행은 읽지 않음)"""
+        conn = self._connect()
+        return {scope: count for scope, count in
+                conn.execute("SELECT scope, SUM(count) FROM sources GROUP BY scope ORDER BY scope")}
+
+    def _rows_to_commands(self, rows):
+        commands = []
+        for scope, command, command_kr, help_text, help_kr, extra in rows:
+            cmd = {
+                'command': command,
+                'command_kr': command_kr or '',
+                'help': help_text or '',
+                'help_kr': help_kr or '',
+            }
+            if extra:
+                cmd.update(json.loads(extra))
+            cmd['scope'] = scope
+            commands.append(cmd)
+        return commands
+
+    def load_scope(self, scope):
+        """특정 스코프의 명령어 목록"""
+        conn = self._connect()
+        rows = conn.execute(
+            "SELECT scope, command, command_kr, help, help_kr, extra FROM commands "
+            "WHERE scope = ? ORDER BY source, position", (scope,))
+        return self._rows_to_commands(rows)
+
+    def load_all(self):
+        """모든 스코프의 명령어 목록 (파일 이름, 파일 내 순서대로)"""
+        conn = self._connect()
+        rows = conn.execute(
+            "SELECT scope, command, command_kr, help, help_kr, extra FROM commands "
+            "ORDER BY source, position")
+        return self._rows_to_commands(rows)
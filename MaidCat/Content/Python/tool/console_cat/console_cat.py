@@ -35,6 +35,9 @@ import os
 import subprocess
 from pathlib import Path
 import tool.console_cat.data_generator as data_generator
+from tool.console_cat.search_index import CommandSearchIndex
+from tool.console_cat.command_store import CommandStore, SQLITE_AVAILABLE, list_json_sources, scope_from_filename
+from tool.console_cat.benchmark import ProfileBenchmark, format_result, save_benchmark_result, snapshot_cvar_commands
 import importlib
 importlib.reload(data_generator)
 
@@ -46,6 +49,17 @@ importlib.reload(data_generator)
 DATA_DIR = Path(unreal.SystemLibrary.get_project_saved_directory()) / "ConsoleCommandData"
 FAVORITES_FILE = Path(unreal.SystemLibrary.get_project_saved_directory()) / "ConsoleCatFavorites.json"
 SETTINGS_FILE = Path(unreal.SystemLibrary.get_project_saved_directory()) / "ConsoleCatSettings.json"
+MACROS_FILE = Path(unreal.SystemLibrary.get_project_saved_directory()) / "ConsoleCatMacros.json"
+USAGE_FILE = Path(unreal.SystemLibrary.get_project_saved_directory()) / "ConsoleCatUsage.json"
+
+# 매크로 파일이 없을 때 사용하는 기본 매크로 {이름: [명령어...]}
+DEFAULT_MACROS = {
+    "📊 성능 통계": ["stat fps", "stat unit"],
+    "🧹 통계 끄기": ["stat none"],
+}
+
+# 사용 횟수를 이 횟수만큼 기록할 때마다 파일에 저장 (나머지는 창 닫을 때 저장)
+USAGE_SAVE_INTERVAL = 20
 
 
 # ============================================================================
@@ -56,10 +70,19 @@ class ConsoleCatDataManager:
     """Console Cat 데이터 관리"""
     
     def __init__(self):
-        self.commands = {}  # {scope: [commands]}
-        self.all_commands = []
+        self.scope_counts = {}  # {scope: 명령어 수} - 시작 시에는 개수만 조회
+        self.commands = {}  # {scope: [commands]} - 스코프 탭이 처음 열릴 때 채워지는 캐시
+        self._all_commands = None
+        self._json_sources = {}  # sqlite3가 없을 때 사용하는 {scope: [json 파일]}
+        self.store = CommandStore(DATA_DIR) if SQLITE_AVAILABLE else None
+        self.search_index = CommandSearchIndex()
+        self._search_index_ready = False
         self.favorites = []
         self.settings = {}
+        self.macros = {}
+        self.usage_counts = {}  # {command: 실행 횟수} - 검색 순위에 반영
+        self._unsaved_usage = 0
+        self.search_index.set_score_function(lambda cmd: self.usage_counts.get(cmd.get('command', ''), 0))
         self.load_data()
     
     def load_data(self):
@@ -67,42 +90,71 @@ class ConsoleCatDataManager:
         self.load_commands()
         self.load_favorites()
         self.load_settings()
+        self.load_macros()
+        self.load_usage()
     
     def load_commands(self):
-        """명령어 데이터 로드"""
+        """스코프 목록 로드 (명령어는 get_scope_commands / all_commands 접근 시 로드)"""
+        self.scope_counts = {}
+        self.commands = {}
+        self._all_commands = None
+        self._json_sources = {}
+        self._search_index_ready = False
+        
         if not DATA_DIR.exists():
             print(f"⚠️ 데이터 폴더가 없습니다: {DATA_DIR}")
             print("먼저 data_generator.py를 실행하세요!")
             return
         
-        json_files = list(DATA_DIR.glob("*.json"))
-        if not json_files:
+        if self.store:
+            try:
+                # 바뀐 JSON 파일만 다시 가져오고 스코프별 개수만 조회
+                self.store.sync_from_json()
+                self.scope_counts = self.store.list_scopes()
+            except Exception as e:
+                print(f"⚠️ 명령어 저장소를 사용할 수 없어 JSON을 직접 읽습니다: {e}")
+                self.store.close()
+                self.store = None
+        
+        if not self.store:
+            for json_file in list_json_sources(DATA_DIR):
+                self._json_sources.setdefault(scope_from_filename(json_file), []).append(json_file)
+            self.scope_counts = {scope: None for scope in sorted(self._json_sources)}
+        
+        if not self.scope_counts:
             print("⚠️ JSON 데이터 파일이 없습니다.")
             return
         
-        self.commands = {}
-        self.all_commands = []
-        
-        for json_file in json_files:
-            scope = json_file.stem.replace('_commands_kr', '').replace('_TEST', '')
-            
+        print(f"Console Cat: {len(self.scope_counts)}개 스코프 확인 완료")
+    
+    def _read_scope_json(self, scope):
+        """sqlite3가 없을 때 스코프의 JSON 파일을 직접 읽기"""
+        commands = []
+        for json_file in self._json_sources.get(scope, []):
             try:
                 with open(json_file, 'r', encoding='utf-8') as f:
-                    commands_data = json.load(f)
-                
-                # 스코프별 명령어 저장
-                self.commands[scope] = commands_data
-                
-                # 전체 명령어 리스트에 추가
-                for cmd in commands_data:
-                    cmd['scope'] = scope
-                    self.all_commands.append(cmd)
-                
+                    commands.extend(dict(cmd, scope=scope) for cmd in json.load(f))
             except Exception as e:
                 print(f"❌ {json_file} 로드 실패: {e}")
-        
-        if self.all_commands:
-            print(f"Console Cat: {len(self.all_commands)}개 명령어 로드 완료")
+        return commands
+    
+    @property
+    def all_commands(self):
+        """전체 명령어 목록 (처음 접근할 때 한 번에 로드)"""
+        if self._all_commands is None:
+            if self.store:
+                self._all_commands = self.store.load_all()
+            else:
+                self._all_commands = [cmd for scope in self.scope_counts for cmd in self.get_scope_commands(scope)]
+            if self._all_commands:
+                print(f"Console Cat: {len(self._all_commands)}개 명령어 로드 완료")
+        return self._all_commands
+    
+    def command_count(self):
+        """전체 명령어 수 (저장소가 있으면 명령어를 읽지 않고 계산)"""
+        if self._all_commands is None and all(count is not None for count in self.scope_counts.values()):
+            return sum(self.scope_counts.values())
+        return len(self.all_commands)
     
     def load_favorites(self):
         """즐겨찾기 로드"""
@@ -142,70 +194,177 @@ class ConsoleCatDataManager:
         except Exception as e:
             print(f"설정 저장 실패: {e}")
     
-    def execute_command(self, command, args=""):
-        """명령어 실행"""
-        full_command = f"{command} {args}".strip()
-        
-        try:
-            # 언리얼 엔진 콘솔 명령어 실행
+    def load_macros(self):
+        """매크로 로드 (파일이 없으면 기본 매크로)"""
+        if MACROS_FILE.exists():
             try:
-                # 방법 1: EditorSubsystem을 통한 실행 (가장 안전한 방법)
-                editor_subsystem = unreal.get_editor_subsystem(unreal.UnrealEditorSubsystem)
-                if editor_subsystem:
-                    world = editor_subsystem.get_editor_world()
-                    if world:
-                        unreal.SystemLibrary.execute_console_command(world, full_command)
-                        return True
+                with open(MACROS_FILE, 'r', encoding='utf-8') as f:
+                    self.macros = json.load(f)
             except:
-                pass
-            
-            try:
-                # 방법 2: 현재 월드 가져오기
-                world = unreal.EditorLevelLibrary.get_editor_world()
-                if world:
-                    unreal.SystemLibrary.execute_console_command(world, full_command)
-                    return True
-            except:
-                pass
-            
+                self.macros = dict(DEFAULT_MACROS)
+        else:
+            self.macros = dict(DEFAULT_MACROS)
+    
+    def save_macros(self):
+        """매크로 저장"""
+        try:
+            with open(MACROS_FILE, 'w', encoding='utf-8') as f:
+                json.dump(self.macros, f, indent=2, ensure_ascii=False)
+        except Exception as e:
+            print(f"매크로 저장 실패: {e}")
+    
+    def add_macro(self, name, commands):
+        """매크로 추가/교체 (빈 줄은 제외)"""
+        commands = [command.strip() for command in commands if command.strip()]
+        if not name or not commands:
+            return False
+        self.macros[name] = commands
+        self.save_macros()
+        return True
+    
+    def remove_macro(self, name):
+        """매크로 삭제"""
+        if self.macros.pop(name, None) is not None:
+            self.save_macros()
+    
+    def load_usage(self):
+        """명령어 사용 횟수 로드"""
+        if USAGE_FILE.exists():
             try:
-                # 방법 3: 게임 인스턴스를 통한 실행
-                game_instance = unreal.GameplayStatics.get_game_instance(unreal.EditorLevelLibrary.get_editor_world())
-                if game_instance:
-                    world = game_instance.get_world()
-                    if world:
-                        unreal.SystemLibrary.execute_console_command(world, full_command)
-                        return True
+                with open(USAGE_FILE, 'r', encoding='utf-8') as f:
+                    self.usage_counts = json.load(f)
             except:
-                pass
-            
-            # 모든 방법이 실패한 경우
-            return False
-            
+                self.usage_counts = {}
+        else:
+            self.usage_counts = {}
+        self._unsaved_usage = 0
+    
+    def save_usage(self):
+        """명령어 사용 횟수 저장"""
+        try:
+            with open(USAGE_FILE, 'w', encoding='utf-8') as f:
+                json.dump(self.usage_counts, f, ensure_ascii=False)
+            self._unsaved_usage = 0
         except Exception as e:
-            print(f"❌ 명령어 실행 실패: {e}")
-            return False
+            print(f"사용 횟수 저장 실패: {e}")
+    
+    def record_usage(self, command):
+        """명령어 사용 횟수 증가 (검색 결과에서 자주 쓴 명령어가 먼저 표시됨)"""
+        self.usage_counts[command] = self.usage_counts.get(command, 0) + 1
+        self._unsaved_usage += 1
+        if self._unsaved_usage >= USAGE_SAVE_INTERVAL:
+            self.save_usage()
+    
+    # ------------------------------------------------------------------------
+    # 명령어 실행
+    # ------------------------------------------------------------------------
+    
+    def shutdown(self):
+        """사용 횟수 저장 (창을 닫을 때 호출)"""
+        if self._unsaved_usage:
+            self.save_usage()
+    
+    def get_world(self):
+        """콘솔 명령어를 실행할 월드 찾기
+        
+        UWorld를 파이썬에서 계속 참조하면 맵 전환 시 이전 월드가 해제되지 않으므로 캐시하지 않습니다.
+        """
+        try:
+            # 방법 1: EditorSubsystem을 통한 실행 (가장 안전한 방법)
+            editor_subsystem = unreal.get_editor_subsystem(unreal.UnrealEditorSubsystem)
+            if editor_subsystem:
+                world = editor_subsystem.get_editor_world()
+                if world:
+                    return world
+        except:
+            pass
+        
+        try:
+            # 방법 2: 현재 월드 가져오기
+            world = unreal.EditorLevelLibrary.get_editor_world()
+            if world:
+                return world
+        except:
+            pass
+        
+        try:
+            # 방법 3: 게임 인스턴스를 통한 실행
+            game_instance = unreal.GameplayStatics.get_game_instance(unreal.EditorLevelLibrary.get_editor_world())
+            if game_instance:
+                world = game_instance.get_world()
+                if world:
+                    return world
+        except:
+            pass
+        
+        return None
+    
+    def execute_commands(self, commands, record=True):
+        """여러 명령어를 같은 틱에서 한 번에 실행 (월드는 호출마다 한 번만 찾음, 성공한 개수 반환)
+        
+        record=False면 사용 횟수에 반영하지 않음 (벤치마크처럼 사용자가 직접 실행하지 않은 명령어)
+        """
+        world = self.get_world()
+        if world is None:
+            return 0
+        
+        executed = 0
+        for full_command in commands:
+            full_command = full_command.strip()
+            if not full_command:
+                continue
+            try:
+                unreal.SystemLibrary.execute_console_command(world, full_command)
+            except Exception as e:
+                # 앞선 명령어로 맵이 바뀌었을 수 있으므로 월드를 한 번 다시 찾아서 재시도
+                world = self.get_world()
+                if world is None:
+                    print(f"❌ 명령어 실행 실패: {e}")
+                    break
+                try:
+                    unreal.SystemLibrary.execute_console_command(world, full_command)
+                except Exception as e:
+                    print(f"❌ 명령어 실행 실패 ({full_command}): {e}")
+                    continue
+            if record:
+                self.record_usage(full_command.split()[0])
+            executed += 1
+        return executed
+    
+    def execute_command(self, command, args=""):
+        """명령어 실행"""
+        full_command = f"{command} {args}".strip()
+        return self.execute_commands([full_command]) == 1
     
-    def search_commands(self, query):
-        """명령어 검색"""
+    def execute_macro(self, name):
+        """매크로의 명령어를 한 번에 실행 (성공한 개수, 전체 개수 반환)"""
+        commands = self.macros.get(name, [])
+        return self.execute_commands(commands), len(commands)
+    
+    def search_commands(self, query, limit=None):
+        """명령어 검색 (접두사 > 토큰 > 부분 문자열 순으로 정렬)"""
         if not query:
             return self.all_commands
         
-        query_lower = query.lower()
-        results = []
-        
-        for cmd in self.all_commands:
-            if (query_lower in cmd.get('command', '').lower() or
-                query_lower in cmd.get('command_kr', '').lower() or
-                query_lower in cmd.get('help_kr', '').lower() or
-                query_lower in cmd.get('help', '').lower()):
-                results.append(cmd)
+        # 검색 색인은 첫 검색 시 한 번만 구축
+        if not self._search_index_ready:
+            self.search_index.build(self.all_commands)
+            self._search_index_ready = True
         
-        return results
+        return self.search_index.search(query, limit=limit)
     
     def get_scope_commands(self, scope):
-        """특정 스코프의 명령어 반환"""
-        return self.commands.get(scope, [])
+        """특정 스코프의 명령어 반환 (처음 요청될 때 해당 스코프만 로드)"""
+        if scope not in self.commands:
+            if scope not in self.scope_counts:
+                return []
+            if self._all_commands is not None:
+                self.commands[scope] = [cmd for cmd in self._all_commands if cmd.get('scope') == scope]
+            elif self.store:
+                self.commands[scope] = self.store.load_scope(scope)
+            else:
+                self.commands[scope] = self._read_scope_json(scope)
+        return self.commands[scope]
 
 
 # ============================================================================
@@ -214,6 +373,192 @@ class ConsoleCatDataManager:
 
 if PYSIDE_AVAILABLE:
     
+    # ------------------------------------------------------------------------
+    # 명령어 목록 Model / View
+    # ------------------------------------------------------------------------
+    
+    COMMAND_ROLE = QtCore.Qt.ItemDataRole.UserRole + 1     # 명령어 dict
+    SCOPE_ROLE = QtCore.Qt.ItemDataRole.UserRole + 2       # 스코프 문자열
+    FAVORITE_ROLE = QtCore.Qt.ItemDataRole.UserRole + 3    # 즐겨찾기 여부
+    
+    class CommandListModel(QtCore.QAbstractListModel):
+        """명령어 목록 Model (행마다 위젯을 만들지 않고 데이터만 제공)"""
+        
+        def __init__(self, commands=None, favorites=None, display_korean=True, parent=None):
+            super().__init__(parent)
+            self._commands = []
+            self._rows = {}  # command → row
+            self._favorites = favorites if favorites is not None else []
+            self._display_korean = display_korean
+            self.set_commands(commands or [])
+        
+        def rowCount(self, parent=QtCore.QModelIndex()):
+            if parent.isValid():
+                return 0
+            return len(self._commands)
+        
+        def data(self, index, role=QtCore.Qt.ItemDataRole.DisplayRole):
+            if not index.isValid():
+                return None
+            cmd = self._commands[index.row()]
+            command = cmd.get('command', '')
+            
+            if role == QtCore.Qt.ItemDataRole.DisplayRole:
+                command_kr = cmd.get('command_kr', '')
+                return command_kr if self._display_korean and command_kr else command
+            if role == QtCore.Qt.ItemDataRole.ToolTipRole:
+                return f"🔧 명령어: {command}\n📂 카테고리: {cmd.get('scope', '')}\n📖 설명: {cmd.get('help_kr', '')}"
+            if role == COMMAND_ROLE:
+                return cmd
+            if role == SCOPE_ROLE:
+                return cmd.get('scope', '')
+            if role == FAVORITE_ROLE:
+                return command in self._favorites
+            return None
+        
+        def set_commands(self, commands):
+            """명령어 목록 교체"""
+            self.beginResetModel()
+            self._commands = list(commands)
+            self._rows = {cmd.get('command', ''): row for row, cmd in enumerate(self._commands)}
+            self.endResetModel()
+        
+        def set_favorites(self, favorites):
+            """즐겨찾기 목록 참조 교체"""
+            self._favorites = favorites
+            self._emit_all_changed([FAVORITE_ROLE])
+        
+        def set_display_korean(self, display_korean):
+            """표시 언어 변경"""
+            if self._display_korean == display_korean:
+                return
+            self._display_korean = display_korean
+            self._emit_all_changed([QtCore.Qt.ItemDataRole.DisplayRole])
+        
+        def command_changed(self, command):
+            """특정 명령어 행만 다시 그리도록 알림 (즐겨찾기 토글 등)"""
+            row = self._rows.get(command)
+            if row is not None:
+                index = self.index(row, 0)
+                self.dataChanged.emit(index, index, [FAVORITE_ROLE])
+        
+        def _emit_all_changed(self, roles):
+            if self._commands:
+                self.dataChanged.emit(self.index(0, 0), self.index(len(self._commands) - 1, 0), roles)
+    
+    
+    class CommandFilterProxyModel(QtCore.QSortFilterProxyModel):
+        """즐겨찾기 / 검색 필터 Proxy
+
+        검색 결과는 명령어 → 순위 딕셔너리로 받아 필터와 정렬에 함께 사용합니다.
+        """
+        
+        def __init__(self, favorites=None, parent=None):
+            super().__init__(parent)
+            self._favorites = favorites if favorites is not None else []
+            self._favorites_only = False
+            self._search_order = None  # None이면 검색 필터 없음
+        
+        def set_favorites(self, favorites):
+            self._favorites = favorites
+            if self._favorites_only:
+                self.invalidateFilter()
+        
+        def set_filters(self, favorites_only, search_order):
+            """필터 상태 적용 (바뀐 경우에만 다시 필터링)"""
+            if favorites_only == self._favorites_only and search_order is self._search_order:
+                return
+            self._favorites_only = favorites_only
+            self._search_order = search_order
+            self.invalidate()
+            # 검색 중에는 검색 순위대로, 아니면 원본 순서대로
+            self.sort(0 if search_order is not None else -1)
+        
+        def favorites_changed(self):
+            """즐겨찾기 변경 알림 (즐겨찾기만 보기 상태일 때만 다시 필터링)"""
+            if self._favorites_only:
+                self.invalidateFilter()
+        
+        def filterAcceptsRow(self, source_row, source_parent):
+            if not self._favorites_only and self._search_order is None:
+                return True
+            index = self.sourceModel().index(source_row, 0, source_parent)
+            command = index.data(COMMAND_ROLE).get('command', '')
+            if self._favorites_only and command not in self._favorites:
+                return False
+            if self._search_order is not None and command not in self._search_order:
+                return False
+            return True
+        
+        def lessThan(self, left, right):
+            if self._search_order is None:
+                return left.row() < right.row()
+            left_rank = self._search_order.get(left.data(COMMAND_ROLE).get('command', ''), 0)
+            right_rank = self._search_order.get(right.data(COMMAND_ROLE).get('command', ''), 0)
+            return left_rank < right_rank
+    
+    
+    class CommandItemDelegate(QtWidgets.QStyledItemDelegate):
+        """명령어 행 Delegate (라벨, 스코프, 즐겨찾기 별을 직접 그림)"""
+        
+        ROW_HEIGHT = 28
+        STAR_WIDTH = 32
+        SCOPE_WIDTH = 70
+        
+        def star_rect(self, rect):
+            """행 영역에서 즐겨찾기 별 영역"""
+            return QtCore.QRect(rect.right() - self.STAR_WIDTH + 1, rect.top(), self.STAR_WIDTH, rect.height())
+        
+        def sizeHint(self, option, index):
+            return QtCore.QSize(100, self.ROW_HEIGHT)
+        
+        def paint(self, painter, option, index):
+            painter.save()
+            
+            rect = option.rect.adjusted(0, 1, 0, -1)
+            is_favorite = bool(index.data(FAVORITE_ROLE))
+            is_selected = bool(option.state & QtWidgets.QStyle.StateFlag.State_Selected)
+            is_hover = bool(option.state & QtWidgets.QStyle.StateFlag.State_MouseOver)
+            
+            # 배경 (즐겨찾기는 주황색, 기존 버튼 스타일과 동일)
+            if is_favorite:
+                background = "#FFA500" if is_hover or is_selected else "#FFB347"
+                text_color = "#000000"
+            else:
+                background = "#505050" if is_hover or is_selected else "#404040"
+                text_color = "#FFFFFF"
+            painter.fillRect(rect, QtGui.QColor(background))
+            if is_selected:
+                painter.setPen(QtGui.QColor("#6A9BD1"))
+                painter.drawRect(rect.adjusted(0, 0, -1, -1))
+            
+            # 라벨
+            label_rect = rect.adjusted(8, 0, -(self.STAR_WIDTH + self.SCOPE_WIDTH), 0)
+            font = QtGui.QFont(option.font)
+            font.setBold(is_favorite)
+            painter.setFont(font)
+            painter.setPen(QtGui.QColor(text_color))
+            label = option.fontMetrics.elidedText(
+                index.data(QtCore.Qt.ItemDataRole.DisplayRole) or "",
+                QtCore.Qt.TextElideMode.ElideRight, label_rect.width())
+            painter.drawText(label_rect, QtCore.Qt.AlignmentFlag.AlignVCenter | QtCore.Qt.AlignmentFlag.AlignLeft, label)
+            
+            # 스코프
+            scope_rect = QtCore.QRect(rect.right() - self.STAR_WIDTH - self.SCOPE_WIDTH, rect.top(),
+                                      self.SCOPE_WIDTH - 4, rect.height())
+            font.setBold(False)
+            painter.setFont(font)
+            painter.setPen(QtGui.QColor("#333333" if is_favorite else "#999999"))
+            painter.drawText(scope_rect, QtCore.Qt.AlignmentFlag.AlignVCenter | QtCore.Qt.AlignmentFlag.AlignRight,
+                             index.data(SCOPE_ROLE) or "")
+            
+            # 즐겨찾기 별
+            painter.setPen(QtGui.QColor(text_color if is_favorite else "#CCCCCC"))
+            painter.drawText(self.star_rect(rect), QtCore.Qt.AlignmentFlag.AlignCenter, "⭐" if is_favorite else "☆")
+            
+            painter.restore()
+    
+    
     class ConsoleCatMainWindow(QtWidgets.QMainWindow):
         """Console Cat 메인 윈도우"""
         
@@ -222,6 +567,9 @@ if PYSIDE_AVAILABLE:
             
             self.data_manager = ConsoleCatDataManager()
             self.current_command = None
+            self._benchmark = None      # 진행 중인 프로필 A/B 벤치마크
+            self._tab_views = []        # 탭 순서대로 QListView
+            self._search_order = None   # 검색 결과 {command: 순위}, 검색어 없으면 None
             self.init_ui()
             self.setup_styles()
         
@@ -260,7 +608,7 @@ if PYSIDE_AVAILABLE:
             main_layout.addWidget(splitter)
             
             # 상태바
-            self.statusBar().showMessage(f"🐱 {len(self.data_manager.all_commands)}개 명령어 준비됨")
+            self.statusBar().showMessage(f"🐱 {self.data_manager.command_count()}개 명령어 준비됨")
             
             # 언리얼 슬레이트에 부모 지정 (qt_simple_example.py 방식)
             self.setup_unreal_parenting()
@@ -276,48 +624,6 @@ if PYSIDE_AVAILABLE:
                 # 실패해도 계속 실행
                 pass
         
-        def refresh_button_styles(self):
-            """버튼 스타일 새로고침 (현재 탭만)"""
-            current_widget = self.category_tabs.currentWidget()
-            if current_widget:
-                # 현재 탭의 모든 버튼 찾기
-                buttons = current_widget.findChildren(QtWidgets.QPushButton)
-                for btn in buttons:
-                    # 메인 명령어 버튼인지 확인 (크기로 판단)
-                    if btn.size().width() > 100:  # 메인 버튼
-                        command = btn.text()
-                        # 즐겨찾기 상태에 따라 스타일 적용
-                        self.apply_button_style(btn, command)
-        
-        def apply_button_style(self, btn, command):
-            """버튼에 스타일 적용"""
-            if command in self.data_manager.favorites:
-                btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #FFB347;
-                        border: 1px solid #FF8C00;
-                        color: #000000;
-                        font-weight: bold;
-                        border-radius: 3px;
-                        padding: 4px 8px;
-                        font-size: 9pt;
-                        min-height: 20px;
-                        text-align: left;
-                    }
-                    QPushButton:hover {
-                        background-color: #FFA500;
-                        border-color: #FF7F00;
-                        color: #000000;
-                    }
-                    QPushButton:pressed {
-                        background-color: #FF8C00;
-                        border-color: #FF6347;
-                    }
-                """)
-            else:
-                # 기본 스타일로 복원 (상속된 스타일 사용)
-                btn.setStyleSheet("")
-        
         def create_left_panel(self):
             """왼쪽 패널 생성 (카테고리 + 명령어 버튼)"""
             widget = QtWidgets.QWidget()
@@ -358,16 +664,7 @@ if PYSIDE_AVAILABLE:
             
             # 카테고리 탭 (즐겨찾기 탭 제거)
             self.category_tabs = QtWidgets.QTabWidget()
-            
-            # 전체 탭
-            all_tab = self.create_commands_tab(self.data_manager.all_commands, "all")
-            self.category_tabs.addTab(all_tab, "� 전체")
-            
-            # 스코프별 탭
-            for scope in sorted(self.data_manager.commands.keys()):
-                commands = self.data_manager.commands[scope]
-                tab = self.create_commands_tab(commands, scope)
-                self.category_tabs.addTab(tab, f"📂 {scope}")
+            self.create_all_tabs()
             
             # 탭 변경 시 이벤트
             self.category_tabs.currentChanged.connect(self.on_tab_changed)
@@ -376,275 +673,69 @@ if PYSIDE_AVAILABLE:
             
             return widget
         
-        def create_commands_tab(self, commands, scope="all"):
-            """명령어 탭 생성"""
-            widget = QtWidgets.QWidget()
-            layout = QtWidgets.QVBoxLayout(widget)
-            
-            # 스크롤 영역
-            scroll = QtWidgets.QScrollArea()
-            scroll.setWidgetResizable(True)
-            scroll.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-            scroll.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-            
-            # 버튼 컨테이너 (1열 레이아웃)
-            button_widget = QtWidgets.QWidget()
-            button_layout = QtWidgets.QVBoxLayout(button_widget)
-            button_layout.setSpacing(1)
+        def create_all_tabs(self):
+            """전체 탭 + 스코프별 탭 생성"""
+            self._tab_views = []
             
-            # scope 정보를 프로퍼티로 저장
-            button_widget.setProperty("scope", scope)
+            # 탭은 빈 모델로 만들고, 명령어는 탭이 처음 보일 때 load_tab_commands()에서 채움
+            all_tab = self.create_commands_tab("all")
+            self.category_tabs.addTab(all_tab, "📋 전체")
             
-            # 명령어 버튼들 생성 (1열)
-            self.update_tab_commands(button_layout, commands)
-            
-            scroll.setWidget(button_widget)
-            layout.addWidget(scroll)
+            # 스코프별 탭
+            for scope in sorted(self.data_manager.scope_counts.keys()):
+                tab = self.create_commands_tab(scope)
+                self.category_tabs.addTab(tab, f"📂 {scope}")
             
-            return widget
-        
-        def is_widget_valid(self, widget):
-            """Qt 위젯이 유효한지 검사"""
-            if widget is None:
-                return False
-            try:
-                # C++ 객체에 접근해서 유효성 검사
-                widget.objectName()
-                return True
-            except RuntimeError:
-                # C++ 객체가 이미 삭제됨
-                return False
-        
-        def replace_tab_content(self, scroll_area, commands):
-            """탭 내용을 완전히 새로 생성해서 교체 (안전한 방식)"""
-            try:
-                # 즐겨찾기 필터 적용
-                if hasattr(self, 'favorites_filter') and self.favorites_filter.isChecked():
-                    filtered_commands = [cmd for cmd in commands if cmd.get('command') in self.data_manager.favorites]
-                    commands = filtered_commands
-                
-                # 새로운 버튼 위젯 생성
-                new_button_widget = QtWidgets.QWidget()
-                new_button_layout = QtWidgets.QVBoxLayout(new_button_widget)
-                new_button_layout.setSpacing(1)
-                
-                # 명령어 버튼들 생성
-                for cmd in commands:
-                    try:
-                        btn_layout = self.create_command_button_with_favorite(cmd)
-                        new_button_layout.addLayout(btn_layout)
-                    except Exception as e:
-                        print(f"   ⚠️ 버튼 생성 실패: {cmd.get('command', 'Unknown')} - {e}")
-                        continue
-                
-                # 빈 공간 채우기
-                new_button_layout.addStretch()
-                
-                # 기존 위젯을 안전하게 교체
-                try:
-                    old_widget = scroll_area.widget()
-                    scroll_area.setWidget(new_button_widget)
-                    
-                    # 기존 위젯이 유효한 경우에만 정리
-                    if self.is_widget_valid(old_widget):
-                        try:
-                            old_widget.setParent(None)
-                            old_widget.deleteLater()
-                        except RuntimeError:
-                            # 삭제 중 오류 발생 시 무시
-                            pass
-                except Exception as e:
-                    # 위젯 교체 중 오류 발생 시 무시하고 진행
-                    pass
-                
-            except Exception as e:
-                print(f"   ❌ 탭 내용 교체 실패: {e}")
-                import traceback
-                traceback.print_exc()
-        
-        def update_tab_commands(self, layout, commands):
-            """탭의 명령어 버튼들 업데이트"""
-            try:
-                # 기존 모든 아이템 제거 (위젯, 레이아웃, 스트레치 포함)
-                self.clear_layout_completely(layout)
-                
-                # 즐겨찾기 필터 적용
-                if hasattr(self, 'favorites_filter') and self.favorites_filter.isChecked():
-                    filtered_commands = [cmd for cmd in commands if cmd.get('command') in self.data_manager.favorites]
-                    commands = filtered_commands
-                
-                # 명령어 버튼들 생성
-                for cmd in commands:
-                    try:
-                        btn_layout = self.create_command_button_with_favorite(cmd)
-                        layout.addLayout(btn_layout)
-                    except Exception as e:
-                        # 버튼 생성 실패 시 건너뛰기
-                        continue
-                
-                # 빈 공간 채우기
-                layout.addStretch()
-                
-                # 즉시 업데이트 적용
-                layout.update()
-                
-            except Exception as e:
-                # 탭 명령어 업데이트 실패 시 무시
-                pass
-                import traceback
-                traceback.print_exc()
+            # 마지막으로 보던 탭 복원 (전체 탭이 아니면 해당 스코프만 로드됨)
+            last_tab = self.data_manager.settings.get("last_tab")
+            for index, view in enumerate(self._tab_views):
+                if view.property("scope") == last_tab:
+                    self.category_tabs.setCurrentIndex(index)
+                    break
         
-        def clear_layout_completely(self, layout):
-            """레이아웃 완전히 정리 (스트레치 포함)"""
-            try:
-                # 안전한 방식으로 모든 아이템 제거
-                while layout.count():
-                    item = layout.takeAt(0)
-                    if item is None:
-                        break
-                    
-                    try:
-                        # 위젯인 경우
-                        widget = item.widget()
-                        if widget is not None:
-                            widget.setParent(None)
-                            widget.deleteLater()
-                            continue
-                        
-                        # 중첩 레이아웃인 경우
-                        child_layout = item.layout()
-                        if child_layout is not None:
-                            self.clear_layout_completely(child_layout)
-                            child_layout.setParent(None)
-                            child_layout.deleteLater()
-                            continue
-                        
-                        # 스페이서인 경우
-                        spacer = item.spacerItem()
-                        if spacer is not None:
-                            # 스페이서는 takeAt에서 이미 제거됨
-                            del spacer
-                            continue
-                            
-                    except (RuntimeError, AttributeError) as e:
-                        # C++ 객체가 이미 삭제된 경우 등 무시
-                        continue
-                        
-            except Exception as e:
-                # 레이아웃 정리 중 오류 발생 시 간단한 방식으로 폴백
-                self.simple_clear_layout(layout)
+        def create_commands_tab(self, scope="all"):
+            """명령어 탭 생성 (QListView가 보이는 행만 그리므로 명령어 수와 무관하게 가벼움)"""
+            model = CommandListModel([], self.data_manager.favorites, getattr(self, 'display_korean', True))
+            proxy = CommandFilterProxyModel(self.data_manager.favorites)
+            proxy.setSourceModel(model)
+            
+            view = QtWidgets.QListView()
+            view.setModel(proxy)
+            view.setItemDelegate(CommandItemDelegate(view))
+            view.setUniformItemSizes(True)
+            view.setMouseTracking(True)
+            view.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.SingleSelection)
+            view.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
+            view.setVerticalScrollMode(QtWidgets.QAbstractItemView.ScrollMode.ScrollPerPixel)
+            view.setProperty("scope", scope)
+            view.clicked.connect(lambda index, v=view: self.on_command_index_clicked(v, index))
+            
+            view.command_model = model
+            view.proxy_model = proxy
+            view.commands_loaded = False
+            self._tab_views.append(view)
+            
+            return view
         
-        def simple_clear_layout(self, layout):
-            """간단한 레이아웃 정리 (폴백)"""
-            try:
-                # 가장 간단한 방식
-                for i in reversed(range(layout.count())):
-                    try:
-                        item = layout.itemAt(i)
-                        if item and item.widget():
-                            item.widget().deleteLater()
-                        layout.removeItem(item)
-                    except:
-                        pass
-            except:
-                pass
+        def current_view(self):
+            """현재 탭의 QListView"""
+            index = self.category_tabs.currentIndex()
+            if 0 <= index < len(self._tab_views):
+                return self._tab_views[index]
+            return None
         
-        def create_command_button_with_favorite(self, cmd):
-            """명령어 버튼 + 즐겨찾기 버튼 생성"""
-            command = cmd.get('command', '')
-            command_kr = cmd.get('command_kr', '')
-            help_kr = cmd.get('help_kr', '')
-            scope = cmd.get('scope', '')
-            
-            # 수평 레이아웃
-            btn_layout = QtWidgets.QHBoxLayout()
-            btn_layout.setSpacing(1)  # 버튼 간 간격 줄임
-            btn_layout.setContentsMargins(0, 0, 0, 0)
-            
-            # 메인 명령어 버튼 (원래대로 QPushButton 사용)
-            main_btn = QtWidgets.QPushButton()
-            main_btn.setFixedHeight(28)
-            main_btn.setMinimumWidth(100)
-            
-            # 한글/영어 토글 상태에 따른 텍스트 설정
-            display_korean = getattr(self, 'display_korean', True)  # 기본값은 한국어
-            if display_korean and command_kr:
-                main_btn.setText(command_kr)
-            else:
-                main_btn.setText(command)
-            
-            # 툴팁에 상세 정보
-            tooltip = f"🔧 명령어: {command}\n📂 카테고리: {scope}\n📖 설명: {help_kr}"
-            main_btn.setToolTip(tooltip)
-            
-            # 클릭 이벤트
-            main_btn.clicked.connect(lambda checked, c=cmd: self.on_command_button_clicked(c))
-            main_btn.setProperty("command", command)  # 버튼에 command 저장
-            
-            # 즐겨찾기 버튼
-            fav_btn = QtWidgets.QPushButton()
-            fav_btn.setFixedSize(32, 28)
-            fav_btn.setToolTip("즐겨찾기 추가/제거")
+        def on_command_index_clicked(self, view, index):
+            """명령어 행 클릭 (별 영역이면 즐겨찾기 토글)"""
+            cmd = index.data(COMMAND_ROLE)
+            if not cmd:
+                return
             
-            # 즐겨찾기 상태에 따른 아이콘 설정
-            is_favorite = command in self.data_manager.favorites
-            fav_btn.setText("⭐" if is_favorite else "☆")
+            cursor_pos = view.viewport().mapFromGlobal(QtGui.QCursor.pos())
+            if view.itemDelegate().star_rect(view.visualRect(index)).contains(cursor_pos):
+                self.toggle_favorite(cmd.get('command', ''))
+                return
             
-            # 즐겨찾기 버튼 스타일
-            if is_favorite:
-                fav_btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #FFB347;
-                        border: 1px solid #FF8C00;
-                        color: #000000;
-                        font-weight: bold;
-                        border-radius: 3px;
-                        padding: 2px;
-                        font-size: 14pt;
-                        text-align: center;
-                    }
-                    QPushButton:hover {
-                        background-color: #FFA500;
-                        border-color: #FF7F00;
-                    }
-                    QPushButton:pressed {
-                        background-color: #FF8C00;
-                        border-color: #FF6347;
-                    }
-                """)
-            else:
-                fav_btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #4A4A4A;
-                        border: 1px solid #666666;
-                        color: #CCCCCC;
-                        border-radius: 3px;
-                        padding: 2px;
-                        font-size: 14pt;
-                        text-align: center;
-                    }
-                    QPushButton:hover {
-                        background-color: #5A5A5A;
-                        border-color: #777777;
-                        color: #FFFFFF;
-                    }
-                    QPushButton:pressed {
-                        background-color: #3A3A3A;
-                        border-color: #555555;
-                    }
-                """)
-            
-            # 즐겨찾기 토글 이벤트
-            fav_btn.clicked.connect(lambda checked, c=command: self.toggle_favorite(c))
-            
-            # 레이아웃에 추가
-            btn_layout.addWidget(main_btn)
-            btn_layout.addWidget(fav_btn)
-            
-            # 즐겨찾기 상태에 따른 스타일 적용
-            self.apply_button_style(main_btn, command)
-            
-            return btn_layout
+            self.on_command_button_clicked(cmd)
         
         def create_right_panel(self):
             """오른쪽 패널 생성 (상세 정보)"""
@@ -707,6 +798,10 @@ if PYSIDE_AVAILABLE:
             preset_group = self.create_preset_group()
             layout.addWidget(preset_group)
             
+            # 매크로 그룹
+            macro_group = self.create_macro_group()
+            layout.addWidget(macro_group)
+            
             # 약간의 여백만 추가 (빈 공간 최소화)
             layout.addStretch(1)
             
@@ -781,6 +876,124 @@ if PYSIDE_AVAILABLE:
             
             return group
         
+        def create_macro_group(self):
+            """매크로 그룹 생성 (여러 명령어를 한 번에 실행)"""
+            group = QtWidgets.QGroupBox("🎞️ 매크로")
+            layout = QtWidgets.QVBoxLayout(group)
+            layout.setSpacing(3)
+            layout.setContentsMargins(8, 8, 8, 8)
+            
+            self.macro_buttons_layout = QtWidgets.QGridLayout()
+            self.macro_buttons_layout.setSpacing(3)
+            layout.addLayout(self.macro_buttons_layout)
+            
+            add_btn = QtWidgets.QPushButton("➕ 매크로 추가")
+            add_btn.setToolTip("여러 명령어를 이름을 붙여 한 번에 실행할 수 있도록 저장합니다")
+            add_btn.clicked.connect(self.on_add_macro_clicked)
+            layout.addWidget(add_btn)
+            
+            benchmark_btn = QtWidgets.QPushButton("📏 A/B 벤치마크")
+            benchmark_btn.setToolTip("두 매크로(CVar 프로필)를 차례로 적용하여 프레임 시간과 stat unit을 비교합니다")
+            benchmark_btn.clicked.connect(self.on_benchmark_clicked)
+            layout.addWidget(benchmark_btn)
+            
+            self.refresh_macro_buttons()
+            return group
+        
+        def refresh_macro_buttons(self):
+            """매크로 버튼 다시 만들기"""
+            while self.macro_buttons_layout.count():
+                item = self.macro_buttons_layout.takeAt(0)
+                if item.widget():
+                    item.widget().deleteLater()
+            
+            for i, (name, commands) in enumerate(self.data_manager.macros.items()):
+                btn = QtWidgets.QPushButton(name)
+                btn.setToolTip("\n".join(commands) + "\n\n(우클릭: 삭제)")
+                btn.clicked.connect(lambda checked, n=name: self.execute_macro(n))
+                btn.setContextMenuPolicy(QtCore.Qt.ContextMenuPolicy.CustomContextMenu)
+                btn.customContextMenuRequested.connect(lambda pos, n=name, b=btn: self.show_macro_menu(n, b, pos))
+                self.macro_buttons_layout.addWidget(btn, i // 2, i % 2)
+        
+        def execute_macro(self, name):
+            """매크로 실행"""
+            executed, total = self.data_manager.execute_macro(name)
+            if total and executed == total:
+                self.statusBar().showMessage(f"✅ 매크로 실행됨: {name} ({executed}개 명령어)", 3000)
+            else:
+                self.statusBar().showMessage(f"❌ 매크로 실행 실패: {name} ({executed}/{total})", 3000)
+        
+        def on_add_macro_clicked(self):
+            """매크로 추가 (이름과 명령어 목록 입력)"""
+            name, ok = QtWidgets.QInputDialog.getText(self, "매크로 추가", "매크로 이름:")
+            if not ok or not name.strip():
+                return
+            
+            initial = self.current_command.get('command', '') if self.current_command else ""
+            text, ok = QtWidgets.QInputDialog.getMultiLineText(
+                self, "매크로 추가", "실행할 명령어 (한 줄에 하나):", initial)
+            if not ok:
+                return
+            
+            if self.data_manager.add_macro(name.strip(), text.splitlines()):
+                self.refresh_macro_buttons()
+                self.statusBar().showMessage(f"✅ 매크로 저장됨: {name.strip()}", 3000)
+            else:
+                self.statusBar().showMessage("⚠️ 명령어가 없어 매크로를 저장하지 않았습니다", 3000)
+        
+        def show_macro_menu(self, name, button, pos):
+            """매크로 버튼 우클릭 메뉴"""
+            menu = QtWidgets.QMenu(self)
+            remove_action = menu.addAction("🗑️ 삭제")
+            if menu.exec(button.mapToGlobal(pos)) == remove_action:
+                self.data_manager.remove_macro(name)
+                self.refresh_macro_buttons()
+        
+        def on_benchmark_clicked(self):
+            """두 매크로를 프로필 A/B로 선택하여 벤치마크 실행"""
+            if self._benchmark is not None:
+                self._benchmark.cancel()
+                self._benchmark = None
+                self.statusBar().showMessage("⏹️ 벤치마크 중단", 3000)
+                return
+            
+            names = list(self.data_manager.macros.keys())
+            if len(names) < 2:
+                self.statusBar().showMessage("⚠️ 비교하려면 매크로가 2개 이상 필요합니다", 3000)
+                return
+            
+            name_a, ok = QtWidgets.QInputDialog.getItem(self, "A/B 벤치마크", "프로필 A:", names, 0, False)
+            if not ok:
+                return
+            name_b, ok = QtWidgets.QInputDialog.getItem(self, "A/B 벤치마크", "프로필 B:", names, 1, False)
+            if not ok:
+                return
+            frames, ok = QtWidgets.QInputDialog.getInt(self, "A/B 벤치마크", "프로필별 샘플 프레임 수:", 120, 10, 10000)
+            if not ok:
+                return
+            
+            commands_a = self.data_manager.macros[name_a]
+            commands_b = self.data_manager.macros[name_b]
+            self._benchmark = ProfileBenchmark(
+                (name_a, commands_a),
+                (name_b, commands_b),
+                executor=lambda commands: self.data_manager.execute_commands(commands, record=False),
+                frames=frames,
+                # 프로필 적용 전 CVar 값을 기록해 두었다가 완료/중단 시 복원
+                restore_commands=snapshot_cvar_commands(list(commands_a) + list(commands_b)),
+            )
+            self._benchmark.start(on_finished=self.on_benchmark_finished)
+            self.statusBar().showMessage(f"📏 벤치마크 진행 중: {name_a} → {name_b} (다시 누르면 중단)")
+        
+        def on_benchmark_finished(self, result):
+            """벤치마크 완료 - 매크로 파일 옆에 결과 기록 후 요약 표시"""
+            self._benchmark = None
+            path = save_benchmark_result(result, MACROS_FILE.parent)
+            summary = format_result(result)
+            print(summary)
+            self.statusBar().showMessage(f"✅ 벤치마크 완료: {path}", 5000)
+            QtWidgets.QMessageBox.information(self, "A/B 벤치마크", f"{summary}\n\n저장: {path}")
+        
         def setup_styles(self):
             """스타일 설정 - 어두운 테마"""
             style = """
@@ -879,6 +1092,12 @@ if PYSIDE_AVAILABLE:
             QTabBar::tab:hover {
                 background-color: #505050;
             }
+            QListView {
+                border: 2px solid #4A4A4A;
+                border-radius: 4px;
+                background-color: #353535;
+                outline: 0;
+            }
             QScrollArea {
                 border: 2px solid #4A4A4A;
                 border-radius: 4px;
@@ -935,40 +1154,23 @@ if PYSIDE_AVAILABLE:
                 self.button_display_toggle.setText("�️ English")
                 self.button_display_toggle.setStyleSheet("background-color: #2E8B57; color: white;")  # 녹색 (에디터 언어와 구분)
             
-            # 모든 탭의 버튼들 새로고침
-            self.refresh_all_button_texts()
+            # 모든 탭의 표시 텍스트 갱신 (보이는 행만 다시 그려짐)
+            for view in self._tab_views:
+                view.command_model.set_display_korean(self.display_korean)
             
             self.statusBar().showMessage(f"✅ 버튼 표시 언어: {'한국어' if self.display_korean else '영어'}", 3000)
         
-        def refresh_all_button_texts(self):
-            """모든 탭의 버튼 텍스트 새로고침"""
-            for i in range(self.category_tabs.count()):
-                tab_widget = self.category_tabs.widget(i)
-                if tab_widget:
-                    # 탭 내의 모든 QPushButton 찾기
-                    buttons = tab_widget.findChildren(QtWidgets.QPushButton)
-                    for btn in buttons:
-                        # 메인 명령어 버튼인지 확인 (command 프로퍼티가 있는지)
-                        command = btn.property("command")
-                        if command:
-                            # 해당 명령어의 데이터 찾기
-                            cmd_data = None
-                            for cmd in self.data_manager.all_commands:
-                                if cmd.get('command') == command:
-                                    cmd_data = cmd
-                                    break
-                            
-                            if cmd_data:
-                                command_kr = cmd_data.get('command_kr', '')
-                                if self.display_korean and command_kr:
-                                    btn.setText(command_kr)
-                                else:
-                                    btn.setText(command)
-        
         def on_search_changed(self, text):
-            """검색어 변경"""
-            # 현재는 단순 구현, 향후 실시간 필터링 구현 가능
-            pass
+            """검색어 변경 (검색 색인 결과를 현재 탭 Proxy 필터로 적용)"""
+            query = text.strip()
+            if query:
+                results = self.data_manager.search_commands(query)
+                self._search_order = {cmd.get('command', ''): rank for rank, cmd in enumerate(results)}
+                self.statusBar().showMessage(f"🔍 검색 결과: {len(results)}개", 2000)
+            else:
+                self._search_order = None
+            
+            self.refresh_current_tab()
         
         def on_command_button_clicked(self, cmd):
             """명령어 버튼 클릭"""
@@ -1018,8 +1220,10 @@ if PYSIDE_AVAILABLE:
             
             self.data_manager.save_favorites()
             
-            # 항상 현재 탭 새로고침 (즐겨찾기 버튼 아이콘 즉시 반영)
-            self.refresh_current_tab()
+            # 해당 명령어 행만 다시 그리기
+            for view in self._tab_views:
+                view.command_model.command_changed(command)
+                view.proxy_model.favorites_changed()
         
         def on_favorites_filter_changed(self, checked):
             """즐겨찾기 필터 토글"""
@@ -1031,129 +1235,44 @@ if PYSIDE_AVAILABLE:
                 pass
         
         def refresh_current_tab(self):
-            """현재 탭만 새로고침"""
-            try:
-                current_index = self.category_tabs.currentIndex()
-                current_widget = self.category_tabs.currentWidget()
-                
-                if not current_widget:
-                    return
-                
-                # 스크롤 영역 찾기
-                scroll_area = current_widget.findChild(QtWidgets.QScrollArea)
-                if not scroll_area:
-                    return
-                
-                button_widget = scroll_area.widget()
-                if not button_widget:
-                    return
-                
-                button_layout = button_widget.layout()
-                if not button_layout:
-                    return
-                
-                # 현재 탭에 해당하는 명령어들 가져오기
-                tab_text = self.category_tabs.tabText(current_index)
-                if current_index == 0:  # 전체 탭
-                    commands = self.data_manager.all_commands
-                    scope = "전체"
-                else:
-                    # 스코프별 탭
-                    scope = tab_text.replace("📂 ", "")
-                    commands = self.data_manager.get_scope_commands(scope)
-                
-                # 버튼들 업데이트 (새로운 방식: 위젯 교체)
-                self.replace_tab_content(scroll_area, commands)
-                
-                # 강제 UI 업데이트 (안전하게)
-                try:
-                    if self.is_widget_valid(current_widget):
-                        current_widget.update()
-                    if self.is_widget_valid(scroll_area):
-                        scroll_area.update()
-                except RuntimeError:
-                    # 위젯이 이미 삭제된 경우 무시
-                    pass
-                    
-            except Exception as e:
-                # 탭 새로고침 중 오류 발생 시 무시
-                pass
-        
-        def refresh_favorite_buttons(self):
-            """즐겨찾기 버튼들만 업데이트"""
-            current_widget = self.category_tabs.currentWidget()
-            if not current_widget:
+            """현재 탭에 즐겨찾기/검색 필터 적용 (상태가 바뀐 경우에만 다시 필터링)"""
+            view = self.current_view()
+            if view is None:
                 return
             
-            # 모든 즐겨찾기 버튼 찾기
-            fav_buttons = current_widget.findChildren(QtWidgets.QPushButton)
-            for btn in fav_buttons:
-                # 즐겨찾기 버튼인지 확인 (크기로 판단)
-                if btn.size().width() == 32 and btn.size().height() == 28:
-                    # 해당 버튼의 부모 위젯에서 명령어 찾기
-                    parent_widget = btn.parent()
-                    if parent_widget:
-                        # 형제 위젯들 중에서 메인 버튼 찾기
-                        siblings = parent_widget.findChildren(QtWidgets.QPushButton)
-                        for sibling in siblings:
-                            if sibling != btn and sibling.size().width() > 100:  # 메인 버튼
-                                command = sibling.property("command")  # 저장된 command 프로퍼티 사용
-                                if command:
-                                    is_favorite = command in self.data_manager.favorites
-                                    btn.setText("⭐" if is_favorite else "☆")
-                                    # 메인 버튼 스타일도 업데이트
-                                    self.apply_button_style(sibling, command)
-                                    break
-        
-        def refresh_all_tabs(self):
-            """모든 탭 새로고침 (기존 함수 수정)"""
-            current_tab = self.category_tabs.currentIndex()
-            
-            # 각 탭 새로고침 (탭을 다시 만들지 않고 내용만 업데이트)
-            for i in range(self.category_tabs.count()):
-                tab_widget = self.category_tabs.widget(i)
-                if not tab_widget:
-                    continue
-                
-                scroll_area = tab_widget.findChild(QtWidgets.QScrollArea)
-                if not scroll_area:
-                    continue
-                
-                button_widget = scroll_area.widget()
-                if not button_widget:
-                    continue
-                
-                button_layout = button_widget.layout()
-                if not button_layout:
-                    continue
-                
-                # 탭에 해당하는 명령어들 가져오기
-                if i == 0:  # 전체 탭
-                    commands = self.data_manager.all_commands
-                else:
-                    # 스코프별 탭
-                    tab_text = self.category_tabs.tabText(i)
-                    scope = tab_text.replace("📂 ", "")
-                    commands = self.data_manager.get_scope_commands(scope)
-                
-                # 임시로 탭을 변경해서 업데이트
-                self.category_tabs.setCurrentIndex(i)
-                self.update_tab_commands(button_layout, commands)
+            self.load_tab_commands(view)
+            favorites_only = self.favorites_filter.isChecked() if hasattr(self, 'favorites_filter') else False
+            view.proxy_model.set_filters(favorites_only, self._search_order)
+        
+        def load_tab_commands(self, view):
+            """탭이 처음 보일 때 해당 스코프의 명령어를 모델에 채움"""
+            if view.commands_loaded:
+                return
             
-            # 원래 탭으로 복원
-            self.category_tabs.setCurrentIndex(current_tab)
+            scope = view.property("scope")
+            if scope == "all":
+                commands = self.data_manager.all_commands
+            else:
+                commands = self.data_manager.get_scope_commands(scope)
+            view.command_model.set_commands(commands)
+            view.commands_loaded = True
         
         def on_tab_changed(self, index):
-            """탭 변경 시 이벤트"""
-            # 원래 탭 인덱스 저장
-            self._original_tab_index = index
-            
-            # 탭 변경 시 항상 해당 탭 새로고침 (즐겨찾기 버튼 상태 정확히 반영)
-            # 새로운 탭으로 변경될 때 기존 탭의 내용을 올바르게 로드
-            # 탭 변경 시 동작
+            """탭 변경 시 이벤트 (새 탭에 현재 필터 상태 적용)"""
+            self.refresh_current_tab()
             
-            # 약간의 지연 후 새로고침 (탭 변경이 완전히 완료된 후)
-            QtCore.QTimer.singleShot(10, self.refresh_current_tab)
+            view = self.current_view()
+            if view is not None:
+                self.data_manager.settings["last_tab"] = view.property("scope")
+        
+        def closeEvent(self, event):
+            """창 닫기 (마지막 탭, 사용 횟수 저장)"""
+            if self._benchmark is not None:
+                self._benchmark.cancel()
+                self._benchmark = None
+            self.data_manager.save_settings()
+            self.data_manager.shutdown()
+            super().closeEvent(event)
         
         def execute_preset(self, command):
             """프리셋 명령어 실행"""
@@ -1272,9 +1391,9 @@ if PYSIDE_AVAILABLE:
                 self.statusBar().showMessage("🔄 데이터 새로고침 중...", 1000)
                 
                 # 데이터 다시 로드
-                old_count = len(self.data_manager.all_commands)
+                old_count = self.data_manager.command_count()
                 self.data_manager.load_data()
-                new_count = len(self.data_manager.all_commands)
+                new_count = self.data_manager.command_count()
                 
                 if new_count > 0:
                     # 모든 탭 새로고침
@@ -1293,26 +1412,20 @@ if PYSIDE_AVAILABLE:
             try:
                 current_tab_index = self.category_tabs.currentIndex()
                 
-                # 모든 탭 제거
+                # 모든 탭 제거 후 다시 생성
+                self.category_tabs.blockSignals(True)
                 self.category_tabs.clear()
-                
-                # 탭 다시 생성
-                # 전체 탭
-                all_tab = self.create_commands_tab(self.data_manager.all_commands, "all")
-                self.category_tabs.addTab(all_tab, "📋 전체")
-                
-                # 스코프별 탭
-                for scope in sorted(self.data_manager.commands.keys()):
-                    commands = self.data_manager.commands[scope]
-                    tab = self.create_commands_tab(commands, scope)
-                    self.category_tabs.addTab(tab, f"📂 {scope}")
+                for view in self._tab_views:
+                    view.deleteLater()
+                self.create_all_tabs()
                 
                 # 원래 탭 인덱스로 복원 (가능한 경우)
                 if current_tab_index < self.category_tabs.count():
                     self.category_tabs.setCurrentIndex(current_tab_index)
+                self.category_tabs.blockSignals(False)
                 
-                # 현재 탭 새로고침
-                QtCore.QTimer.singleShot(50, self.refresh_current_tab)
+                # 검색 결과도 새 데이터 기준으로 다시 계산
+                self.on_search_changed(self.search_input.text())
                 
             except Exception as e:
                 pass  # 오류 무시
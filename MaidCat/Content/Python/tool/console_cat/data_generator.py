@@ -4,16 +4,23 @@ Unreal Engine 콘솔 명령어 리스트 생성 및 번역 도구
 이 스크립트는 Unreal Engine의 ConsoleHelp.html 파일을 파싱하여
 콘솔 명령어와 설명을 추출하고, Google Translate API를 사용하여
 한국어로 번역한 후 JSON 파일로 저장합니다.
+
+번역은 translation.TranslationPipeline이 묶음 요청/동시 실행/번역 메모리로 처리하므로
+다시 생성할 때는 새로 추가되거나 바뀐 문자열만 번역합니다.
 """
 
 import unreal
+import hashlib
 import json
 import os
-import urllib.request
-import urllib.parse
 import time
 import re
 
+try:
+    from tool.console_cat.translation import TranslationMemory, TranslationPipeline, create_backend
+except ImportError:
+    from translation import TranslationMemory, TranslationPipeline, create_backend
+
 # ============================================================================
 # 설정 (Configuration)
 # ============================================================================
@@ -36,8 +43,21 @@ OUTPUT_DIRECTORY = unreal.SystemLibrary.get_project_saved_directory() + "Console
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 TRANSLATION_DICT_FILE = os.path.join(SCRIPT_DIR, "translation_dictionary.json")
 
-# API 요청 딜레이 (공개 API 사용 시 예의를 지키기 위한 대기 시간)
-REQUEST_DELAY_SECONDS = 0.01
+# 번역 설정
+# 백엔드: "google" (Google Translate 공개 API) 또는 "stub" (네트워크 없이 테스트)
+TRANSLATION_BACKEND = "google"
+TRANSLATION_WORKERS = 4                 # 동시에 보낼 요청 수
+TRANSLATION_BATCH_SIZE = 20             # 요청 하나에 묶을 문자열 수
+TRANSLATION_REQUESTS_PER_SECOND = 5.0   # 공개 API 사용 시 예의를 지키기 위한 초당 요청 수 제한
+TRANSLATION_MAX_RETRIES = 3
+
+# 번역 메모리 (원문 해시 → 번역, 다시 생성할 때 새 문자열/바뀐 문자열만 번역)
+TRANSLATION_MEMORY_FILE = OUTPUT_DIRECTORY + "translation_memory.json"
+
+# 증분 재생성 (이전 파싱 결과와 비교하여 추가/변경된 명령어만 처리, 바뀐 스코프 파일만 다시 저장)
+# 이전 파싱 결과는 {명령어명: 도움말 해시} 형식으로 저장
+PARSE_MANIFEST_FILE = OUTPUT_DIRECTORY + "console_help_manifest.json"
+FORCE_FULL_REGENERATION = False
 
 # ============================================================================
 # 유틸리티 함수들 (Utility Functions)
@@ -141,27 +161,10 @@ def translate_text_google(text):
         return ""
     
     try:
-        encoded_text = urllib.parse.quote(text)
-        url = f"https://translate.googleapis.com/translate_a/single?client=gtx&sl=en&tl=ko&dt=t&q={encoded_text}"
-        headers = {'User-Agent': 'Mozilla/5.0'}
-        req = urllib.request.Request(url, headers=headers)
-        
-        with urllib.request.urlopen(req) as response:
-            if response.status != 200:
-                unreal.log_error(f"Google Translate 요청 실패 (상태 코드: {response.status})")
-                return None
-            
-            response_body = response.read().decode("utf-8")
-            result = json.loads(response_body)
-            
-            # 번역 결과는 여러 세그먼트로 나뉠 수 있으므로 모두 결합
-            full_translation = "".join([segment[0] for segment in result[0] if segment[0]])
-            
-            if full_translation:
-                return full_translation
-            else:
-                unreal.log_warning(f"Google Translate: 번역 결과를 찾을 수 없음 - {text}")
-                return ""
+        full_translation = create_backend("google").translate_single(text)
+        if not full_translation:
+            unreal.log_warning(f"Google Translate: 번역 결과를 찾을 수 없음 - {text}")
+        return full_translation
                 
     except Exception as e:
         unreal.log_error(f"번역 중 오류 발생: {e}")
@@ -173,7 +176,7 @@ def create_user_friendly_label(command_name, translation_dict):
     
     Args:
         command_name (str): 원본 명령어명 (예: "r.Texture.MaxSize")
-        translation_dict (dict): 번역 사전
+        translation_dict (DictionaryMatcher | dict): 번역 사전 (compile_custom_dictionary 결과 권장)
         
     Returns:
         str: 사용자 친화적인 라벨 (예: "Max Size" - 마지막 부분만)
@@ -208,6 +211,52 @@ def create_user_friendly_label(command_name, translation_dict):
     return final_label if final_label else last_part
 
 
+class DictionaryMatcher:
+    """
+    커스텀 사전 전체를 하나의 정규식으로 컴파일한 치환기
+    사전을 로드할 때 한 번만 만들고, 문자열마다 한 번의 re.sub로 모든 용어를 치환
+    
+    - 긴 용어부터 alternation에 배치하여 "Max Size"가 "Max"보다 먼저 매칭됨
+    - 단어 경계(\b)와 re.IGNORECASE로 대소문자 구분 없이 완전한 단어만 치환
+    """
+    
+    def __init__(self, dictionary):
+        # 소문자 용어 → 번역 (대소문자만 다른 중복 항목은 사전의 첫 항목 사용)
+        self.replacements = {}
+        for en_word, kr_word in dictionary.items():
+            if en_word:
+                self.replacements.setdefault(en_word.lower(), kr_word)
+        
+        if self.replacements:
+            terms = sorted(self.replacements, key=len, reverse=True)
+            self.pattern = re.compile(r'\b(?:' + '|'.join(re.escape(term) for term in terms) + r')\b',
+                                      re.IGNORECASE)
+        else:
+            self.pattern = None
+    
+    def _replace(self, match):
+        return self.replacements.get(match.group(0).lower(), match.group(0))
+    
+    def apply(self, text):
+        """텍스트의 사전 용어를 한 번에 치환"""
+        if self.pattern is None or not text:
+            return text
+        return self.pattern.sub(self._replace, text)
+
+
+def compile_custom_dictionary(dictionary):
+    """
+    번역 사전을 DictionaryMatcher로 컴파일 (사전 로드 후 한 번만 호출)
+    
+    Args:
+        dictionary (dict): 영어-한국어 치환 사전
+        
+    Returns:
+        DictionaryMatcher: 컴파일된 치환기
+    """
+    return DictionaryMatcher(dictionary)
+
+
 def apply_custom_dictionary(text, dictionary):
     """
     커스텀 사전을 사용하여 특정 단어를 치환
@@ -215,17 +264,167 @@ def apply_custom_dictionary(text, dictionary):
     
     Args:
         text (str): 치환할 텍스트
-        dictionary (dict): 영어-한국어 치환 사전
+        dictionary (DictionaryMatcher | dict): compile_custom_dictionary()로 만든 치환기
+            (dict를 넘기면 호출할 때마다 컴파일하므로 반복 호출 시에는 치환기를 사용)
         
     Returns:
         str: 치환된 텍스트
     """
-    for en_word, kr_word in dictionary.items():
-        # 정규식의 단어 경계(\b)를 사용하여 완전한 단어만 치환
-        # re.IGNORECASE로 대소문자 구분 없이 치환
-        text = re.sub(r'\b' + re.escape(en_word) + r'\b', kr_word, text, flags=re.IGNORECASE)
+    if not isinstance(dictionary, DictionaryMatcher):
+        dictionary = compile_custom_dictionary(dictionary)
+    return dictionary.apply(text)
+
+# ConsoleHelp.html 파싱에 사용하는 정규식
+CVARS_ARRAY_START_REGEX = re.compile(r"var\s+cvars\s*=\s*\[")
+# JavaScript 문자열 리터럴 (unrolled loop 형태로 작성하여 조각 경계에서 매칭이 실패해도 선형 시간)
+JS_STRING_PATTERN = r""""[^"\\]*(?:\\.[^"\\]*)*"|'[^'\\]*(?:\\.[^'\\]*)*'"""
+# 객체 하나 {key: value, ...} (문자열 안의 '{', '}'는 무시)
+CVAR_OBJECT_REGEX = re.compile(r"""\{(?P<body>[^{}"']*(?:(?:""" + JS_STRING_PATTERN + r""")[^{}"']*)*)\}""")
+# 객체 안의 key: value 쌍 (key는 식별자 또는 문자열, value는 문자열 또는 리터럴)
+CVAR_PAIR_REGEX = re.compile(
+    r"""\s*(?P<key>[A-Za-z_$][\w$]*|""" + JS_STRING_PATTERN + r""")\s*:\s*"""
+    r"""(?P<value>""" + JS_STRING_PATTERN + r"""|[^,]*?)\s*(?:,|$)""")
+JS_ESCAPE_REGEX = re.compile(r"\\(u\{[0-9a-fA-F]+\}|u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|[0-7]{1,3}|\r\n|.)", re.DOTALL)
+JS_SIMPLE_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "b": "\b", "f": "\f", "v": "\v"}
+
+# 파일을 읽는 단위 (문자 수)
+HTML_READ_CHUNK_SIZE = 64 * 1024
+
+
+def _replace_js_escape(match):
+    escape = match.group(1)
+    if escape in JS_SIMPLE_ESCAPES:
+        return JS_SIMPLE_ESCAPES[escape]
+    if escape.startswith("u{"):
+        return chr(int(escape[2:-1], 16))
+    if escape[0] in "ux" and len(escape) > 1:
+        return chr(int(escape[1:], 16))
+    if escape[0] in "01234567":
+        return chr(int(escape, 8))
+    if escape in ("\n", "\r", "\r\n", "\u2028", "\u2029"):
+        return ""  # 줄 이어쓰기
+    return escape  # \" \' \\ \/ 등은 문자 그대로
+
+
+def decode_js_string(literal):
+    """
+    JavaScript 문자열 리터럴("..." 또는 '...')을 파이썬 문자열로 변환
+    unicode_escape와 달리 비ASCII 문자를 그대로 유지하고, \uD83D\uDE00 같은 서로게이트 쌍도 결합
+    
+    Args:
+        literal (str): 따옴표를 포함한 문자열 리터럴
+        
+    Returns:
+        str: 디코딩된 문자열
+    """
+    text = literal[1:-1] if literal[:1] in "\"'" else literal
+    if "\\" not in text:
+        return text
+    
+    text = JS_ESCAPE_REGEX.sub(_replace_js_escape, text)
+    if any("\ud800" <= ch <= "\udfff" for ch in text):
+        # \uXXXX로 나뉘어 있던 서로게이트 쌍을 하나의 문자로 결합
+        text = text.encode("utf-16", "surrogatepass").decode("utf-16", "replace")
     return text
 
+
+def _parse_cvar_object(body):
+    """객체 본문을 {key: value} dict로 변환"""
+    record = {}
+    for pair in CVAR_PAIR_REGEX.finditer(body):
+        key = pair.group("key")
+        if key[:1] in "\"'":
+            key = decode_js_string(key)
+        value = pair.group("value").strip()
+        record[key] = decode_js_string(value) if value[:1] in "\"'" else value
+    return record
+
+
+def iter_cvar_records(chunks):
+    """
+    ConsoleHelp.html 텍스트 조각에서 'var cvars = [...]' 배열의 항목을 하나씩 추출
+    배열 전체를 메모리에 올리지 않고, 완성된 객체 단위로 버퍼를 소비
+    
+    Args:
+        chunks (iterable[str]): HTML 텍스트 조각
+        
+    Yields:
+        tuple: (name, help, type)
+    """
+    chunks = iter(chunks)
+    buffer = ""
+    eof = False
+    
+    def read_more():
+        nonlocal buffer, eof
+        chunk = next(chunks, None)
+        if chunk is None:
+            eof = True
+        else:
+            buffer += chunk
+    
+    # 1단계: 배열 시작 위치 찾기 (조각 경계에 걸친 경우를 위해 끝부분만 남김)
+    while True:
+        match = CVARS_ARRAY_START_REGEX.search(buffer)
+        if match:
+            buffer = buffer[match.end():]
+            break
+        if eof:
+            unreal.log_error("ConsoleHelp.html에서 'cvars' JavaScript 배열을 찾을 수 없습니다.")
+            return
+        buffer = buffer[-64:]
+        read_more()
+    
+    # 2단계: 객체를 하나씩 파싱
+    pos = 0
+    while True:
+        while pos < len(buffer) and (buffer[pos].isspace() or buffer[pos] == ","):
+            pos += 1
+        
+        if pos >= len(buffer):
+            if eof:
+                return
+            buffer = ""
+            pos = 0
+            read_more()
+            continue
+        
+        if buffer[pos] == "]":
+            return
+        
+        if buffer[pos] != "{":
+            unreal.log_error(f"ConsoleHelp.html 'cvars' 배열 파싱 실패: 예상하지 못한 문자 {buffer[pos:pos + 20]!r}")
+            return
+        
+        match = CVAR_OBJECT_REGEX.match(buffer, pos)
+        if match is None:
+            if eof:
+                unreal.log_error("ConsoleHelp.html 'cvars' 배열이 완전하지 않습니다.")
+                return
+            # 객체가 조각 경계에 걸쳐 있으므로 더 읽은 뒤 다시 시도
+            buffer = buffer[pos:]
+            pos = 0
+            read_more()
+            continue
+        
+        pos = match.end()
+        record = _parse_cvar_object(match.group("body"))
+        name = record.get("name")
+        if name:
+            yield name, record.get("help", ""), record.get("type", "")
+
+
+def iter_console_help_file(file_path, chunk_size=HTML_READ_CHUNK_SIZE):
+    """
+    ConsoleHelp.html 파일을 조각 단위로 읽으며 명령어 레코드 추출
+    
+    Yields:
+        tuple: (name, help, type)
+    """
+    with open(file_path, "r", encoding="utf-8") as f:
+        yield from iter_cvar_records(iter(lambda: f.read(chunk_size), ""))
+
+
 def parse_console_help_html(html_content):
     """
     ConsoleHelp.html에서 JavaScript 배열 'cvars'를 찾아 명령어 데이터 추출
@@ -237,31 +436,96 @@ def parse_console_help_html(html_content):
         dict: {명령어명: 도움말} 형식의 딕셔너리
     """
     unreal.log("HTML에서 JavaScript 명령어 데이터 추출 중...")
+    return {name: help_text for name, help_text, _ in iter_cvar_records([html_content])}
+
+# ============================================================================
+# 증분 재생성 (Incremental Regeneration)
+# ============================================================================
+
+def hash_text(text):
+    """도움말/사전 비교용 해시"""
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def load_parse_manifest():
+    """
+    이전 실행의 파싱 결과 로드
     
-    # 스크립트 태그에서 'var cvars = [...]' 배열 찾기
-    match = re.search(r"var\s+cvars\s*=\s*(\[[\s\S]*?\]);", html_content)
-    if not match:
-        unreal.log_error("ConsoleHelp.html에서 'cvars' JavaScript 배열을 찾을 수 없습니다.")
-        return {}
+    Returns:
+        dict: {"dictionary": 사전 해시, "commands": {명령어명: 도움말 해시}} (없으면 빈 결과)
+    """
+    empty_manifest = {"dictionary": "", "commands": {}}
+    if FORCE_FULL_REGENERATION or not os.path.exists(PARSE_MANIFEST_FILE):
+        return empty_manifest
+    
+    try:
+        with open(PARSE_MANIFEST_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception as e:
+        unreal.log_warning(f"이전 파싱 결과 읽기 실패, 전체를 다시 생성합니다: {e}")
+        return empty_manifest
 
-    js_array_string = match.group(1)
 
-    # 데이터 구조: [{name:"...", help:"..."}, ... ]
-    # 정규식으로 각 객체를 찾아서 name과 help 값을 추출
-    commands = {}
+def save_parse_manifest(command_hashes, dictionary_hash):
+    """
+    파싱 결과를 {명령어명: 도움말 해시} 형식으로 저장
     
-    # name과 help 키를 찾고, type 같은 다른 키는 무시
-    object_regex = re.compile(r'{\s*name:\s*"(?P<name>(?:\\.|[^"\\])*)"\s*,\s*help:\s*"(?P<help>(?:\\.|[^"\\])*)"[^}]*?}')
+    Args:
+        command_hashes (dict): 스코프 파일에 실제로 기록된 명령어의 {명령어명: 도움말 해시}
+        dictionary_hash (str): 이 결과를 만들 때 사용한 번역 사전 해시
+    """
+    manifest = {
+        "dictionary": dictionary_hash,
+        "commands": command_hashes,
+    }
+    try:
+        with open(PARSE_MANIFEST_FILE, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False)
+    except IOError as e:
+        unreal.log_error(f"파싱 결과 저장 실패 ({PARSE_MANIFEST_FILE}): {e}")
+
 
-    for item_match in object_regex.finditer(js_array_string):
-        # JavaScript 문자열 리터럴을 언이스케이프
-        command_name = item_match.group("name").encode('utf-8').decode('unicode_escape')
-        help_text = item_match.group("help").encode('utf-8').decode('unicode_escape')
+def diff_parsed_commands(previous_hashes, parsed_commands):
+    """
+    이전 파싱 결과와 새 파싱 결과 비교
+    
+    Args:
+        previous_hashes (dict): {명령어명: 도움말 해시}
+        parsed_commands (dict): {명령어명: 도움말}
         
-        if command_name:
-            commands[command_name] = help_text
-            
-    return commands
+    Returns:
+        dict: {"added": set, "changed": set, "removed": set}
+    """
+    added = set()
+    changed = set()
+    for command, help_text in parsed_commands.items():
+        previous_hash = previous_hashes.get(command)
+        if previous_hash is None:
+            added.add(command)
+        elif previous_hash != hash_text(help_text):
+            changed.add(command)
+    removed = set(previous_hashes) - set(parsed_commands)
+    return {"added": added, "changed": changed, "removed": removed}
+
+
+def load_existing_scope_data(output_path):
+    """기존 스코프 JSON 파일을 {명령어명: 항목} 형식으로 로드 (없으면 빈 dict)"""
+    if not os.path.exists(output_path):
+        return {}
+    try:
+        with open(output_path, "r", encoding="utf-8") as f:
+            return {entry["command"]: entry for entry in json.load(f) if entry.get("command")}
+    except Exception as e:
+        unreal.log_warning(f"기존 데이터 파일 읽기 실패, 스코프 전체를 다시 생성합니다 ({output_path}): {e}")
+        return {}
+
+
+def get_scope_output_path(scope):
+    """스코프별 출력 JSON 파일 경로"""
+    output_filename = f"{scope}_commands_kr.json"
+    if TEST_MODE_ENABLED:
+        output_filename = f"{scope}_commands_kr_TEST.json"
+    return os.path.join(OUTPUT_DIRECTORY, output_filename)
 
 # ============================================================================
 # 파일 및 디렉토리 관리 함수들
@@ -358,20 +622,27 @@ def run():
     
     # 번역 사전 로드
     translation_map = load_translation_dictionary()
+    dictionary_matcher = compile_custom_dictionary(translation_map)
 
-    # HTML 파일 읽기
+    # HTML 파일을 조각 단위로 읽으며 모든 명령어 파싱
+    unreal.log("HTML에서 모든 명령어 파싱 중...")
     try:
-        with open(HELP_HTML_FILE, "r", encoding="utf-8") as f:
-            html_content = f.read()
+        all_parsed_commands = {name: help_text for name, help_text, _ in iter_console_help_file(HELP_HTML_FILE)}
     except IOError as e:
         unreal.log_error(f"ConsoleHelp.html 파일 읽기 실패: {e}")
         return
-
-    # HTML에서 모든 명령어 파싱
-    unreal.log("HTML에서 모든 명령어 파싱 중...")
-    all_parsed_commands = parse_console_help_html(html_content)
     unreal.log(f"총 {len(all_parsed_commands)}개의 명령어를 찾았습니다.")
 
+    # 이전 파싱 결과와 비교 (사전이 바뀌면 라벨/도움말 전처리가 달라지므로 전체 재생성)
+    dictionary_hash = hash_text(json.dumps(translation_map, sort_keys=True, ensure_ascii=False))
+    manifest = load_parse_manifest()
+    if manifest.get("dictionary") != dictionary_hash:
+        manifest = {"dictionary": dictionary_hash, "commands": {}}
+    diff = diff_parsed_commands(manifest.get("commands", {}), all_parsed_commands)
+    dirty_commands = diff["added"] | diff["changed"]
+    unreal.log(f"이전 실행 대비: 추가 {len(diff['added'])}개, 변경 {len(diff['changed'])}개, "
+               f"삭제 {len(diff['removed'])}개")
+
     # 스코프별로 명령어 그룹화
     commands_by_scope = {}
     for command, help_text in all_parsed_commands.items():
@@ -387,11 +658,18 @@ def run():
         scopes_to_run = ["all_commands"]
         commands_by_scope = {"all_commands": all_parsed_commands}
 
-    # 각 스코프별로 처리
+    # 1단계: 스코프별 처리 대상 결정 및 번역할 문자열 수집 (네트워크 요청 없음)
+    scope_jobs = []
+    texts_to_translate = []
     for scope in scopes_to_run:
+        output_path = get_scope_output_path(scope)
         commands_to_process = commands_by_scope.get(scope)
         if not commands_to_process:
             unreal.log_warning(f"스코프 '{scope}'에 해당하는 명령어가 없습니다. 건너뜁니다.")
+            if os.path.exists(output_path):
+                # 스코프의 명령어가 모두 삭제된 경우 이전 파일 제거
+                os.remove(output_path)
+                unreal.log(f"삭제된 스코프의 데이터 파일을 제거했습니다: {output_path}")
             continue
 
         # 테스트 모드일 경우 제한된 수의 명령어만 처리
@@ -399,77 +677,121 @@ def run():
             unreal.log(f"--- 테스트 모드: '{scope}' 스코프를 {TEST_MODE_COMMAND_LIMIT}개 명령어로 제한 ---")
             commands_to_process = {k: commands_to_process[k] for k in list(commands_to_process)[:TEST_MODE_COMMAND_LIMIT]}
 
-        total_commands = len(commands_to_process)
-        unreal.log(f"스코프 '{scope}'의 {total_commands}개 명령어 처리 중")
+        # 기존 파일에 있고 도움말이 바뀌지 않은 명령어는 그대로 재사용
+        existing_entries = load_existing_scope_data(output_path)
+        reused_entries = {command: existing_entries[command] for command in commands_to_process
+                          if command in existing_entries and command not in dirty_commands
+                          and existing_entries[command].get("help_kr") != "TRANSLATION_FAILED"}
+        if len(reused_entries) == len(commands_to_process) == len(existing_entries):
+            unreal.log(f"스코프 '{scope}' 변경 없음. 건너뜁니다.")
+            continue
+
+        unreal.log(f"스코프 '{scope}'의 {len(commands_to_process) - len(reused_entries)}개 명령어 처리 중 "
+                   f"(재사용 {len(reused_entries)}개)")
+
+        entries = []
+        for command_name, help_text_en in commands_to_process.items():
+            if command_name in reused_entries:
+                entries.append((command_name, None, None, None))
+                continue
+
+            # 도움말: 먼저 커스텀 사전으로 엔진 용어 치환
+            processed_text_en = apply_custom_dictionary(help_text_en, dictionary_matcher) if help_text_en else ""
+            # 커맨드명: 버튼 라벨용으로 사용자 친화적으로 변환 (커스텀 사전 적용)
+            friendly_label = create_user_friendly_label(command_name, dictionary_matcher) if command_name else ""
+
+            entries.append((command_name, help_text_en, processed_text_en, friendly_label))
+            if processed_text_en:
+                texts_to_translate.append(processed_text_en)
+            if friendly_label and friendly_label != command_name:
+                texts_to_translate.append(friendly_label)
+
+        scope_jobs.append((scope, output_path, entries, reused_entries))
+
+    # 2단계: 번역 메모리에 없는 문자열만 묶어서 동시에 번역
+    pipeline = TranslationPipeline(
+        create_backend(TRANSLATION_BACKEND),
+        TranslationMemory(TRANSLATION_MEMORY_FILE),
+        max_workers=TRANSLATION_WORKERS,
+        batch_size=TRANSLATION_BATCH_SIZE,
+        requests_per_second=TRANSLATION_REQUESTS_PER_SECOND,
+        max_retries=TRANSLATION_MAX_RETRIES,
+        log=unreal.log_error,
+    )
+    cancelled = []
+    with unreal.ScopedSlowTask(1, "콘솔 명령어 번역 중") as slow_task:
+        slow_task.make_dialog(True)
+        progress_state = {"done": 0}
+
+        def on_progress(done, total):
+            # 스레드 풀이 아닌 이 스레드에서 호출됨
+            slow_task.enter_progress_frame((done - progress_state["done"]) / total,
+                                           f"번역 요청 {done}/{total}")
+            progress_state["done"] = done
+
+        def should_cancel():
+            if slow_task.should_cancel():
+                cancelled.append(True)
+                return True
+            return False
+
+        translations = pipeline.translate_all(texts_to_translate, progress=on_progress,
+                                              should_cancel=should_cancel)
+
+    stats = pipeline.stats
+    unreal.log(f"번역 완료: 메모리 재사용 {stats['cached']}개, 새로 번역 {stats['translated']}개, "
+               f"실패 {stats['failed']}개 (요청 {stats['requests']}회)")
+    if cancelled:
+        unreal.log("사용자가 작업을 취소했습니다.")
+        return
 
-        # 명령어 번역 및 데이터 수집
+    # 3단계: 번역 결과로 스코프별 데이터 구성 및 저장
+    written_hashes = {}  # 이번 실행에서 파일에 기록된 명령어만 매니페스트에 반영
+    for scope, output_path, entries, reused_entries in scope_jobs:
         all_commands_data = []
-        with unreal.ScopedSlowTask(total_commands, f"스코프 '{scope}' 명령어 번역 중") as slow_task:
-            slow_task.make_dialog(True)
-            
-            for i, (command_name, help_text_en) in enumerate(commands_to_process.items(), 1):
-                if slow_task.should_cancel():
-                    unreal.log("사용자가 작업을 취소했습니다.")
-                    return
-
-                slow_task.enter_progress_frame(1, f"처리 중 {i}/{total_commands}: {command_name}")
-                
-                help_text_kr = ""
-                if help_text_en:
-                    # 먼저 커스텀 사전으로 엔진 용어 치환
-                    processed_text_en = apply_custom_dictionary(help_text_en, translation_map)
-                    
-                    # Google Translate로 번역
-                    translated_text = translate_text_google(processed_text_en)
-                    if translated_text is None:
-                        unreal.log_error(f"'{command_name}' 번역 실패. 건너뜁니다.")
-                        help_text_kr = "TRANSLATION_FAILED"
-                    else:
-                        help_text_kr = translated_text
-                    
-                    # API 호출 간 대기
-                    time.sleep(REQUEST_DELAY_SECONDS)
-
-                # 커맨드명을 버튼 라벨용으로 가공 (번역 API 포함)
-                command_kr = ""
-                if command_name:
-                    # 1단계: 사용자 친화적으로 변환 (커스텀 사전 적용)
-                    friendly_label = create_user_friendly_label(command_name, translation_map)
-                    
-                    # 2단계: Google Translate API로 추가 번역
-                    if friendly_label and friendly_label != command_name:
-                        # 이미 어느 정도 번역된 경우 API로 보완
-                        translated_label = translate_text_google(friendly_label)
-                        if translated_label and translated_label != "TRANSLATION_FAILED":
-                            command_kr = translated_label
-                        else:
-                            command_kr = friendly_label  # API 실패시 커스텀 사전 결과 사용
-                        
-                        # API 호출 간 대기
-                        time.sleep(REQUEST_DELAY_SECONDS)
-                    else:
-                        # 커스텀 사전으로 변환되지 않은 경우 원본 사용
-                        command_kr = friendly_label
-
-                all_commands_data.append({
-                    "command": command_name,
-                    "command_kr": command_kr,
-                    "help": help_text_en,
-                    "help_kr": help_text_kr,
-                })
+        for command_name, help_text_en, processed_text_en, friendly_label in entries:
+            if command_name in reused_entries:
+                all_commands_data.append(reused_entries[command_name])
+                continue
+
+            help_text_kr = ""
+            if processed_text_en:
+                help_text_kr = translations.get(processed_text_en)
+                if help_text_kr is None:
+                    unreal.log_error(f"'{command_name}' 번역 실패. 건너뜁니다.")
+                    help_text_kr = "TRANSLATION_FAILED"
+
+            # 커스텀 사전으로 변환된 라벨은 API 번역으로 보완 (실패시 커스텀 사전 결과 사용)
+            command_kr = friendly_label
+            if friendly_label and friendly_label != command_name:
+                command_kr = translations.get(friendly_label) or friendly_label
+
+            all_commands_data.append({
+                "command": command_name,
+                "command_kr": command_kr,
+                "help": help_text_en,
+                "help_kr": help_text_kr,
+            })
         
-        # 스코프별 JSON 파일로 저장
-        output_filename = f"{scope}_commands_kr.json"
-        if TEST_MODE_ENABLED:
-            output_filename = f"{scope}_commands_kr_TEST.json"
-            
-        output_path = os.path.join(OUTPUT_DIRECTORY, output_filename)
+        # 스코프별 JSON 파일로 저장 (변경된 스코프만)
         try:
             with open(output_path, "w", encoding="utf-8") as f:
                 json.dump(all_commands_data, f, indent=4, ensure_ascii=False)
             unreal.log(f"✓ 스코프 '{scope}'의 {len(all_commands_data)}개 명령어를 저장했습니다: {output_path}")
         except IOError as e:
+            # 기록하지 못한 스코프는 이전 해시를 유지해 다음 실행에서 다시 처리
             unreal.log_error(f"파일 쓰기 실패 ({output_path}): {e}")
+            continue
+        for command_name, _, _, _ in entries:
+            written_hashes[command_name] = hash_text(all_parsed_commands[command_name])
+
+    # 다음 실행에서 비교할 파싱 결과 저장
+    # 처리하지 않은 스코프/테스트 모드에서 제외된 명령어는 이전 해시를 그대로 유지
+    # (사전이 바뀐 경우 이전 해시는 이미 비워졌으므로 다음 실행에서 다시 생성됨)
+    command_hashes = {command: command_hash for command, command_hash in manifest.get("commands", {}).items()
+                      if command in all_parsed_commands}
+    command_hashes.update(written_hashes)
+    save_parse_manifest(command_hashes, dictionary_hash)
 
     unreal.log("=== 콘솔 명령어 추출 및 번역 완료 ===")
 
@@ -0,0 +1,140 @@
+"""
+Console Cat Search Index 🐱
+콘솔 명령어 검색용 trigram 역색인
+
+특징:
+- 데이터 로드 시 한 번만 구축 (command, command_kr, help, help_kr)
+- 3글자 이상 검색어는 trigram posting 교집합으로 후보를 좁힌 뒤 확인
+- 순위: 명령어 접두사 일치 > 토큰 접두사 일치 > 부분 문자열 일치
+- 검색어가 한 글자씩 늘어나면 직전 결과 안에서만 다시 검색 (점진적 축소)
+
+unreal / Qt 없이 동작합니다.
+"""
+
+import re
+
+
+# 검색 대상 필드 (순서대로 이어 붙여 하나의 검색 텍스트를 만듦)
+SEARCH_FIELDS = ('command', 'command_kr', 'help', 'help_kr')
+
+# 필드 구분자 (검색어에 나타나지 않으므로 필드를 넘는 trigram이 매칭되지 않음)
+FIELD_SEPARATOR = '\x00'
+
+# 토큰 분리 규칙 ('r.Shadow.MaxResolution' → r, shadow, maxresolution)
+TOKEN_PATTERN = re.compile(r"[^\W_]+", re.UNICODE)
+
+# 순위
+RANK_PREFIX = 0
+RANK_TOKEN = 1
+RANK_SUBSTRING = 2
+
+
+def _trigrams(text):
+    """문자열의 trigram 집합"""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class CommandSearchIndex:
+    """콘솔 명령어 trigram / 토큰 역색인"""
+
+    def __init__(self, commands=None):
+        self.commands = []
+        self._texts = []           # 문서별 소문자 검색 텍스트
+        self._names = []           # 문서별 (command, command_kr) 소문자
+        self._tokens = []          # 문서별 토큰 집합
+        self._postings = {}        # trigram → 문서 번호 리스트 (오름차순)
+        self._score = None         # 문서 번호 → 추가 정렬 점수 (높을수록 앞)
+        self._last_query = None
+        self._last_matches = None  # 직전 검색의 매칭 문서 번호 리스트
+        if commands is not None:
+            self.build(commands)
+
+    def build(self, commands):
+        """명령어 목록으로 색인 구축"""
+        self.commands = list(commands)
+        self._texts = []
+        self._names = []
+        self._tokens = []
+        self._postings = {}
+        self._last_query = None
+        self._last_matches = None
+
+        for doc_id, cmd in enumerate(self.commands):
+            fields = [str(cmd.get(field) or '').lower() for field in SEARCH_FIELDS]
+            text = FIELD_SEPARATOR.join(fields)
+            self._texts.append(text)
+            self._names.append((fields[0], fields[1]))
+            self._tokens.append(frozenset(TOKEN_PATTERN.findall(text)))
+
+            for trigram in _trigrams(text):
+                if FIELD_SEPARATOR in trigram:
+                    continue
+                self._postings.setdefault(trigram, []).append(doc_id)
+
+    def set_score_function(self, score_function):
+        """같은 순위 안에서 사용할 추가 정렬 점수 함수 지정 (cmd → 숫자, 높을수록 앞)"""
+        self._score = score_function
+
+    def __len__(self):
+        return len(self.commands)
+
+    def _candidates(self, query):
+        """검색어를 포함할 수 있는 후보 문서 번호"""
+        # 직전 검색어가 현재 검색어의 일부라면 직전 결과 안에서만 찾으면 됨
+        if self._last_query and self._last_query in query and self._last_matches is not None:
+            return self._last_matches
+
+        if len(query) < 3:
+            return range(len(self.commands))
+
+        postings = []
+        for trigram in _trigrams(query):
+            posting = self._postings.get(trigram)
+            if not posting:
+                return []
+            postings.append(posting)
+
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates.intersection_update(posting)
+            if not candidates:
+                return []
+        return sorted(candidates)
+
+    def _rank(self, doc_id, query):
+        """문서의 검색 순위"""
+        command, command_kr = self._names[doc_id]
+        if command.startswith(query) or command_kr.startswith(query):
+            return RANK_PREFIX
+        if any(token.startswith(query) for token in self._tokens[doc_id]):
+            return RANK_TOKEN
+        return RANK_SUBSTRING
+
+    def search(self, query, limit=None):
+        """검색어에 맞는 명령어 목록을 순위대로 반환
+
+        Args:
+            query: 검색어 (대소문자 무시)
+            limit: 최대 결과 수 (None이면 전체)
+        """
+        query = (query or '').strip().lower()
+        if not query:
+            self._last_query = None
+            self._last_matches = None
+            return list(self.commands)
+
+        matches = [doc_id for doc_id in self._candidates(query) if query in self._texts[doc_id]]
+        self._last_query = query
+        self._last_matches = matches
+
+        if self._score is not None:
+            score = self._score
+            key = lambda doc_id: (self._rank(doc_id, query), -score(self.commands[doc_id]), doc_id)
+        else:
+            key = lambda doc_id: (self._rank(doc_id, query), doc_id)
+
+        ranked = sorted(matches, key=key)
+        if limit is not None:
+            ranked = ranked[:limit]
+        return [self.commands[doc_id] for doc_id in ranked]
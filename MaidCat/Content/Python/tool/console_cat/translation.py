@@ -0,0 +1,307 @@
+"""
+Console Cat Translation Pipeline 🐱
+콘솔 명령어 도움말/라벨 번역 단계
+
+특징:
+- 번역 백엔드 교체 가능 (Google 공개 API / 오프라인 Stub)
+- 여러 문자열을 한 번의 요청으로 묶어서 번역 (batch)
+- 스레드 풀로 요청을 동시에 보내되, 초당 요청 수 제한 및 실패 시 재시도
+- 원문 해시 기반 번역 메모리 파일로 새 문자열/바뀐 문자열만 번역
+
+unreal 없이 동작합니다. (data_generator.run에서 사용)
+
+사용법:
+    backend = create_backend("google")
+    memory = TranslationMemory("Saved/ConsoleCommandData/translation_memory.json")
+    pipeline = TranslationPipeline(backend, memory, max_workers=4, batch_size=20)
+    translations = pipeline.translate_all(["Enable shadows", "Max texture size"])
+    # {"Enable shadows": "그림자 활성화", ...} (실패한 문자열은 None)
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+
+DEFAULT_SOURCE_LANGUAGE = "en"
+DEFAULT_TARGET_LANGUAGE = "ko"
+
+
+# ============================================================================
+# 번역 백엔드
+# ============================================================================
+
+class TranslationBackend:
+    """번역 백엔드 기본 클래스
+
+    translate_batch()는 입력과 같은 길이의 리스트를 반환하며,
+    번역하지 못한 항목은 None입니다. 요청 자체가 실패하면 예외를 발생시켜
+    파이프라인이 재시도하도록 합니다.
+    """
+
+    name = "base"
+    max_batch_size = 1
+
+    def __init__(self, source_language=DEFAULT_SOURCE_LANGUAGE, target_language=DEFAULT_TARGET_LANGUAGE):
+        self.source_language = source_language
+        self.target_language = target_language
+
+    def translate_batch(self, texts):
+        raise NotImplementedError
+
+
+class GoogleTranslateBackend(TranslationBackend):
+    """Google Translate 공개 API 백엔드
+
+    translate_a/t 엔드포인트는 q 파라미터를 여러 개 받으므로 한 번의 POST로 묶어서 번역합니다.
+    """
+
+    name = "google"
+    max_batch_size = 20
+
+    BATCH_URL = "https://translate.googleapis.com/translate_a/t"
+    SINGLE_URL = "https://translate.googleapis.com/translate_a/single"
+
+    def __init__(self, source_language=DEFAULT_SOURCE_LANGUAGE, target_language=DEFAULT_TARGET_LANGUAGE,
+                 timeout=30):
+        super().__init__(source_language, target_language)
+        self.timeout = timeout
+
+    def _request(self, url, params):
+        data = urllib.parse.urlencode(params, doseq=True).encode("utf-8")
+        headers = {
+            'User-Agent': 'Mozilla/5.0',
+            'Content-Type': 'application/x-www-form-urlencoded;charset=utf-8',
+        }
+        req = urllib.request.Request(url, data=data, headers=headers)
+        with urllib.request.urlopen(req, timeout=self.timeout) as response:
+            if response.status != 200:
+                raise RuntimeError(f"Google Translate 요청 실패 (상태 코드: {response.status})")
+            return json.loads(response.read().decode("utf-8"))
+
+    def translate_single(self, text):
+        """문자열 하나 번역 (translate_a/single)"""
+        result = self._request(self.SINGLE_URL, {
+            "client": "gtx", "sl": self.source_language, "tl": self.target_language, "dt": "t", "q": text,
+        })
+        # 번역 결과는 여러 세그먼트로 나뉠 수 있으므로 모두 결합
+        return "".join(segment[0] for segment in result[0] if segment[0])
+
+    def translate_batch(self, texts):
+        if len(texts) == 1:
+            return [self.translate_single(texts[0])]
+
+        result = self._request(self.BATCH_URL, {
+            "client": "gtx", "sl": self.source_language, "tl": self.target_language, "q": list(texts),
+        })
+        # 응답 형태: ["번역1", "번역2", ...] 또는 [["번역1", "en"], ...]
+        translations = [item[0] if isinstance(item, list) else item for item in result]
+        if len(translations) != len(texts):
+            # 묶음 응답을 신뢰할 수 없으면 하나씩 다시 요청
+            return [self.translate_single(text) for text in texts]
+        return translations
+
+
+class StubTranslationBackend(TranslationBackend):
+    """오프라인 테스트용 백엔드 (네트워크 없이 접두사만 붙여 반환)"""
+
+    name = "stub"
+    max_batch_size = 50
+
+    def __init__(self, source_language=DEFAULT_SOURCE_LANGUAGE, target_language=DEFAULT_TARGET_LANGUAGE,
+                 prefix="[ko] "):
+        super().__init__(source_language, target_language)
+        self.prefix = prefix
+
+    def translate_batch(self, texts):
+        return [f"{self.prefix}{text}" for text in texts]
+
+
+BACKENDS = {
+    GoogleTranslateBackend.name: GoogleTranslateBackend,
+    StubTranslationBackend.name: StubTranslationBackend,
+}
+
+
+def create_backend(name, **kwargs):
+    """이름으로 번역 백엔드 생성 ("google" / "stub")"""
+    backend_class = BACKENDS.get(name)
+    if backend_class is None:
+        raise ValueError(f"지원하지 않는 번역 백엔드: {name} (지원: {', '.join(BACKENDS)})")
+    return backend_class(**kwargs)
+
+
+# ============================================================================
+# 번역 메모리
+# ============================================================================
+
+class TranslationMemory:
+    """원문 해시 → 번역 결과를 보관하는 JSON 파일
+
+    키는 백엔드 이름, 언어쌍, 원문을 합친 sha1이므로 원문이 바뀌면 자동으로 다시 번역됩니다.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self._entries = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        if path and os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    self._entries = json.load(f)
+            except Exception as e:
+                print(f"⚠️ 번역 메모리 로드 실패, 새로 만듭니다: {e}")
+                self._entries = {}
+
+    @staticmethod
+    def make_key(backend, text):
+        source = f"{backend.name}|{backend.source_language}|{backend.target_language}|{text}"
+        return hashlib.sha1(source.encode("utf-8")).hexdigest()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, backend, text):
+        return self._entries.get(self.make_key(backend, text))
+
+    def put(self, backend, text, translation):
+        with self._lock:
+            self._entries[self.make_key(backend, text)] = translation
+            self._dirty = True
+
+    def save(self):
+        """변경 사항이 있으면 임시 파일에 쓴 뒤 교체 (중단되어도 기존 파일 보존)"""
+        if not self.path or not self._dirty:
+            return
+        with self._lock:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f, ensure_ascii=False)
+            os.replace(temp_path, self.path)
+            self._dirty = False
+
+
+# ============================================================================
+# 파이프라인
+# ============================================================================
+
+class RateLimiter:
+    """여러 스레드가 공유하는 초당 요청 수 제한"""
+
+    def __init__(self, requests_per_second, clock=time.monotonic, sleep=time.sleep):
+        self.interval = 1.0 / requests_per_second if requests_per_second else 0.0
+        self._clock = clock
+        self._sleep = sleep
+        self._next_time = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self._lock:
+            now = self._clock()
+            start = max(now, self._next_time)
+            self._next_time = start + self.interval
+        if start > now:
+            self._sleep(start - now)
+
+
+class TranslationPipeline:
+    """번역 메모리 조회 → 묶음 요청 → 스레드 풀 동시 실행 → 메모리 저장"""
+
+    def __init__(self, backend, memory=None, max_workers=4, batch_size=None,
+                 requests_per_second=5.0, max_retries=3, retry_delay=1.0,
+                 save_interval=20, log=print):
+        self.backend = backend
+        self.memory = memory if memory is not None else TranslationMemory()
+        self.max_workers = max(1, int(max_workers))
+        self.batch_size = max(1, int(batch_size or backend.max_batch_size))
+        self.rate_limiter = RateLimiter(requests_per_second)
+        self.max_retries = max(0, int(max_retries))
+        self.retry_delay = retry_delay
+        self.save_interval = save_interval
+        self.log = log
+        self.stats = {"cached": 0, "translated": 0, "failed": 0, "requests": 0}
+        self._stats_lock = threading.Lock()
+
+    def _translate_with_retry(self, batch):
+        """묶음 하나 번역 (실패 시 지수 백오프로 재시도, 끝내 실패하면 None 리스트)"""
+        for attempt in range(self.max_retries + 1):
+            self.rate_limiter.wait()
+            try:
+                with self._stats_lock:
+                    self.stats["requests"] += 1
+                translations = self.backend.translate_batch(batch)
+                if len(translations) == len(batch):
+                    return translations
+                raise RuntimeError(f"번역 결과 개수 불일치 ({len(translations)}/{len(batch)})")
+            except Exception as e:
+                if attempt >= self.max_retries:
+                    self.log(f"번역 요청 실패 ({len(batch)}개 문자열): {e}")
+                    return [None] * len(batch)
+                time.sleep(self.retry_delay * (2 ** attempt))
+
+    def translate_all(self, texts, progress=None, should_cancel=None):
+        """문자열 목록 번역
+
+        Args:
+            texts: 번역할 문자열 목록 (중복/빈 문자열 허용)
+            progress: 묶음 하나가 끝날 때마다 호출되는 함수 (done, total) - 호출한 스레드에서 실행
+            should_cancel: True를 반환하면 남은 요청을 취소하는 함수
+
+        Returns:
+            dict: {원문: 번역 결과} (빈 문자열은 "", 실패한 문자열은 None)
+        """
+        results = {}
+        pending = []
+        for text in dict.fromkeys(texts):
+            if not text or text.isspace():
+                results[text] = ""
+                continue
+            cached = self.memory.get(self.backend, text)
+            if cached is not None:
+                results[text] = cached
+                self.stats["cached"] += 1
+            else:
+                pending.append(text)
+
+        batches = [pending[i:i + self.batch_size] for i in range(0, len(pending), self.batch_size)]
+        if not batches:
+            return results
+
+        done = 0
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(self._translate_with_retry, batch): batch for batch in batches}
+            try:
+                for future in as_completed(futures):
+                    batch = futures[future]
+                    for text, translation in zip(batch, future.result()):
+                        results[text] = translation
+                        if translation:
+                            self.memory.put(self.backend, text, translation)
+                            self.stats["translated"] += 1
+                        else:
+                            self.stats["failed"] += 1
+
+                    done += 1
+                    if self.save_interval and done % self.save_interval == 0:
+                        self.memory.save()
+                    if progress:
+                        progress(done, len(batches))
+                    if should_cancel and should_cancel():
+                        for other in futures:
+                            other.cancel()
+                        break
+            finally:
+                self.memory.save()
+
+        return results
@@ -1,6 +1,13 @@
+import importlib
+import sys
 from pathlib import Path
 import unreal
 
+from .requirements_check import (
+    find_missing_requirements, find_wheelhouse, get_file_hash, get_wheelhouse_options,
+    is_stamp_current, save_stamp,
+)
+
 
 def plugin_site_dir() -> Path:
     """
@@ -17,28 +24,102 @@ def get_py_pip():
     except ImportError:
         from .vendor import py_pip
     return py_pip
+
+
+def get_requirements_path() -> Path:
+    """requirements.txt path (Content/Python/requirements.txt)"""
+    # tool/dependencies_installer/__init__.py -> tool/dependencies_installer -> tool -> Python -> requirements.txt
+    return Path(__file__).parent.parent.parent / "requirements.txt"
             
 
-def install_dependencies():
-    """Install dependencies from requirements.txt."""
-    # Initialize
-    py_pip = get_py_pip()
-    py_pip.default_target_path = plugin_site_dir()
-    py_pip.python_interpreter = unreal.get_interpreter_executable_path()
+def install_dependencies(force: bool = False, wheelhouse=None):
+    """Install dependencies from requirements.txt.
     
-    # Find requirements.txt file
-    current_file = Path(__file__)
-    # dependencies_installer는 tool 폴더 안에 있으므로 경로 수정
-    # tool/dependencies_installer/__init__.py -> tool/dependencies_installer -> tool -> Python -> requirements.txt
-    requirements_path = current_file.parent.parent.parent / "requirements.txt"
+    pip는 requirements.txt가 바뀌었거나 설치된 배포판이 요구사항을 충족하지 않을 때만 실행합니다.
     
+    Args:
+        force: True면 설치 상태 확인을 건너뛰고 항상 pip 실행
+        wheelhouse: 오프라인 설치용 wheel 폴더 (None이면 MAIDCAT_WHEELHOUSE 환경 변수 → requirements.txt 옆 wheelhouse/)
+    
+    Returns:
+        bool: 모든 요구사항이 충족되었는지 여부
+    """
+    print("Installing dependencies...")
+    
+    # Find requirements.txt file
+    requirements_path = get_requirements_path()
     print(f"Looking for requirements.txt at: {requirements_path}")
     if not requirements_path.exists():
         print(f"⚠️  requirements.txt not found at {requirements_path}")
-        return
+        return False
+    
+    site_dir = plugin_site_dir()
+    requirements_hash = get_file_hash(requirements_path)
     
-    # Install requirements
-    py_pip.install(requirements=requirements_path)
+    # 빠른 경로 1: requirements.txt가 그대로이고 설치했던 배포판이 남아 있음
+    if not force and is_stamp_current(site_dir, requirements_hash):
+        print("✅ 의존성이 이미 설치되어 있습니다 (requirements.txt 변경 없음)")
+        return True
+    
+    # 빠른 경로 2: 설치된 배포판 metadata로 요구사항 확인 (subprocess 없음)
+    missing, satisfied = find_missing_requirements(requirements_path, site_dir)
+    if not force and not missing:
+        save_stamp(site_dir, requirements_hash, satisfied)
+        print(f"✅ 모든 의존성 충족 ({len(satisfied)}개 패키지)")
+        return True
+    
+    if missing:
+        print(f"📦 설치 필요: {', '.join(missing)}")
+    
+    # Initialize
+    py_pip = get_py_pip()
+    py_pip.default_target_path = site_dir
+    py_pip.python_interpreter = unreal.get_interpreter_executable_path()
+    
+    wheelhouse_path = find_wheelhouse(requirements_path, wheelhouse)
+    if wheelhouse_path:
+        print(f"📁 오프라인 wheelhouse 사용: {wheelhouse_path}")
+    
+    # Install requirements (부족한 요구사항만, force면 requirements.txt 전체)
+    command = [py_pip.python_interpreter, "-m", "pip", "install", "--target", str(site_dir), "--no-user"]
+    command.extend(get_wheelhouse_options(wheelhouse_path))
+    if force:
+        command.extend(["--upgrade", "-r", str(requirements_path)])
+    else:
+        command.extend(["--upgrade"] + missing)
+    
+    process = py_pip.run_command_process(command)
+    output, error = process.communicate()
+    if output:
+        print(output.decode(errors="replace"))
+    if error:
+        print(error.decode(errors="replace"))
+    
+    importlib.invalidate_caches()
+    if str(site_dir) not in sys.path:
+        sys.path.append(str(site_dir))
+    
+    missing, satisfied = find_missing_requirements(requirements_path, site_dir)
+    if missing or process.returncode != 0:
+        print(f"❌ 의존성 설치 실패, 충족되지 않은 요구사항: {', '.join(missing) or '-'}")
+        return False
+    
+    save_stamp(site_dir, requirements_hash, satisfied)
+    print(f"✅ 의존성 설치 완료 ({len(satisfied)}개 패키지)")
+    return True
 
 
-print("Installing dependencies...")
\ No newline at end of file
+def download_wheelhouse(wheelhouse=None):
+    """온라인 머신에서 requirements.txt의 wheel을 wheelhouse 폴더로 다운로드 (오프라인 빌드 머신 배포용)"""
+    requirements_path = get_requirements_path()
+    wheelhouse_path = Path(wheelhouse) if wheelhouse else requirements_path.parent / "wheelhouse"
+    wheelhouse_path.mkdir(parents=True, exist_ok=True)
+    
+    py_pip = get_py_pip()
+    command = [unreal.get_interpreter_executable_path(), "-m", "pip", "download",
+               "-r", str(requirements_path), "-d", str(wheelhouse_path)]
+    output, error = py_pip.run_command(command)
+    print(output.decode(errors="replace"))
+    if error:
+        print(error.decode(errors="replace"))
+    return wheelhouse_path
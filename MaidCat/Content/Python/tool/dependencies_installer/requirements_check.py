@@ -0,0 +1,213 @@
+"""
+requirements.txt 설치 상태 확인 (pip subprocess 없이)
+
+pip는 실행할 때마다 인터프리터를 새로 띄우므로 에디터 시작 시 수 초가 걸립니다.
+여기서는 importlib.metadata로 설치 폴더(site_dir)와 sys.path의 배포판을 읽어
+requirements.txt의 이름/버전 조건을 직접 확인하고, 부족한 것이 있을 때만 pip를 실행하게 합니다.
+
+- requirements.txt의 sha256과 설치 결과를 site_dir의 스탬프 파일에 기록
+- 해시가 같으면 스탬프에 기록된 dist-info가 남아 있는지만 확인 (listdir 한 번)
+- 해시가 다르면 요구사항을 하나씩 metadata로 확인
+- 오프라인 빌드 머신용 wheelhouse 폴더가 있으면 pip 옵션에 --no-index --find-links 추가
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from importlib import metadata
+from pathlib import Path
+
+
+STAMP_FILE_NAME = ".maidcat_requirements.json"
+WHEELHOUSE_ENV_VAR = "MAIDCAT_WHEELHOUSE"
+WHEELHOUSE_DIR_NAME = "wheelhouse"
+
+
+def _load_packaging():
+    """packaging 모듈 (없으면 pip에 포함된 것, 그것도 없으면 None)"""
+    try:
+        from packaging.requirements import Requirement, InvalidRequirement
+        return Requirement, InvalidRequirement
+    except ImportError:
+        pass
+    try:
+        from pip._vendor.packaging.requirements import Requirement, InvalidRequirement
+        return Requirement, InvalidRequirement
+    except ImportError:
+        return None, None
+
+
+def normalize_name(name):
+    """PEP 503 이름 정규화 (unreal_qt, Unreal-QT → unreal-qt)"""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def get_file_hash(path):
+    """파일 sha256"""
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def iter_requirement_lines(requirements_path):
+    """주석/빈 줄/pip 옵션 줄을 제외한 요구사항 줄"""
+    for line in Path(requirements_path).read_text(encoding="utf-8").splitlines():
+        line = line.split(" #", 1)[0].strip()
+        if not line or line.startswith("#") or line.startswith("-"):
+            continue
+        yield line
+
+
+def parse_requirement(line):
+    """요구사항 한 줄 → {"line", "name", "specifier", "marker_ok"}
+
+    packaging이 없으면 이름만 확인합니다 (버전 조건은 무시).
+    """
+    Requirement, InvalidRequirement = _load_packaging()
+    if Requirement is not None:
+        try:
+            requirement = Requirement(line)
+            marker_ok = requirement.marker.evaluate() if requirement.marker else True
+            return {
+                "line": line,
+                "name": normalize_name(requirement.name),
+                "specifier": requirement.specifier,
+                "marker_ok": marker_ok,
+            }
+        except InvalidRequirement:
+            pass
+
+    # URL/경로 또는 packaging 없음 → 이름만 추출
+    name = line
+    if "#egg=" in name:
+        name = name.split("#egg=", 1)[1]
+    else:
+        name = name.rstrip("/").split("/")[-1]
+        if name.endswith(".git"):
+            name = name[:-4]
+    name = re.split(r"[\[<>=!~;@\s]", name, 1)[0]
+    return {"line": line, "name": normalize_name(name), "specifier": None, "marker_ok": True}
+
+
+def get_installed_distributions(site_dir=None):
+    """{정규화된 이름: (버전, dist-info 경로)} (site_dir 우선, 그다음 sys.path)"""
+    search_path = ([str(site_dir)] if site_dir else []) + [entry for entry in sys.path if entry]
+    installed = {}
+    for distribution in metadata.distributions(path=search_path):
+        name = distribution.metadata["Name"]
+        if not name:
+            continue
+        key = normalize_name(name)
+        if key in installed:
+            continue
+        dist_path = getattr(distribution, "_path", None)
+        installed[key] = (distribution.version, Path(dist_path) if dist_path else None)
+    return installed
+
+
+def find_missing_requirements(requirements_path, site_dir=None):
+    """설치되지 않았거나 버전 조건이 맞지 않는 요구사항
+
+    Returns:
+        (list, dict): (부족한 요구사항 줄 목록, {이름: {"version", "dist_info", "in_site_dir"}} 충족된 요구사항)
+    """
+    installed = get_installed_distributions(site_dir)
+    missing = []
+    satisfied = {}
+    for line in iter_requirement_lines(requirements_path):
+        requirement = parse_requirement(line)
+        if not requirement["marker_ok"]:
+            continue
+        found = installed.get(requirement["name"])
+        if found is None:
+            missing.append(line)
+            continue
+        version = found[0]
+        specifier = requirement["specifier"]
+        if specifier and not specifier.contains(version, prereleases=True):
+            missing.append(line)
+            continue
+        dist_path = found[1]
+        in_site_dir = bool(site_dir and dist_path and
+                           os.path.normcase(str(dist_path.parent)) == os.path.normcase(str(Path(site_dir))))
+        satisfied[requirement["name"]] = {
+            "version": version,
+            "dist_info": dist_path.name if dist_path else None,
+            "in_site_dir": in_site_dir,
+        }
+    return missing, satisfied
+
+
+# ============================================================================
+# 스탬프 (requirements 해시 → 설치 결과)
+# ============================================================================
+
+def _stamp_path(site_dir):
+    return Path(site_dir) / STAMP_FILE_NAME
+
+
+def load_stamp(site_dir):
+    try:
+        with open(_stamp_path(site_dir), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_stamp(site_dir, requirements_hash, satisfied):
+    """설치 확인 결과 기록 (실패해도 다음에 다시 확인할 뿐이므로 경고만 출력)"""
+    stamp = {
+        "requirements_sha256": requirements_hash,
+        "python": f"{sys.version_info.major}.{sys.version_info.minor}",
+        "checked": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "packages": satisfied,
+    }
+    try:
+        Path(site_dir).mkdir(parents=True, exist_ok=True)
+        with open(_stamp_path(site_dir), "w", encoding="utf-8") as f:
+            json.dump(stamp, f, ensure_ascii=False, indent=2)
+    except OSError as e:
+        print(f"⚠️  설치 스탬프 저장 실패: {e}")
+
+
+def is_stamp_current(site_dir, requirements_hash):
+    """해시가 같고 스탬프에 기록된 dist-info 폴더가 site_dir에 모두 남아 있는지 확인"""
+    stamp = load_stamp(site_dir)
+    if not stamp or stamp.get("requirements_sha256") != requirements_hash:
+        return False
+    if stamp.get("python") != f"{sys.version_info.major}.{sys.version_info.minor}":
+        return False
+
+    # site_dir에 설치된 패키지만 확인 (엔진 Python 등 다른 곳에서 충족된 패키지는 그대로 있다고 봄)
+    dist_infos = [package["dist_info"] for package in stamp.get("packages", {}).values()
+                  if package.get("in_site_dir") and package.get("dist_info")]
+    if not dist_infos:
+        return True
+    try:
+        entries = set(os.listdir(site_dir))
+    except OSError:
+        return False
+    return all(name in entries for name in dist_infos)
+
+
+# ============================================================================
+# wheelhouse
+# ============================================================================
+
+def find_wheelhouse(requirements_path, wheelhouse=None):
+    """오프라인 설치용 wheelhouse 폴더 (인자 → 환경 변수 → requirements.txt 옆 wheelhouse/ 순, 없으면 None)"""
+    candidates = [wheelhouse, os.environ.get(WHEELHOUSE_ENV_VAR),
+                  Path(requirements_path).parent / WHEELHOUSE_DIR_NAME]
+    for candidate in candidates:
+        if candidate and Path(candidate).is_dir():
+            return Path(candidate)
+    return None
+
+
+def get_wheelhouse_options(wheelhouse):
+    """wheelhouse만 사용하도록 하는 pip install 옵션"""
+    if not wheelhouse:
+        return []
+    return ["--no-index", "--find-links", str(wheelhouse)]
@@ -9,6 +9,11 @@ import sys
 import os
 import unreal
 
+from tool.dependencies_installer.requirements_check import (
+    find_missing_requirements, find_wheelhouse, get_file_hash, get_installed_distributions,
+    get_wheelhouse_options, is_stamp_current, parse_requirement, save_stamp,
+)
+
 
 # ============================================================================
 # 설정
@@ -161,12 +166,16 @@ def list_installed_packages():
         return []
 
 
-def install_requirements(requirements_file):
+def install_requirements(requirements_file, force=False, wheelhouse=None):
     """
     requirements.txt 파일에서 패키지 설치
     
+    requirements.txt가 바뀌지 않았거나 모든 요구사항이 이미 충족되면 pip를 실행하지 않습니다.
+    
     Args:
         requirements_file (str): requirements.txt 파일 경로
+        force (bool): True면 설치 상태 확인 없이 항상 pip 실행
+        wheelhouse (str): 오프라인 설치용 wheel 폴더 (None이면 MAIDCAT_WHEELHOUSE 환경 변수 → requirements.txt 옆 wheelhouse/)
         
     Returns:
         bool: 성공 여부
@@ -178,6 +187,18 @@ def install_requirements(requirements_file):
     if not ensure_site_packages_dir():
         return False
     
+    requirements_hash = get_file_hash(requirements_file)
+    if not force:
+        if is_stamp_current(SITE_PACKAGES_DIR, requirements_hash):
+            unreal.log("✓ 모든 패키지가 이미 설치되어 있음 (requirements.txt 변경 없음)")
+            return True
+        missing, satisfied = find_missing_requirements(requirements_file, SITE_PACKAGES_DIR)
+        if not missing:
+            save_stamp(SITE_PACKAGES_DIR, requirements_hash, satisfied)
+            unreal.log(f"✓ 모든 패키지가 이미 설치되어 있음 ({len(satisfied)}개)")
+            return True
+        unreal.log(f"설치 필요: {', '.join(missing)}")
+    
     unreal.log(f"requirements.txt에서 패키지 설치 중: {requirements_file}")
     
     cmd = [
@@ -187,6 +208,11 @@ def install_requirements(requirements_file):
         "-r", requirements_file
     ]
     
+    wheelhouse_path = find_wheelhouse(requirements_file, wheelhouse)
+    if wheelhouse_path:
+        unreal.log(f"오프라인 wheelhouse 사용: {wheelhouse_path}")
+        cmd.extend(get_wheelhouse_options(wheelhouse_path))
+    
     try:
         result = subprocess.run(cmd, capture_output=True, text=True)
         
@@ -194,6 +220,9 @@ def install_requirements(requirements_file):
             unreal.log("✓ 모든 패키지 설치 완료!")
             if result.stdout:
                 unreal.log(result.stdout)
+            missing, satisfied = find_missing_requirements(requirements_file, SITE_PACKAGES_DIR)
+            if not missing:
+                save_stamp(SITE_PACKAGES_DIR, requirements_hash, satisfied)
             return True
         else:
             unreal.log_error("✗ 일부 패키지 설치 실패!")
@@ -208,26 +237,32 @@ def install_requirements(requirements_file):
 
 def check_package_installed(package_name):
     """
-    패키지 설치 여부 확인
+    패키지 설치 여부 확인 (pip subprocess 없이 importlib.metadata로 확인)
     
     Args:
-        package_name (str): 확인할 패키지 이름
+        package_name (str): 확인할 패키지 이름 (버전 조건 포함 가능, 예: "requests>=2.28")
         
     Returns:
-        bool: 설치 여부
+        bool: 설치 여부 (버전 조건이 있으면 조건 충족 여부)
     """
-    cmd = [PYTHON_EXE, "-m", "pip", "show", package_name]
-    
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        requirement = parse_requirement(package_name)
+        installed = get_installed_distributions(SITE_PACKAGES_DIR)
+        found = installed.get(requirement["name"])
         
-        if result.returncode == 0:
-            unreal.log(f"✓ {package_name} 설치되어 있음")
-            unreal.log(result.stdout)
-            return True
-        else:
+        if found is None:
             unreal.log(f"✗ {package_name} 설치되어 있지 않음")
             return False
+        
+        version, dist_path = found
+        location = dist_path.parent if dist_path else "-"
+        if requirement["specifier"] and not requirement["specifier"].contains(version, prereleases=True):
+            unreal.log(f"✗ {package_name} 버전 조건 불일치 (설치됨: {version}, 위치: {location})")
+            return False
+        
+        unreal.log(f"✓ {package_name} 설치되어 있음")
+        unreal.log(f"Version: {version}\nLocation: {location}")
+        return True
             
     except Exception as e:
         unreal.log_error(f"확인 중 오류 발생: {e}")
@@ -346,9 +381,12 @@ install_common_packages()
 🔧 고급 기능:
 ──────────────────────────────────────────────────────────────
 
-# requirements.txt에서 설치
+# requirements.txt에서 설치 (이미 충족되면 pip 실행 안 함)
 install_requirements("D:/path/to/requirements.txt")
 
+# 오프라인 설치 (wheel 폴더만 사용, --no-index)
+install_requirements("D:/path/to/requirements.txt", wheelhouse="D:/path/to/wheelhouse")
+
 # pip 업데이트
 update_pip()
 
@@ -19,7 +19,20 @@ import subprocess
 import os
 import warnings
 import json
-import winreg
+import hashlib
+import io
+import marshal
+import shutil
+import tempfile
+import queue
+import threading
+import time
+from collections import deque
+
+try:
+    import winreg  # Windows 전용 (엔진 설치 경로 조회)
+except ImportError:
+    winreg = None
 
 # ==================== 상수 정의 ====================
 
@@ -101,6 +114,8 @@ DIALOG_ERROR_TITLE = "오류"
 # JSON 파일 설정
 JSON_INDENT = 4
 JSON_ENCODING = 'utf-8'
+CONFIG_AUTOSAVE_DELAY_MS = 1500   # 마지막 변경 후 자동 저장까지 대기 시간 (ms)
+CONFIG_REPLACE_RETRIES = 3        # 다른 프로세스가 파일을 잡고 있을 때 교체 재시도 횟수
 
 # 로그 뷰어 설정
 LOG_VIEWER_TITLE = "📋 로그 뷰어"
@@ -111,6 +126,14 @@ LOG_LEVELS = ["DEBUG", "INFO", "WARNING", "ERROR"]
 LOG_DEFAULT_LEVEL = "DEBUG"
 LOG_REFRESH_BTN = "🔄 새로고침"
 LOG_LEVEL_COMBO_WIDTH = 10
+LOG_RECORD_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+LOG_VIEWER_MAX_RECORDS = 20000                  # 로그 뷰어 링 버퍼 크기 (레코드 수)
+LOG_VIEWER_INITIAL_BYTES = 2 * 1024 * 1024      # 처음 열 때 읽을 파일 끝부분 크기
+LOG_VIEWER_POLL_MS = 1000                       # 추가된 로그 확인 간격 (ms)
+
+# 편집 기록 (실행 취소/다시 실행)
+EDIT_HISTORY_MAX_STEPS = 200
+EDIT_OPERATION_NAMES = {"insert": "추가", "delete": "삭제", "move": "이동", "update": "수정"}
 
 # 클립보드 메시지
 MSG_CLIPBOARD_SUCCESS = "📋 클립보드에 복사되었습니다!"
@@ -119,6 +142,18 @@ MSG_CLIPBOARD_ERROR = "클립보드 복사 실패: {}"
 # 검색 설정
 SEARCH_MAX_LEVELS = 10
 
+# 프로젝트/엔진 탐색 캐시 설정
+DISCOVERY_CACHE_FILE_NAME = "ta_python_tool_discovery.json"
+DISCOVERY_CACHE_VERSION = 1
+DISCOVERY_CACHE_MAX_ENTRIES = 20  # 캐시에 보관할 작업 공간(시작 폴더) 수
+
+# 퍼포스 워커 설정
+P4_EXECUTABLE = "p4"
+P4_COMMAND_TIMEOUT = 10      # 백그라운드 p4 명령 타임아웃 (초)
+P4_SYNC_WAIT_TIMEOUT = 15    # 동기 호출이 워커 결과를 기다리는 최대 시간 (초)
+P4_FSTAT_CACHE_TTL = 10.0    # fstat 결과 캐시 유지 시간 (초)
+P4_RESULT_POLL_MS = 50       # Tk 메인 스레드에서 결과를 확인하는 간격 (ms)
+
 # 공통 메시지 텍스트
 MSG_NO_CURRENT_FILE = "현재 열린 파일이 없습니다"
 MSG_FILE_NOT_FOUND_WITH_PATH = "파일을 찾을 수 없습니다:\n{}"
@@ -326,6 +361,593 @@ def ensure_file_writable(file_path):
         return False, f"예상치 못한 오류: {str(e)}"
 
 
+def write_json_atomic(file_path, data, compact=False):
+    """JSON을 임시 파일에 쓴 뒤 os.replace로 교체 (쓰는 도중 중단되어도 기존 파일 보존)
+    
+    직렬화는 한 번만 하고, 다시 파싱해서 검증하는 대신 임시 파일의 체크섬을 확인합니다.
+    
+    Args:
+        file_path: 저장할 파일 경로
+        data: 저장할 데이터
+        compact: True면 들여쓰기/공백 없이 저장
+    
+    Returns:
+        str: 기록한 내용의 sha256 체크섬
+    """
+    if compact:
+        text = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+    else:
+        text = json.dumps(data, indent=JSON_INDENT, ensure_ascii=False)
+    payload = text.encode(JSON_ENCODING)
+    checksum = hashlib.sha256(payload).hexdigest()
+    
+    directory = os.path.dirname(os.path.abspath(file_path))
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(file_path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        
+        with open(temp_path, 'rb') as f:
+            if hashlib.sha256(f.read()).hexdigest() != checksum:
+                raise OSError(f"임시 파일 체크섬 불일치: {temp_path}")
+        
+        # 기존 파일의 권한 유지
+        if os.path.exists(file_path):
+            shutil.copymode(file_path, temp_path)
+        
+        for attempt in range(CONFIG_REPLACE_RETRIES):
+            try:
+                os.replace(temp_path, file_path)
+                break
+            except PermissionError:
+                # Windows에서 다른 프로세스가 잠깐 파일을 열고 있는 경우
+                if attempt == CONFIG_REPLACE_RETRIES - 1:
+                    raise
+                time.sleep(0.1)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+    
+    return checksum
+
+
+# ==================== 로그 테일 ====================
+
+class LogTail:
+    """로그 파일 tail-follow 리더
+    
+    마지막으로 읽은 위치(offset)를 기억하여 새로 추가된 바이트만 읽고,
+    레벨을 미리 분리한 (level, line) 레코드를 크기가 제한된 링 버퍼(deque)에 보관합니다.
+    레벨 필터링은 파일을 다시 읽지 않고 이 버퍼에 대해 수행합니다.
+    
+    Args:
+        path: 로그 파일 경로
+        max_records: 링 버퍼 크기 (오래된 레코드부터 밀려남)
+        initial_bytes: 처음 열 때 파일 끝에서부터 읽을 바이트 수 (큰 로그 파일 대비)
+    """
+    
+    def __init__(self, path, max_records=LOG_VIEWER_MAX_RECORDS, initial_bytes=LOG_VIEWER_INITIAL_BYTES):
+        self.path = path
+        self.initial_bytes = initial_bytes
+        self.records = deque(maxlen=max_records)
+        self.dropped = 0        # 버퍼가 가득 차서 밀려난 레코드 누적 수
+        self.offset = None      # 다음에 읽을 위치 (None이면 아직 읽지 않음)
+        self._partial = b""     # 아직 줄바꿈이 오지 않은 마지막 줄
+        self._file_key = None   # 파일 교체 감지용 (st_dev, st_ino)
+        self._last_level = LOG_RECORD_LEVELS[0]
+    
+    def reset(self):
+        """버퍼와 읽기 위치 초기화"""
+        self.records.clear()
+        self.dropped = 0
+        self.offset = None
+        self._partial = b""
+        self._file_key = None
+    
+    def read_new(self):
+        """새로 추가된 부분만 읽어서 버퍼에 추가
+        
+        Returns:
+            tuple: (새 레코드 목록, 처음부터 다시 읽었는지 여부) - 파일이 없으면 (None, False)
+        """
+        try:
+            file_stat = os.stat(self.path)
+        except OSError:
+            return None, False
+        
+        # 파일이 잘렸거나 교체된 경우 처음부터 다시 읽기
+        was_reset = False
+        file_key = (file_stat.st_dev, file_stat.st_ino)
+        if self.offset is not None and (file_key != self._file_key or file_stat.st_size < self.offset):
+            self.reset()
+            was_reset = True
+        
+        if self.offset is not None and file_stat.st_size == self.offset:
+            return [], was_reset
+        
+        with open(self.path, 'rb') as f:
+            if self.offset is None:
+                start = max(0, file_stat.st_size - self.initial_bytes)
+                f.seek(start)
+                if start > 0:
+                    f.readline()  # 중간부터 읽으므로 잘린 첫 줄은 건너뜀
+                self._file_key = file_key
+            else:
+                f.seek(self.offset)
+            data = f.read()
+            self.offset = f.tell()
+        
+        lines = (self._partial + data).split(b"\n")
+        self._partial = lines.pop()
+        
+        new_records = [self._parse_line(line.decode('utf-8', errors='replace').rstrip("\r")) for line in lines]
+        overflow = len(self.records) + len(new_records) - self.records.maxlen
+        if overflow > 0:
+            self.dropped += overflow
+        self.records.extend(new_records)
+        return new_records, was_reset
+    
+    def _parse_line(self, line):
+        """'시간 - 이름 - 레벨 - 메시지' 형식에서 레벨 분리 (여러 줄 메시지는 앞 레코드의 레벨을 따름)"""
+        parts = line.split(" - ", 3)
+        if len(parts) == 4 and parts[2] in LOG_RECORD_LEVELS:
+            self._last_level = parts[2]
+        return self._last_level, line
+    
+    @staticmethod
+    def filter_records(records, level):
+        """레벨로 필터링한 줄 목록 (DEBUG는 전체)"""
+        if level == "DEBUG":
+            return [line for _, line in records]
+        return [line for record_level, line in records if record_level == level]
+
+
+# ==================== 편집 기록 (실행 취소/다시 실행) ====================
+
+_MISSING = object()  # 수정 기록에서 "키가 없었음"을 나타내는 값
+
+
+class EditHistory:
+    """메뉴 설정 편집 기록 (실행 취소/다시 실행)
+    
+    설정 전체를 스냅샷하지 않고 연산 단위 변경분만 저장하므로 메모리는 편집 크기에 비례합니다.
+    엔트리 dict는 복사하지 않고 config_data와 참조를 공유합니다.
+    
+    연산 (path는 config_data[menu]["items"] 기준 인덱스 경로):
+        {"op": "insert" | "delete", "menu", "path", "entry"}
+        {"op": "move", "menu", "path", "to_index", "entry"}       - 같은 부모 안에서 이동
+        {"op": "update", "menu", "path", "before", "after", "entry"} - 바뀐 키만 (없던 키는 _MISSING)
+    """
+    
+    def __init__(self, max_steps=EDIT_HISTORY_MAX_STEPS):
+        self._undo = deque(maxlen=max_steps)
+        self._redo = []
+    
+    def record(self, operation):
+        """새 편집 기록 (다시 실행 목록은 비움)"""
+        self._undo.append(operation)
+        self._redo.clear()
+    
+    def clear(self):
+        self._undo.clear()
+        self._redo.clear()
+    
+    def discard_menu(self, tool_menu_id):
+        """툴 메뉴가 삭제된 경우 해당 메뉴의 기록 제거"""
+        self._undo = deque((op for op in self._undo if op["menu"] != tool_menu_id), maxlen=self._undo.maxlen)
+        self._redo = [op for op in self._redo if op["menu"] != tool_menu_id]
+    
+    def can_undo(self):
+        return bool(self._undo)
+    
+    def can_redo(self):
+        return bool(self._redo)
+    
+    def undo(self, config_data):
+        """마지막 편집을 되돌리고 해당 연산 반환 (되돌릴 수 없으면 None)"""
+        if not self._undo:
+            return None
+        operation = self._undo.pop()
+        if not self._apply(config_data, operation, reverse=True):
+            return None
+        self._redo.append(operation)
+        return operation
+    
+    def redo(self, config_data):
+        """되돌린 편집을 다시 적용하고 해당 연산 반환 (다시 실행할 수 없으면 None)"""
+        if not self._redo:
+            return None
+        operation = self._redo.pop()
+        if not self._apply(config_data, operation, reverse=False):
+            return None
+        self._undo.append(operation)
+        return operation
+    
+    def _apply(self, config_data, operation, reverse):
+        """연산 적용 (reverse=True면 역연산) - 데이터가 기록과 맞지 않으면 기록 전체를 비움"""
+        try:
+            items = config_data[operation["menu"]]["items"]
+            for index in operation["path"][:-1]:
+                items = items[index]["items"]
+            index = operation["path"][-1]
+            kind = operation["op"]
+            
+            if kind in ("insert", "delete"):
+                if (kind == "insert") != reverse:
+                    items.insert(index, operation["entry"])
+                else:
+                    if items[index] is not operation["entry"]:
+                        raise ValueError("기록된 엔트리와 현재 데이터가 다릅니다")
+                    del items[index]
+            elif kind == "move":
+                source, target = (operation["to_index"], index) if reverse else (index, operation["to_index"])
+                items.insert(target, items.pop(source))
+            elif kind == "update":
+                entry = items[index]
+                for key, value in (operation["before"] if reverse else operation["after"]).items():
+                    if value is _MISSING:
+                        entry.pop(key, None)
+                    else:
+                        entry[key] = value
+            return True
+        except (KeyError, IndexError, TypeError, ValueError) as e:
+            # 기록되지 않은 변경으로 경로가 어긋난 경우 - 잘못 적용하지 않도록 기록을 버림
+            logger.warning(f"편집 기록을 적용할 수 없어 기록을 초기화합니다: {e}")
+            self.clear()
+            return False
+    
+    @staticmethod
+    def make_update(tool_menu_id, path, entry, before):
+        """엔트리 수정 전/후 비교로 update 연산 생성 (바뀐 키가 없으면 None)
+        
+        Args:
+            before: 수정 전 엔트리의 얕은 복사본 (dict(entry))
+        """
+        changed_before = {}
+        changed_after = {}
+        for key in set(before) | set(entry):
+            old_value = before.get(key, _MISSING)
+            new_value = entry.get(key, _MISSING)
+            if old_value is new_value or (old_value is not _MISSING and new_value is not _MISSING
+                                          and old_value == new_value):
+                continue
+            changed_before[key] = old_value
+            changed_after[key] = new_value
+        
+        if not changed_after:
+            return None
+        return {"op": "update", "menu": tool_menu_id, "path": list(path),
+                "before": changed_before, "after": changed_after, "entry": entry}
+
+
+# ==================== 퍼포스 워커 ====================
+
+class PerforceWorker:
+    """백그라운드 스레드에서 p4 명령을 실행하고 결과를 Tk 메인 스레드로 전달
+    
+    - 모든 p4 명령은 하나의 워커 스레드에서 순서대로 실행되므로 Tk 메인 스레드가 멈추지 않음
+    - `p4 -G` (marshal 출력)로 결과를 dict로 받아 텍스트 파싱 없이 사용
+    - 대기 중인 fstat 요청은 모아서 `p4 -G -x - fstat` 한 번으로 처리
+    - fstat 결과는 TTL 동안 캐시하고, edit처럼 상태를 바꾸는 명령 후에는 무효화
+    - 콜백은 root.after() 폴링으로 메인 스레드에서 호출
+    
+    Args:
+        root: Tk 루트 (None이면 워커 스레드에서 바로 콜백 호출)
+        env_provider: p4 환경 변수 dict를 반환하는 함수 (설정이 없으면 None 반환)
+        p4_executable: p4 실행 파일 경로 (테스트에서는 가짜 p4 스크립트 지정 가능)
+        cache_ttl: fstat 캐시 유지 시간 (초)
+    """
+    
+    def __init__(self, root=None, env_provider=None, p4_executable=P4_EXECUTABLE,
+                 cache_ttl=P4_FSTAT_CACHE_TTL, timeout=P4_COMMAND_TIMEOUT):
+        self.root = root
+        self.env_provider = env_provider
+        self.p4_executable = p4_executable
+        self.cache_ttl = cache_ttl
+        self.timeout = timeout
+        
+        self._jobs = queue.Queue()
+        self._results = queue.Queue()
+        self._fstat_cache = {}  # 정규화된 경로 → (조회 시각, fstat 레코드 또는 None)
+        self._cache_lock = threading.Lock()
+        self._pending = 0       # 메인 스레드로 결과가 아직 전달되지 않은 요청 수
+        self._polling = False
+        self._thread = None
+        self._stopped = False
+    
+    # ---------- 요청 API (메인 스레드) ----------
+    
+    def request_fstat(self, file_path, callback):
+        """파일 상태 비동기 조회 - callback(record, error)
+        
+        record는 fstat 결과 dict (퍼포스에 없는 파일이면 None), error는 실패 메시지 (성공 시 None)
+        """
+        hit, record = self.get_cached_fstat(file_path)
+        if hit:
+            self._submit_result(callback, (record, None))
+            return
+        self._submit({"kind": "fstat", "path": file_path, "callback": callback})
+    
+    def request_edit(self, file_path, callback):
+        """파일 체크아웃 비동기 요청 - callback(success, message)"""
+        self._submit({"kind": "edit", "path": file_path, "callback": callback})
+    
+    def request_info(self, callback):
+        """p4 info 비동기 조회 - callback(record, error)"""
+        self._submit({"kind": "info", "callback": callback})
+    
+    def fstat_sync(self, file_path, timeout=P4_SYNC_WAIT_TIMEOUT):
+        """파일 상태 동기 조회 (캐시 우선) - (record, error) 반환"""
+        hit, record = self.get_cached_fstat(file_path)
+        if hit:
+            return record, None
+        return self._wait({"kind": "fstat", "path": file_path}, timeout)
+    
+    def edit_sync(self, file_path, timeout=P4_SYNC_WAIT_TIMEOUT):
+        """파일 체크아웃 동기 요청 - (success, message) 반환"""
+        return self._wait({"kind": "edit", "path": file_path}, timeout)
+    
+    # ---------- 캐시 ----------
+    
+    @staticmethod
+    def _cache_key(file_path):
+        return os.path.normcase(os.path.abspath(file_path))
+    
+    def get_cached_fstat(self, file_path):
+        """TTL 안의 fstat 캐시 조회 - (hit, record) 반환"""
+        with self._cache_lock:
+            entry = self._fstat_cache.get(self._cache_key(file_path))
+        if entry and time.monotonic() - entry[0] < self.cache_ttl:
+            return True, entry[1]
+        return False, None
+    
+    def invalidate(self, file_path=None):
+        """fstat 캐시 무효화 (file_path가 None이면 전체)"""
+        with self._cache_lock:
+            if file_path is None:
+                self._fstat_cache.clear()
+            else:
+                self._fstat_cache.pop(self._cache_key(file_path), None)
+    
+    def shutdown(self):
+        """워커 스레드 종료 (대기 중인 요청은 버림)"""
+        self._stopped = True
+        self._jobs.put(None)
+    
+    # ---------- 내부: 스레드 간 전달 ----------
+    
+    def _ensure_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._stopped = False
+            self._thread = threading.Thread(target=self._worker_loop, name="PerforceWorker", daemon=True)
+            self._thread.start()
+    
+    def _submit(self, job):
+        self._pending += 1
+        self._ensure_thread()
+        self._jobs.put(job)
+        self._ensure_polling()
+    
+    def _submit_result(self, callback, args):
+        """캐시 적중 결과도 다른 결과와 같은 경로(after)로 전달하여 호출 순서를 일정하게 유지"""
+        self._pending += 1
+        self._results.put((callback, args))
+        self._ensure_polling()
+    
+    def _wait(self, job, timeout):
+        """워커에 요청을 넣고 결과를 기다림 (호출한 스레드에서 결과 반환)"""
+        done = threading.Event()
+        holder = {}
+        
+        def on_done(*args):
+            holder["args"] = args
+            done.set()
+        
+        job["callback"] = on_done
+        job["direct"] = True
+        self._ensure_thread()
+        self._jobs.put(job)
+        
+        if not done.wait(timeout):
+            return (None, "퍼포스 응답 대기 시간 초과") if job["kind"] != "edit" else (False, "체크아웃 타임아웃")
+        return holder["args"]
+    
+    def _deliver(self, job, *args):
+        if job.get("direct") or self.root is None:
+            self._call(job["callback"], args)
+        else:
+            self._results.put((job["callback"], args))
+    
+    def _ensure_polling(self):
+        if self.root is None:
+            return
+        if not self._polling:
+            self._polling = True
+            self.root.after(P4_RESULT_POLL_MS, self._poll_results)
+    
+    def _poll_results(self):
+        """메인 스레드: 도착한 결과의 콜백 실행 (대기 중인 요청이 없으면 폴링 중지)"""
+        while True:
+            try:
+                callback, args = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._pending -= 1
+            self._call(callback, args)
+        
+        if self._pending > 0 and not self._stopped:
+            self.root.after(P4_RESULT_POLL_MS, self._poll_results)
+        else:
+            self._polling = False
+    
+    @staticmethod
+    def _call(callback, args):
+        if callback is None:
+            return
+        try:
+            callback(*args)
+        except Exception as e:
+            logger.error(f"퍼포스 콜백 실행 중 오류: {e}")
+    
+    # ---------- 내부: 워커 스레드 ----------
+    
+    def _worker_loop(self):
+        while True:
+            job = self._jobs.get()
+            if job is None or self._stopped:
+                return
+            
+            if job["kind"] != "fstat":
+                self._process(job)
+                continue
+            
+            # 대기 중인 fstat 요청을 모아서 한 번에 처리 (다른 요청은 순서대로 뒤에 처리)
+            fstat_jobs = [job]
+            others = []
+            while True:
+                try:
+                    next_job = self._jobs.get_nowait()
+                except queue.Empty:
+                    break
+                if next_job is None:
+                    self._stopped = True
+                    break
+                (fstat_jobs if next_job["kind"] == "fstat" else others).append(next_job)
+            
+            self._process_fstat(fstat_jobs)
+            for other in others:
+                self._process(other)
+    
+    def _process(self, job):
+        try:
+            if job["kind"] == "edit":
+                records, error = self._run(["edit", job["path"]])
+                self.invalidate(job["path"])
+                if error:
+                    self._deliver(job, False, error)
+                else:
+                    failure = next((r.get("data", "") for r in records if r.get("code") == "error"), None)
+                    if failure:
+                        self._deliver(job, False, f"체크아웃 실패: {failure.strip()}")
+                    else:
+                        self._deliver(job, True, "체크아웃 성공")
+            elif job["kind"] == "info":
+                records, error = self._run(["info"])
+                self._deliver(job, records[0] if records else None, error)
+        except Exception as e:
+            logger.error(f"퍼포스 요청 처리 중 오류: {e}")
+            self._deliver(job, *((False, str(e)) if job["kind"] == "edit" else (None, str(e))))
+    
+    def _process_fstat(self, jobs):
+        paths = list(dict.fromkeys(job["path"] for job in jobs))
+        
+        # 요청이 쌓이는 동안 다른 배치가 캐시를 채웠을 수 있음
+        results = {}
+        missing = []
+        for path in paths:
+            hit, record = self.get_cached_fstat(path)
+            if hit:
+                results[path] = record
+            else:
+                missing.append(path)
+        
+        error = None
+        if missing:
+            try:
+                records, error = self._run(["fstat"], input_lines=missing)
+            except Exception as e:
+                records, error = [], str(e)
+            
+            if not error:
+                fetched = self._match_fstat_records(missing, records)
+                now = time.monotonic()
+                with self._cache_lock:
+                    for path in missing:
+                        self._fstat_cache[self._cache_key(path)] = (now, fetched[path])
+                results.update(fetched)
+        
+        for job in jobs:
+            if job["path"] in results:
+                self._deliver(job, results[job["path"]], None)
+            else:
+                self._deliver(job, None, error)
+    
+    def _match_fstat_records(self, paths, records):
+        """fstat 레코드를 요청한 경로에 대응 (퍼포스에 없는 파일은 None)"""
+        by_key = {}
+        for record in records:
+            if record.get("code") == "stat" and record.get("clientFile"):
+                by_key[self._cache_key(record["clientFile"])] = record
+        
+        matched = {}
+        for index, path in enumerate(paths):
+            record = by_key.get(self._cache_key(path))
+            if record is None and len(records) == len(paths) and records[index].get("code") == "stat":
+                # clientFile 표기가 다른 경우 (대소문자/구분자) 요청 순서로 대응
+                record = records[index]
+            matched[path] = record
+        return matched
+    
+    def _run(self, args, input_lines=None):
+        """p4 -G 실행 - (레코드 dict 목록, 오류 메시지) 반환"""
+        env = self.env_provider() if self.env_provider else os.environ.copy()
+        if env is None:
+            return [], "퍼포스 설정 없음"
+        
+        cmd = [self.p4_executable, "-G"]
+        if input_lines is not None:
+            cmd += ["-x", "-"]
+        cmd += args
+        
+        try:
+            result = subprocess.run(
+                cmd,
+                env=env,
+                input=("\n".join(input_lines) + "\n").encode("utf-8") if input_lines is not None else None,
+                capture_output=True,
+                timeout=self.timeout,
+                creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
+            )
+        except subprocess.TimeoutExpired:
+            logger.warning(f"p4 명령 타임아웃: {' '.join(args)}")
+            return [], "퍼포스 체크 타임아웃"
+        except FileNotFoundError:
+            return [], "p4 명령어 없음"
+        
+        records = self._parse_marshal_output(result.stdout)
+        if not records and result.returncode != 0:
+            message = result.stderr.decode("utf-8", errors="replace").strip()
+            return [], message or f"p4 종료 코드 {result.returncode}"
+        return records, None
+    
+    @staticmethod
+    def _parse_marshal_output(data):
+        """p4 -G 출력(marshal dict 연속)을 문자열 dict 목록으로 변환"""
+        records = []
+        stream = io.BytesIO(data)
+        while stream.tell() < len(data):
+            try:
+                record = marshal.load(stream)
+            except (EOFError, ValueError, TypeError):
+                break
+            if not isinstance(record, dict):
+                continue
+            decoded = {}
+            for key, value in record.items():
+                if isinstance(key, bytes):
+                    key = key.decode("utf-8", errors="replace")
+                if isinstance(value, bytes):
+                    value = value.decode("utf-8", errors="replace")
+                decoded[key] = value
+            records.append(decoded)
+        return records
+
+
 class TAPythonGuide:
     """TAPython 플러그인 설치 가이드 클래스"""
     
@@ -591,20 +1213,12 @@ class TAPythonTool:
         
         return p4_env
     
-    def _run_p4_command(self, cmd, p4_settings, timeout=2):
-        """퍼포스 명령 실행 (공통 로직)"""
-        p4_env = self._setup_p4_environment(p4_settings)
-        
-        result = subprocess.run(
-            cmd,
-            env=p4_env,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
-        )
-        
-        return result
+    def _get_p4_environment(self):
+        """퍼포스 워커용 환경 변수 (퍼포스 설정이 없으면 None)"""
+        p4_settings = self._read_perforce_settings()
+        if not p4_settings:
+            return None
+        return self._setup_p4_environment(p4_settings)
     
     # ==================== 초기화 ====================
     
@@ -613,6 +1227,9 @@ class TAPythonTool:
         self.root.title("🐍 TA Python Tool")
         self.root.geometry("1000x700")
         
+        # 퍼포스 명령은 백그라운드 워커에서 실행 (결과는 after()로 메인 스레드에 전달)
+        self.p4_worker = PerforceWorker(self.root, env_provider=self._get_p4_environment)
+        
         # UI 스타일 설정 (가장 먼저 설정)
         self.style = setup_ui_styles()
         
@@ -622,6 +1239,11 @@ class TAPythonTool:
         self.config_data = {}
         self.config_file_path = ""
         self.has_unsaved_changes = False  # 저장하지 않은 변경사항 추적
+        self._save_in_progress = False  # 퍼포스 체크아웃 대기 중 중복 저장 방지
+        self._autosave_after_id = None  # 대기 중인 자동 저장 (after ID)
+        self._saved_signature = None    # 마지막 저장 (경로, 체크섬, mtime, 크기) - 같은 내용 재저장 생략
+        self.autosave_var = tk.BooleanVar(master=self.root, value=False)
+        self.compact_format_var = tk.BooleanVar(master=self.root, value=False)
         
         # 클립보드 관련 변수들
         self.clipboard_data = None  # 복사/잘라낸 엔트리 데이터
@@ -629,6 +1251,9 @@ class TAPythonTool:
         self.clipboard_source_tool_menu = None  # 원본 툴 메뉴 ID
         self.clipboard_source_path = None  # 원본 엔트리 경로
         
+        # 편집 기록 (실행 취소/다시 실행)
+        self.edit_history = EditHistory()
+        
         # 인터페이스 상태 초기화
         self.guide_interface = None
         self.edit_interface = None
@@ -695,44 +1320,18 @@ class TAPythonTool:
         return False
 
     def _search_for_config_file(self):
-        """설정 파일 탐색"""
-        current_path = os.path.abspath(__file__)
-        logger.info(f"파일 탐색 시작 경로: {current_path}")
-        
-        # 상위 폴더로 올라가면서 목표 파일 찾기
-        for level in range(SEARCH_MAX_LEVELS):
-            current_path = os.path.dirname(current_path)
-            logger.debug(f"탐색 중 ({level+1}/{SEARCH_MAX_LEVELS}): {current_path}")
-            
-            # 언리얼 프로젝트 확인
-            uproject_result = self._check_unreal_project(current_path)
-            if uproject_result is not None:
-                return uproject_result
-                
-            # 루트 디렉토리에 도달하면 중단
-            if current_path == os.path.dirname(current_path):
-                break
+        """설정 파일 탐색 (프로젝트 탐색 결과가 캐시되어 있으면 상위 폴더 탐색 생략)"""
+        start_dir = os.path.dirname(os.path.abspath(__file__))
+        logger.info(f"파일 탐색 시작 경로: {start_dir}")
+        
+        discovery = discover_project(start_dir)
+        if discovery["project_dir"]:
+            return self._check_tapython_config(discovery["project_dir"])
         
         # 언리얼 프로젝트를 찾지 못한 경우
         logger.warning("언리얼 프로젝트를 찾을 수 없습니다.")
         return False
 
-    def _check_unreal_project(self, path):
-        """주어진 경로에서 언리얼 프로젝트 확인"""
-        try:
-            items = os.listdir(path)
-            has_uproject = any(item.endswith('.uproject') for item in items)
-            
-            if has_uproject:
-                uproject_files = [item for item in items if item.endswith('.uproject')]
-                logger.info(f"언리얼 프로젝트 발견: {path}, 파일: {uproject_files}")
-                return self._check_tapython_config(path)
-                
-        except (OSError, PermissionError):
-            logger.debug(f"경로 접근 불가: {path}")
-            
-        return None
-
     def _check_tapython_config(self, project_path):
         """TAPython 설정 파일 존재 확인"""
         target_config_path = os.path.join(project_path, *TAPYTHON_PATH)
@@ -798,6 +1397,15 @@ class TAPythonTool:
         # 레벨 변경 시 자동 새로고침
         level_combo.bind("<<ComboboxSelected>>", 
                         lambda e: self._refresh_log_viewer(text_widget, level_var.get()))
+        
+        # 추가되는 로그를 주기적으로 따라가기 (다이얼로그가 닫히면 중지)
+        def follow():
+            if not text_widget.winfo_exists():
+                return
+            self._refresh_log_viewer(text_widget, level_var.get())
+            self.root.after(LOG_VIEWER_POLL_MS, follow)
+        
+        self.root.after(LOG_VIEWER_POLL_MS, follow)
 
     def _create_log_level_controls(self, parent):
         """로그 레벨 선택 컨트롤 생성"""
@@ -844,43 +1452,69 @@ class TAPythonTool:
             self._show_error(MSG_CLIPBOARD_ERROR.format(str(e)), DIALOG_ERROR_TITLE)
 
     def _refresh_log_viewer(self, text_widget, level):
-        """로그 뷰어 새로고침"""
+        """로그 뷰어 새로고침 (새로 추가된 로그만 읽어서 이어 붙임)
+        
+        텍스트 위젯마다 LogTail을 하나씩 두고, 레벨이 바뀌었거나 버퍼에서 밀려난 레코드가
+        있을 때만 버퍼 전체로 다시 그립니다.
+        """
         try:
-            text_widget.configure(state=tk.NORMAL)
-            text_widget.delete(1.0, tk.END)
+            tail = getattr(text_widget, 'log_tail', None)
+            if tail is None:
+                import tempfile
+                tail = LogTail(os.path.join(tempfile.gettempdir(), LOG_FILE_NAME))
+                text_widget.log_tail = tail
+                text_widget.log_view_state = {'level': None, 'dropped': 0, 'shown': 0}
+            view_state = text_widget.log_view_state
+            
+            new_records, was_reset = tail.read_new()
+            
+            if new_records is None:
+                tail.reset()
+                self._set_log_viewer_text(text_widget, f"로그 파일을 찾을 수 없습니다: {tail.path}")
+                view_state.update(level=None, shown=0)
+                return
             
-            # 로그 파일 읽기
-            import tempfile
-            temp_dir = tempfile.gettempdir()
-            log_file = os.path.join(temp_dir, LOG_FILE_NAME)
+            full_render = (was_reset or level != view_state['level'] or
+                           tail.dropped != view_state['dropped'] or
+                           (view_state['shown'] == 0 and new_records))
+            if not full_render and not new_records:
+                return
             
-            if os.path.exists(log_file):
-                with open(log_file, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-                
-                # 레벨 필터링
-                filtered_lines = []
-                for line in lines:
-                    if level == "DEBUG" or level in line:
-                        filtered_lines.append(line)
-                
-                if filtered_lines:
-                    text_widget.insert(tk.END, "".join(filtered_lines))
+            # 맨 아래를 보고 있을 때만 계속 따라감
+            at_bottom = text_widget.yview()[1] >= 0.999
+            
+            if full_render:
+                lines = LogTail.filter_records(tail.records, level)
+                if lines:
+                    self._set_log_viewer_text(text_widget, "\n".join(lines) + "\n")
                 else:
-                    text_widget.insert(tk.END, f"선택된 레벨 '{level}'에 해당하는 로그가 없습니다.")
+                    self._set_log_viewer_text(text_widget, f"선택된 레벨 '{level}'에 해당하는 로그가 없습니다.")
+                view_state.update(level=level, dropped=tail.dropped, shown=len(lines))
+                at_bottom = True
             else:
-                text_widget.insert(tk.END, f"로그 파일을 찾을 수 없습니다: {log_file}")
+                lines = LogTail.filter_records(new_records, level)
+                if lines:
+                    text_widget.configure(state=tk.NORMAL)
+                    text_widget.insert(tk.END, "\n".join(lines) + "\n")
+                    text_widget.configure(state=tk.DISABLED)
+                    view_state['shown'] += len(lines)
             
-            text_widget.configure(state=tk.DISABLED)
-            # 맨 아래로 스크롤
-            text_widget.see(tk.END)
+            if at_bottom:
+                # 맨 아래로 스크롤
+                text_widget.see(tk.END)
             
         except Exception as e:
             logger.error(f"로그 뷰어 새로고침 중 오류: {e}")
-            text_widget.configure(state=tk.NORMAL)
-            text_widget.delete(1.0, tk.END)
-            text_widget.insert(tk.END, f"로그 로드 중 오류: {str(e)}")
-            text_widget.configure(state=tk.DISABLED)
+            self._set_log_viewer_text(text_widget, f"로그 로드 중 오류: {str(e)}")
+            if hasattr(text_widget, 'log_view_state'):
+                text_widget.log_view_state['level'] = None  # 다음 새로고침 때 전체 다시 그리기
+    
+    def _set_log_viewer_text(self, text_widget, text):
+        """로그 텍스트 위젯 내용 교체"""
+        text_widget.configure(state=tk.NORMAL)
+        text_widget.delete(1.0, tk.END)
+        text_widget.insert(tk.END, text)
+        text_widget.configure(state=tk.DISABLED)
 
     # === 유틸리티 메서드들 ===
     def _show_message(self, msg_type, title, message):
@@ -1166,7 +1800,26 @@ class TAPythonTool:
                 # 텍스트 삽입
                 text_widget.insert("1.0", "\n".join(info_lines))
                 text_widget.configure(state=tk.DISABLED)
-            
+
+                # 서버 정보는 퍼포스 워커에서 조회하여 도착하면 추가
+                def on_info(record, error):
+                    if not text_widget.winfo_exists():
+                        return
+
+                    server_lines = ["", "─" * 60, "  서버 정보 (p4 info)", "─" * 60, ""]
+                    if error:
+                        server_lines.append(f"조회 실패: {error}")
+                    elif record:
+                        for key in ("serverAddress", "serverVersion", "userName", "clientName", "clientRoot"):
+                            if key in record:
+                                server_lines.append(f"{key}: {record[key]}")
+
+                    text_widget.configure(state=tk.NORMAL)
+                    text_widget.insert(tk.END, "\n".join(server_lines))
+                    text_widget.configure(state=tk.DISABLED)
+
+                self.p4_worker.request_info(on_info)
+
             # 버튼 프레임
             button_frame = ttk.Frame(main_frame)
             button_frame.pack(fill=tk.X, pady=(20, 0))
@@ -1234,18 +1887,11 @@ class TAPythonTool:
             result_text = tk.Text(status_frame, height=10, wrap=tk.WORD, 
                                  font=FONT_CODE, bg="#f0f0f0")
             
-            # 비동기로 퍼포스 체크 실행
-            def check_status():
-                try:
-                    is_in_perforce, p4_status = self._check_perforce_file(self.config_file_path)
-                    
-                    # UI 업데이트 (메인 스레드에서)
-                    dialog.after(0, lambda: update_status_ui(is_in_perforce, p4_status))
-                    
-                except Exception as e:
-                    dialog.after(0, lambda: update_status_ui(False, f"오류: {str(e)}"))
-            
-            def update_status_ui(is_in_perforce, p4_status):
+            def update_status_ui(is_in_perforce, p4_status, record):
+                # 결과가 오기 전에 다이얼로그가 닫힌 경우
+                if not dialog.winfo_exists():
+                    return
+                
                 progress_label.pack_forget()
                 result_text.pack(fill=tk.BOTH, expand=True)
                 
@@ -1274,32 +1920,21 @@ class TAPythonTool:
                 result_lines.append("")
                 result_lines.append("─" * 60)
                 
-                # 퍼포스 명령어 실행 (p4 fstat 상세 정보)
-                if is_in_perforce:
+                # p4 fstat 상세 정보 (같은 조회 결과 재사용)
+                if is_in_perforce and record:
                     result_lines.append("  상세 정보")
                     result_lines.append("─" * 60)
                     result_lines.append("")
                     
-                    try:
-                        p4_settings = self._read_perforce_settings()
-                        if p4_settings:
-                            cmd = ['p4', 'fstat', self.config_file_path]
-                            result = self._run_p4_command(cmd, p4_settings, timeout=3)
-                            
-                            if result.returncode == 0:
-                                result_lines.append(result.stdout)
-                            else:
-                                result_lines.append("상세 정보를 가져올 수 없습니다.")
-                    except Exception as e:
-                        result_lines.append(f"상세 정보 조회 실패: {str(e)}")
+                    for key, value in record.items():
+                        if key != "code":
+                            result_lines.append(f"... {key} {value}")
                 
                 result_text.insert("1.0", "\n".join(result_lines))
                 result_text.configure(state=tk.DISABLED)
             
-            # 백그라운드에서 체크 시작
-            import threading
-            thread = threading.Thread(target=check_status, daemon=True)
-            thread.start()
+            # 퍼포스 워커에서 체크 (결과는 메인 스레드에서 update_status_ui로 전달)
+            self._check_perforce_file_async(self.config_file_path, update_status_ui)
             
             # 버튼 프레임
             button_frame = ttk.Frame(main_frame)
@@ -1395,8 +2030,8 @@ class TAPythonTool:
                 return bool(self.config_file_path)  # 저장이 성공했으면 True
             else:
                 # 기존 파일에 저장
-                with open(self.config_file_path, 'w', encoding='utf-8') as f:
-                    json.dump(self.config_data, f, indent=4, ensure_ascii=False)
+                self._cancel_autosave()
+                self._write_config_atomic(self.config_file_path)
                 self.has_unsaved_changes = False
                 return True
         except PermissionError:
@@ -1415,13 +2050,80 @@ class TAPythonTool:
             self.has_unsaved_changes = True
             self.update_title()
             self.update_save_button_state()
+        
+        # 연속된 편집은 마지막 변경 후 한 번만 자동 저장
+        self._schedule_autosave()
     
     def mark_as_saved(self):
         """저장됨 표시"""
+        self._cancel_autosave()
         self.has_unsaved_changes = False
         self.update_title()
         self.update_save_button_state()
     
+    def _schedule_autosave(self):
+        """자동 저장 예약 (이미 예약되어 있으면 다시 미룸)"""
+        if not self.autosave_var.get() or not self.config_file_path:
+            return
+        self._cancel_autosave()
+        self._autosave_after_id = self.root.after(CONFIG_AUTOSAVE_DELAY_MS, self._run_autosave)
+    
+    def _cancel_autosave(self):
+        """예약된 자동 저장 취소"""
+        if self._autosave_after_id is not None:
+            try:
+                self.root.after_cancel(self._autosave_after_id)
+            except tk.TclError:
+                pass
+            self._autosave_after_id = None
+    
+    def _run_autosave(self):
+        """예약된 자동 저장 실행"""
+        self._autosave_after_id = None
+        if not self.has_unsaved_changes or not self.config_file_path:
+            return
+        if self._save_in_progress:
+            # 체크아웃을 기다리는 저장이 끝난 뒤 다시 시도
+            self._schedule_autosave()
+            return
+        self.save_config()
+    
+    def _on_autosave_toggled(self):
+        """자동 저장 메뉴 토글"""
+        if self.autosave_var.get():
+            self.update_status(f"⏱️ 자동 저장 켜짐 (마지막 변경 {CONFIG_AUTOSAVE_DELAY_MS / 1000:g}초 후 저장)")
+            if self.has_unsaved_changes:
+                self._schedule_autosave()
+        else:
+            self._cancel_autosave()
+            self.update_status("⏱️ 자동 저장 꺼짐")
+    
+    def _write_config_atomic(self, file_path):
+        """config_data를 원자적으로 저장 (마지막 저장과 내용/파일이 같으면 쓰지 않음)
+        
+        Returns:
+            bool: 실제로 파일을 썼으면 True
+        """
+        compact = self.compact_format_var.get()
+        if self._saved_signature and self._saved_signature[0] == file_path:
+            # 직렬화 결과가 같고 그 사이 파일이 바뀌지 않았으면 쓰기 생략
+            text = (json.dumps(self.config_data, ensure_ascii=False, separators=(',', ':')) if compact
+                    else json.dumps(self.config_data, indent=JSON_INDENT, ensure_ascii=False))
+            checksum = hashlib.sha256(text.encode(JSON_ENCODING)).hexdigest()
+            try:
+                file_stat = os.stat(file_path)
+                if self._saved_signature[1:] == (checksum, file_stat.st_mtime_ns, file_stat.st_size):
+                    logger.debug("저장할 내용이 마지막 저장과 같음 - 쓰기 생략")
+                    return False
+            except OSError:
+                pass
+        
+        checksum = write_json_atomic(file_path, self.config_data, compact=compact)
+        file_stat = os.stat(file_path)
+        self._saved_signature = (file_path, checksum, file_stat.st_mtime_ns, file_stat.st_size)
+        logger.debug(f"파일 저장 완료 (sha256: {checksum[:12]})")
+        return True
+    
     def update_save_button_state(self):
         """저장 버튼 상태 업데이트"""
         if hasattr(self, 'save_button'):
@@ -1825,6 +2527,7 @@ class TAPythonTool:
             # config_data에서 제거
             if tool_menu_id in self.config_data:
                 del self.config_data[tool_menu_id]
+            self.edit_history.discard_menu(tool_menu_id)
             
             # UI 초기화
             if self.current_tool_menu_id == tool_menu_id:
@@ -2098,8 +2801,10 @@ class TAPythonTool:
                     new_name = self._get_unique_name(target_items, original_name)
                     new_entry['name'] = new_name
                 
-                # UI 새로고침
-                self.refresh_tab(self.current_tool_menu_id)
+                self._record_insert(self.current_tool_menu_id, new_entry)
+                
+                # UI 새로고침 (붙여넣은 엔트리 선택)
+                self.refresh_tab(self.current_tool_menu_id, select_entry=new_entry)
                 self.mark_as_modified()
                 
                 entry_name = new_entry.get('name', '알 수 없음')
@@ -2234,6 +2939,10 @@ class TAPythonTool:
         file_menu.add_command(label="💾 저장", command=self.save_config)
         file_menu.add_command(label="📄 다른 이름으로 저장", command=self.save_as_config)
         file_menu.add_separator()
+        file_menu.add_checkbutton(label="⏱️ 자동 저장", variable=self.autosave_var,
+                                  command=self._on_autosave_toggled)
+        file_menu.add_checkbutton(label="🗜️ 압축 형식으로 저장", variable=self.compact_format_var)
+        file_menu.add_separator()
         file_menu.add_command(label="🔄 새로고침", command=self.reload_config)
         file_menu.add_separator()
         file_menu.add_command(label="📉 최소화", command=lambda: self.root.iconify())
@@ -2241,6 +2950,9 @@ class TAPythonTool:
         # 편집 메뉴
         edit_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="✏️ 편집", menu=edit_menu)
+        edit_menu.add_command(label="↩️ 실행 취소", command=self.undo_edit)
+        edit_menu.add_command(label="↪️ 다시 실행", command=self.redo_edit)
+        edit_menu.add_separator()
         edit_menu.add_command(label="📋 복사", command=self.copy_entry)
         edit_menu.add_command(label="✄ 잘라내기", command=self.cut_entry)
         edit_menu.add_command(label="📋 붙여넣기", command=self.paste_entry)
@@ -3293,6 +4005,7 @@ JSON 파일에는 UI 레이아웃과 동작이 정의되어 있어야 합니다.
             
             with open(file_path, 'r', encoding='utf-8') as f:
                 self.config_data = json.load(f)
+            self.edit_history.clear()
             self.config_file_path = file_path
             
             logger.debug(f"로드된 config_data 키들: {list(self.config_data.keys())}")
@@ -3351,13 +4064,30 @@ JSON 파일에는 UI 레이아웃과 동작이 정의되어 있어야 합니다.
             self.save_as_config()
             return
         
+        if self._save_in_progress:
+            return  # 퍼포스 체크아웃을 기다리는 중
+        
+        logger.debug(f"저장하려는 파일 경로: {self.config_file_path}")
+        self._save_in_progress = True
+        file_path = self.config_file_path
+        
+        def on_writable(can_write):
+            self._save_in_progress = False
+            # 쓰기 권한 확보 실패시, 또는 기다리는 동안 다른 파일을 연 경우 저장 중단
+            if can_write and file_path == self.config_file_path:
+                self._write_config_file()
+        
+        # Perforce 상태 확인 및 체크아웃 (백그라운드 - UI는 멈추지 않음)
+        try:
+            self._ensure_file_writable_async(file_path, on_writable)
+        except Exception as e:
+            self._save_in_progress = False
+            logger.error(f"파일 쓰기 권한 확인 중 오류: {e}")
+            self._show_error(f"파일 쓰기 권한을 확인할 수 없습니다:\n{str(e)}", "오류")
+    
+    def _write_config_file(self):
+        """config_data를 현재 파일에 기록 (쓰기 권한 확보 후 호출)"""
         try:
-            logger.debug(f"저장하려는 파일 경로: {self.config_file_path}")
-            
-            # Perforce 상태 확인 및 체크아웃
-            if not self._ensure_file_writable(self.config_file_path):
-                return  # 쓰기 권한 확보 실패시 저장 중단
-            
             # 저장 전에 JSON 데이터 확인 (디버그) - 메모리 효율적
             logger.debug("저장 중인 config 데이터 샘플:")
             count = 0
@@ -3371,22 +4101,8 @@ JSON 파일에는 UI 레이아웃과 동작이 정의되어 있어야 합니다.
                         logger.debug(f"    [{i}] {item.get('name', '이름없음')}: enabled={enabled_status}")
                 count += 1
             
-            # 파일에 저장
-            with open(self.config_file_path, 'w', encoding='utf-8') as f:
-                json.dump(self.config_data, f, indent=4, ensure_ascii=False)
-            
-            logger.debug("파일 저장 완료")
-            
-            # 저장 후 파일 다시 읽어서 검증
-            with open(self.config_file_path, 'r', encoding='utf-8') as f:
-                verification_data = json.load(f)
-            
-            logger.debug("저장 후 검증 - 파일에서 다시 읽은 데이터:")
-            for category, data in verification_data.items():
-                if "items" in data and data["items"]:
-                    first_item = data["items"][0]
-                    logger.debug(f"  첫 번째 아이템: {first_item}")
-                    break
+            # 임시 파일에 쓴 뒤 교체 (체크섬으로 검증 - 다시 읽어서 파싱하지 않음)
+            self._write_config_atomic(self.config_file_path)
                     
             self.mark_as_saved()  # 저장 후 저장됨 상태로 설정
             self.update_status("💾 설정이 저장되었습니다!")
@@ -3400,7 +4116,7 @@ JSON 파일에는 UI 레이아웃과 동작이 정의되어 있어야 합니다.
             logger.error(f"파일 시스템 오류: {e}")
             self._show_error(error_msg, "시스템 오류")
             self.update_status("❌ 파일 시스템 오류", auto_clear=False)
-        except json.JSONDecodeError as e:
+        except (TypeError, ValueError) as e:
             error_msg = f"JSON 데이터 처리 오류: {str(e)}"
             logger.error(f"JSON 처리 오류: {e}")
             self._show_error(error_msg, "데이터 오류")
@@ -3426,8 +4142,7 @@ JSON 파일에는 UI 레이아웃과 동작이 정의되어 있어야 합니다.
         )
         if file_path:
             try:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(self.config_data, f, indent=4, ensure_ascii=False)
+                self._write_config_atomic(file_path)
                 self.config_file_path = file_path
                 # 전체 경로 표시 (길면 축약)
                 self.update_file_label(file_path)
@@ -3457,8 +4172,16 @@ JSON 파일에는 UI 레이아웃과 동작이 정의되어 있어야 합니다.
         if self.current_tool_menu_id and self.current_widgets:
             self.refresh_tab(self.current_tool_menu_id)
     
-    def refresh_tab(self, tool_menu_id):
-        """특정 탭 새로고침"""
+    def refresh_tab(self, tool_menu_id, select_entry=None):
+        """특정 탭 새로고침
+
+        트리를 지우고 다시 만드는 대신 데이터와 비교하여 추가/이동/변경/삭제된
+        노드만 반영하므로 펼침 상태와 선택이 유지됩니다.
+
+        Args:
+            tool_menu_id: 새로고침할 툴 메뉴 ID
+            select_entry: 새로고침 후 선택할 엔트리 데이터 (dict, 선택 사항)
+        """
         # 현재 선택된 카테고리인지 확인
         if tool_menu_id != self.current_tool_menu_id:
             return
@@ -3468,14 +4191,23 @@ JSON 파일에는 UI 레이아웃과 동작이 정의되어 있어야 합니다.
         
         treeview = self.current_menu_treeview
         
-        # 트리뷰 초기화
-        for item in treeview.get_children():
-            treeview.delete(item)
-        
-        # 데이터가 있는 경우 추가
+        # 데이터와 트리뷰 동기화 (변경된 노드만 갱신)
+        items = []
         if tool_menu_id in self.config_data and "items" in self.config_data[tool_menu_id]:
             items = self.config_data[tool_menu_id]["items"]
-            self._populate_tree_items(treeview, "", items)
+        self._sync_tree_items(treeview, "", items)
+        
+        if select_entry is not None:
+            tree_item = self._get_tree_iid(select_entry)
+            if treeview.exists(tree_item):
+                treeview.selection_set(tree_item)
+                treeview.focus(tree_item)
+                treeview.see(tree_item)
+        
+        # 선택된 엔트리가 남아 있으면 편집 폼을 해당 엔트리로 다시 채움
+        if treeview.selection():
+            self.on_item_select(tool_menu_id)
+            return
         
         # 편집 폼 초기화 (안전하게 처리)
         try:
@@ -3498,20 +4230,56 @@ JSON 파일에는 UI 레이아웃과 동작이 정의되어 있어야 합니다.
         except Exception as e:
             logger.error(f"편집 폼 초기화 중 오류: {e}")
     
-    def _populate_tree_items(self, treeview, parent, items):
-        """트리뷰에 아이템들을 추가 (재귀적으로 서브메뉴 처리)"""
+    def _get_tree_iid(self, item):
+        """엔트리 데이터에 대응하는 트리 아이템 ID (같은 dict는 항상 같은 노드)"""
+        return f"entry_{id(item)}"
+    
+    def _sync_tree_items(self, treeview, parent, items):
+        """트리뷰 노드를 데이터에 맞게 갱신 (재귀적으로 서브메뉴 처리)
+        
+        노드 ID가 엔트리 dict에 묶여 있으므로 이동된 엔트리는 move()로 옮기고,
+        이름/타입이 바뀐 엔트리만 item()으로 갱신하며, 없어진 노드만 삭제합니다.
+        """
+        wanted = []
+        for item in items:
+            tree_item = self._get_tree_iid(item)
+            if tree_item in wanted:
+                # 같은 dict가 두 번 들어있는 경우 (정상 데이터에서는 발생하지 않음)
+                logger.warning(f"중복된 엔트리 참조를 건너뜀: {item.get('name', '')}")
+                continue
+            wanted.append(tree_item)
+        
+        # 데이터에서 사라진 노드 삭제
+        wanted_set = set(wanted)
+        for tree_item in treeview.get_children(parent):
+            if tree_item not in wanted_set:
+                treeview.delete(tree_item)
+        
         for i, item in enumerate(items):
+            tree_item = self._get_tree_iid(item)
+            if tree_item not in wanted_set:
+                continue
+            
             name = item.get("name", f"Item {i}")
             
             # 엔트리 타입 결정 (헬퍼 메서드 사용)
             item_type, display_name = self._get_entry_type_display(item, name)
             
-            # 트리 아이템 추가
-            tree_item = treeview.insert(parent, tk.END, text=display_name, values=(item_type,))
+            if treeview.exists(tree_item):
+                # 위치가 바뀐 노드만 이동 (펼침 상태/선택 유지)
+                if treeview.parent(tree_item) != parent or treeview.index(tree_item) != i:
+                    treeview.move(tree_item, parent, i)
+                # 표시 내용이 바뀐 노드만 갱신
+                if (treeview.item(tree_item, "text") != display_name or
+                        tuple(treeview.item(tree_item, "values")) != (item_type,)):
+                    treeview.item(tree_item, text=display_name, values=(item_type,))
+            else:
+                treeview.insert(parent, i, iid=tree_item, text=display_name, values=(item_type,))
             
-            # 서브메뉴가 있는 경우 재귀적으로 추가
-            if "items" in item and item["items"]:
-                self._populate_tree_items(treeview, tree_item, item["items"])
+            # 서브메뉴 동기화 (서브메뉴가 비워진 경우 남은 노드 삭제)
+            sub_items = item.get("items") or []
+            if sub_items or treeview.get_children(tree_item):
+                self._sync_tree_items(treeview, tree_item, sub_items)
     
     def clear_edit_form(self, tool_menu_id):
         """편집 폼 초기화"""
@@ -3857,6 +4625,9 @@ JSON 파일에는 UI 레이아웃과 동작이 정의되어 있어야 합니다.
                 self._show_warning("이름은 비워둘 수 없습니다.", "경고")
                 return
             
+            # 실행 취소용 수정 전 상태 (얕은 복사 - 바뀐 키만 기록됨)
+            before = dict(item_data)
+            
             item_data["name"] = name
             
             # 타입별 데이터 업데이트
@@ -3872,6 +4643,11 @@ JSON 파일에는 UI 레이아웃과 동작이 정의되어 있어야 합니다.
             
             logger.debug(f"업데이트 후 엔트리 데이터: {item_data}")
             
+            index_path = self._find_entry_index_path(tool_menu_id, item_data)
+            operation = EditHistory.make_update(tool_menu_id, index_path, item_data, before) if index_path else None
+            if operation:
+                self.edit_history.record(operation)
+            
             # 트리뷰 업데이트
             item_type, display_name = self._get_entry_type_display(item_data, name)
             treeview.item(selected_item, text=display_name, values=(item_type,))
@@ -4059,6 +4835,7 @@ JSON 파일에는 UI 레이아웃과 동작이 정의되어 있어야 합니다.
         
         # 부모 컨테이너와 인덱스 찾기
         current_items = self.config_data[tool_menu_id]["items"]
+        index_path = []
         
         for i, tree_id in enumerate(path[:-1]):
             index = self._get_tree_item_index(treeview, tree_id)
@@ -4070,11 +4847,15 @@ JSON 파일에는 UI 레이아웃과 동작이 정의되어 있어야 합니다.
                 return False
             
             current_items = current_item["items"]
+            index_path.append(index)
         
         # 마지막 엔트리 삭제
         final_index = self._get_tree_item_index(treeview, path[-1])
         if final_index < len(current_items):
+            entry = current_items[final_index]
             del current_items[final_index]
+            self.edit_history.record({"op": "delete", "menu": tool_menu_id,
+                                      "path": index_path + [final_index], "entry": entry})
             return True
         
         return False
@@ -4103,18 +4884,10 @@ JSON 파일에는 UI 레이아웃과 동작이 정의되어 있어야 합니다.
         if current_index > 0:
             # 데이터에서 이동
             if self._move_entry_in_data(treeview, selected_item, tool_menu_id, -1):
-                # 선택된 엔트리의 경로를 기억
-                item_path = self._get_entry_path(treeview, selected_item)
-                
+                # 노드가 제자리에서 이동하므로 선택/펼침 상태가 그대로 유지됨
                 self.refresh_tab(tool_menu_id)
                 self.mark_as_modified()  # 변경사항 추적
-                
-                # 이동된 위치에서 엔트리를 다시 선택
-                if item_path:
-                    moved_item = self._find_entry_by_path(treeview, item_path, current_index - 1)
-                    if moved_item:
-                        treeview.selection_set(moved_item)
-                        self.on_item_select(tool_menu_id)
+                treeview.see(selected_item)
     
     def move_entry_down(self, tool_menu_id):
         """엔트리 아래로 이동"""
@@ -4140,18 +4913,10 @@ JSON 파일에는 UI 레이아웃과 동작이 정의되어 있어야 합니다.
         if current_index < len(siblings) - 1:
             # 데이터에서 이동
             if self._move_entry_in_data(treeview, selected_item, tool_menu_id, 1):
-                # 선택된 엔트리의 경로를 기억
-                item_path = self._get_entry_path(treeview, selected_item)
-                
+                # 노드가 제자리에서 이동하므로 선택/펼침 상태가 그대로 유지됨
                 self.refresh_tab(tool_menu_id)
                 self.mark_as_modified()  # 변경사항 추적
-                
-                # 이동된 위치에서 엔트리를 다시 선택
-                if item_path:
-                    moved_item = self._find_entry_by_path(treeview, item_path, current_index + 1)
-                    if moved_item:
-                        treeview.selection_set(moved_item)
-                        self.on_item_select(tool_menu_id)
+                treeview.see(selected_item)
     
     def _get_entry_path(self, treeview, tree_item):
         """트리 엔트리의 경로를 텍스트로 가져오기"""
@@ -4205,6 +4970,7 @@ JSON 파일에는 UI 레이아웃과 동작이 정의되어 있어야 합니다.
         
         # 부모 컨테이너 찾기
         current_items = self.config_data[tool_menu_id]["items"]
+        index_path = []
         
         for i, tree_id in enumerate(path[:-1]):
             index = self._get_tree_item_index(treeview, tree_id)
@@ -4216,6 +4982,7 @@ JSON 파일에는 UI 레이아웃과 동작이 정의되어 있어야 합니다.
                 return False
             
             current_items = current_item["items"]
+            index_path.append(index)
         
         # 마지막 엔트리 이동
         final_index = self._get_tree_item_index(treeview, path[-1])
@@ -4225,10 +4992,61 @@ JSON 파일에는 UI 레이아웃과 동작이 정의되어 있어야 합니다.
             # 엔트리 교환
             current_items[final_index], current_items[new_index] = \
                 current_items[new_index], current_items[final_index]
+            self.edit_history.record({"op": "move", "menu": tool_menu_id, "path": index_path + [final_index],
+                                      "to_index": new_index, "entry": current_items[new_index]})
             return True
         
         return False
     
+    # ==================== 실행 취소/다시 실행 ====================
+    
+    def _find_entry_index_path(self, tool_menu_id, entry):
+        """엔트리 dict의 인덱스 경로 (config_data[tool_menu_id]["items"] 기준, 없으면 None)"""
+        def search(items, prefix):
+            for index, item in enumerate(items):
+                if item is entry:
+                    return prefix + [index]
+                if item.get("items"):
+                    found = search(item["items"], prefix + [index])
+                    if found:
+                        return found
+            return None
+        
+        return search(self.config_data.get(tool_menu_id, {}).get("items", []), [])
+    
+    def _record_insert(self, tool_menu_id, entry):
+        """데이터에 추가된 엔트리를 편집 기록에 추가"""
+        index_path = self._find_entry_index_path(tool_menu_id, entry)
+        if index_path:
+            self.edit_history.record({"op": "insert", "menu": tool_menu_id, "path": index_path, "entry": entry})
+    
+    def undo_edit(self):
+        """마지막 편집 되돌리기"""
+        operation = self.edit_history.undo(self.config_data)
+        self._apply_history_result(operation, "↩️ 실행 취소", "되돌릴 편집이 없습니다")
+    
+    def redo_edit(self):
+        """되돌린 편집 다시 실행"""
+        operation = self.edit_history.redo(self.config_data)
+        self._apply_history_result(operation, "↪️ 다시 실행", "다시 실행할 편집이 없습니다")
+    
+    def _apply_history_result(self, operation, label, empty_message):
+        """실행 취소/다시 실행 후 트리 동기화 및 상태 표시"""
+        if operation is None:
+            self.update_status(f"{label}: {empty_message}")
+            return
+        
+        self.mark_as_modified()
+        
+        # 변경된 노드만 트리에 반영 (삭제가 취소된 엔트리 등은 다시 선택)
+        tool_menu_id = operation["menu"]
+        if tool_menu_id == self.current_tool_menu_id:
+            self.refresh_tab(tool_menu_id, select_entry=operation["entry"])
+        
+        entry_name = operation["entry"].get("name", "알 수 없음")
+        operation_name = EDIT_OPERATION_NAMES.get(operation["op"], operation["op"])
+        self.update_status(f"{label}: '{entry_name}' {operation_name} ({tool_menu_id})")
+    
     def _read_perforce_settings(self):
         """퍼포스 설정 파일 읽기"""
         try:
@@ -4277,67 +5095,71 @@ JSON 파일에는 UI 레이아웃과 동작이 정의되어 있어야 합니다.
             logger.error(f"퍼포스 설정 읽기 오류: {e}")
             return None
     
+    def _get_perforce_settings_problem(self):
+        """퍼포스 체크를 할 수 없는 사유 (체크 가능하면 None)"""
+        p4_settings = self._read_perforce_settings()
+        
+        if not p4_settings:
+            return "퍼포스 설정 없음"
+        
+        # Provider가 Perforce인지 확인
+        if p4_settings.get('Provider') != 'Perforce':
+            return f"프로바이더: {p4_settings.get('Provider')}"
+        
+        return None
+    
+    def _get_perforce_file_status(self, record, error):
+        """fstat 결과를 (퍼포스 관리 여부, 상태 메시지)로 변환"""
+        if error:
+            return False, error
+        if record is None:
+            return False, "퍼포스 관리 안됨"
+        
+        # 체크아웃(action)된 파일만 쓰기 가능
+        is_readonly = 'action' not in record
+        return True, f"퍼포스 관리 중 (ReadOnly: {is_readonly})"
+    
     def _check_perforce_file(self, file_path):
-        """파일이 퍼포스 관리 중인지 체크 (빠른 체크)"""
+        """파일이 퍼포스 관리 중인지 체크 (캐시 우선, 캐시가 없으면 워커 결과 대기)"""
         try:
-            # 퍼포스 설정 읽기
-            p4_settings = self._read_perforce_settings()
+            problem = self._get_perforce_settings_problem()
+            if problem:
+                return False, problem
             
-            if not p4_settings:
-                return False, "퍼포스 설정 없음"
-            
-            # Provider가 Perforce인지 확인
-            if p4_settings.get('Provider') != 'Perforce':
-                return False, f"프로바이더: {p4_settings.get('Provider')}"
-            
-            # p4 fstat으로 파일 상태 확인
-            cmd = ['p4', 'fstat', file_path]
-            result = self._run_p4_command(cmd, p4_settings, timeout=2)
-            
-            # returncode 0이면 파일이 퍼포스에 있음
-            if result.returncode == 0:
-                is_readonly = 'headRev' in result.stdout
-                return True, f"퍼포스 관리 중 (ReadOnly: {is_readonly})"
-            else:
-                return False, "퍼포스 관리 안됨"
+            record, error = self.p4_worker.fstat_sync(file_path)
+            return self._get_perforce_file_status(record, error)
                 
-        except subprocess.TimeoutExpired:
-            logger.warning("p4 명령 타임아웃")
-            return False, "퍼포스 체크 타임아웃"
-        except FileNotFoundError:
-            return False, "p4 명령어 없음"
         except Exception as e:
             logger.error(f"퍼포스 파일 체크 오류: {e}")
             return False, f"체크 오류: {str(e)}"
     
+    def _check_perforce_file_async(self, file_path, callback):
+        """파일이 퍼포스 관리 중인지 비동기 체크 - callback(is_in_perforce, status, record)"""
+        problem = self._get_perforce_settings_problem()
+        if problem:
+            callback(False, problem, None)
+            return
+        
+        def on_fstat(record, error):
+            is_in_perforce, p4_status = self._get_perforce_file_status(record, error)
+            callback(is_in_perforce, p4_status, record)
+        
+        self.p4_worker.request_fstat(file_path, on_fstat)
+    
     def _perforce_checkout(self, file_path):
-        """퍼포스에서 파일 체크아웃 (빠른 실행)"""
+        """퍼포스에서 파일 체크아웃 (워커 결과 대기)"""
         try:
-            # 퍼포스 설정 읽기
-            p4_settings = self._read_perforce_settings()
-            
-            if not p4_settings:
+            if not self._read_perforce_settings():
                 return False, "퍼포스 설정 없음"
             
-            # p4 edit으로 체크아웃
-            cmd = ['p4', 'edit', file_path]
-            result = self._run_p4_command(cmd, p4_settings, timeout=3)
-            
-            if result.returncode == 0:
-                return True, "체크아웃 성공"
-            else:
-                return False, f"체크아웃 실패: {result.stderr}"
+            return self.p4_worker.edit_sync(file_path)
                 
-        except subprocess.TimeoutExpired:
-            return False, "체크아웃 타임아웃"
-        except FileNotFoundError:
-            return False, "p4 명령어 없음"
         except Exception as e:
             logger.error(f"퍼포스 체크아웃 오류: {e}")
             return False, f"체크아웃 오류: {str(e)}"
     
     def _ensure_file_writable(self, file_path):
-        """파일이 쓰기 가능한지 확인하고 필요시 처리 (퍼포스 연동 - 최적화)"""
+        """파일이 쓰기 가능한지 확인하고 필요시 처리 (퍼포스 연동 - 결과를 기다리는 동기 버전)"""
         try:
             # 1. 빠른 권한 체크 먼저 (퍼포스 체크 전)
             if is_file_writable(file_path):
@@ -4354,54 +5176,95 @@ JSON 파일에는 UI 레이아웃과 동작이 정의되어 있어야 합니다.
                 
                 # 자동으로 체크아웃 (다이얼로그 없이)
                 checkout_success, checkout_msg = self._perforce_checkout(file_path)
-                
-                if checkout_success:
-                    logger.info(f"퍼포스 체크아웃 성공")
-                    self.update_status(f"✅ 퍼포스 체크아웃 완료")
-                    return True
-                else:
-                    logger.warning(f"퍼포스 체크아웃 실패: {checkout_msg}")
-                    # 체크아웃 실패 시 사용자에게 알림
-                    self._show_warning(f"퍼포스 체크아웃에 실패했습니다:\n{checkout_msg}\n\n수동으로 체크아웃 해주세요.", "체크아웃 실패")
-                    return False
+                return self._handle_checkout_result(checkout_success, checkout_msg)
             
             # 3. 퍼포스가 아닌 경우 기존 로직 사용
-            logger.info("퍼포스 관리 파일 아님 - 일반 권한 확인")
-            success, message = ensure_file_writable(file_path)
-            
-            if success:
-                logger.info(f"파일 쓰기 가능: {message}")
-                self.update_status(f"✅ {message}")
-                return True
-            else:
-                logger.warning(f"파일 쓰기 불가: {message}")
-                
-                # 사용자에게 수동 처리 옵션 제공
-                result = messagebox.askyesnocancel(
-                    "파일 쓰기 권한 없음",
-                    f"파일을 쓰기 가능한 상태로 만들 수 없습니다:\n{file_path}\n\n"
-                    f"상태: {message}\n\n"
-                    "수동으로 파일 권한을 변경한 후 '예'를 클릭하세요.\n\n"
-                    "계속 진행하시겠습니까?",
-                    icon="warning"
-                )
-                
-                if result is True:
-                    return is_file_writable(file_path)
-                else:
-                    return False
+            return self._make_file_writable_without_perforce(file_path)
             
         except Exception as e:
             logger.error(f"파일 쓰기 권한 확인 중 오류: {e}")
             self._show_error(f"파일 쓰기 권한을 확인할 수 없습니다:\n{str(e)}", "오류")
             return False
     
+    def _ensure_file_writable_async(self, file_path, on_done):
+        """_ensure_file_writable의 비동기 버전 - 퍼포스 조회/체크아웃 동안 UI가 멈추지 않음
+        
+        결과는 메인 스레드에서 on_done(쓰기 가능 여부)로 전달됩니다.
+        """
+        # 1. 빠른 권한 체크 먼저 (퍼포스 체크 전)
+        if is_file_writable(file_path):
+            logger.debug("파일이 이미 쓰기 가능 - 퍼포스 체크 생략")
+            on_done(True)
+            return
+        
+        logger.info(f"파일이 ReadOnly - 퍼포스 체크 시작: {file_path}")
+        self.update_status("🔄 퍼포스 상태 확인 중...", auto_clear=False)
+        
+        def on_checkout(checkout_success, checkout_msg):
+            on_done(self._handle_checkout_result(checkout_success, checkout_msg))
+        
+        def on_checked(is_in_perforce, p4_status, record):
+            try:
+                if is_in_perforce:
+                    logger.info(f"퍼포스 파일 감지 - 체크아웃 시도")
+                    self.update_status("🔄 퍼포스 체크아웃 중...", auto_clear=False)
+                    self.p4_worker.request_edit(file_path, on_checkout)
+                else:
+                    on_done(self._make_file_writable_without_perforce(file_path))
+            except Exception as e:
+                logger.error(f"파일 쓰기 권한 확인 중 오류: {e}")
+                self._show_error(f"파일 쓰기 권한을 확인할 수 없습니다:\n{str(e)}", "오류")
+                on_done(False)
+        
+        # 2. 퍼포스 관리 중인지 체크 (ReadOnly인 경우에만)
+        self._check_perforce_file_async(file_path, on_checked)
+    
+    def _handle_checkout_result(self, checkout_success, checkout_msg):
+        """퍼포스 체크아웃 결과 처리 (성공 여부 반환)"""
+        if checkout_success:
+            logger.info(f"퍼포스 체크아웃 성공")
+            self.update_status(f"✅ 퍼포스 체크아웃 완료")
+            return True
+        
+        logger.warning(f"퍼포스 체크아웃 실패: {checkout_msg}")
+        # 체크아웃 실패 시 사용자에게 알림
+        self._show_warning(f"퍼포스 체크아웃에 실패했습니다:\n{checkout_msg}\n\n수동으로 체크아웃 해주세요.", "체크아웃 실패")
+        return False
+    
+    def _make_file_writable_without_perforce(self, file_path):
+        """퍼포스 관리 파일이 아닌 경우 일반 권한 처리 (쓰기 가능 여부 반환)"""
+        logger.info("퍼포스 관리 파일 아님 - 일반 권한 확인")
+        success, message = ensure_file_writable(file_path)
+        
+        if success:
+            logger.info(f"파일 쓰기 가능: {message}")
+            self.update_status(f"✅ {message}")
+            return True
+        
+        logger.warning(f"파일 쓰기 불가: {message}")
+        
+        # 사용자에게 수동 처리 옵션 제공
+        result = messagebox.askyesnocancel(
+            "파일 쓰기 권한 없음",
+            f"파일을 쓰기 가능한 상태로 만들 수 없습니다:\n{file_path}\n\n"
+            f"상태: {message}\n\n"
+            "수동으로 파일 권한을 변경한 후 '예'를 클릭하세요.\n\n"
+            "계속 진행하시겠습니까?",
+            icon="warning"
+        )
+        
+        if result is True:
+            return is_file_writable(file_path)
+        return False
+    
     def cleanup_resources(self):
         """리소스 정리 메서드 (중복 호출 방지)"""
         if self._resources_cleaned:
             return
             
         try:
+            if self.p4_worker:
+                self.p4_worker.shutdown()
             if file_handler:
                 file_handler.close()
                 logger.removeHandler(file_handler)
@@ -4867,6 +5730,8 @@ class NewEntryDialog:
                     self.ta_tool._show_error(f"부모 엔트리 '{parent_selection}'를 찾을 수 없습니다.", "오류")
                     return
             
+            self.ta_tool._record_insert(selected_category, new_entry)
+            
             # 해당 탭 새로고침
             self.ta_tool.refresh_tab(selected_category)
             self.ta_tool.mark_as_modified()  # 변경사항 추적
@@ -4899,69 +5764,241 @@ class NewEntryDialog:
         self.dialog.destroy()
 
 
+# ==================== 프로젝트/엔진 탐색 ====================
+
+def get_discovery_cache_path():
+    """사용자별 탐색 캐시 파일 경로 (Windows: %LOCALAPPDATA%, 그 외: ~/.cache)"""
+    if os.name == 'nt':
+        base_dir = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+    else:
+        base_dir = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base_dir, 'MaidCat', DISCOVERY_CACHE_FILE_NAME)
+
+
+def find_uproject(start_dir, max_levels=SEARCH_MAX_LEVELS):
+    """start_dir부터 상위 폴더로 올라가며 .uproject 찾기 - (프로젝트 폴더, .uproject 경로) 반환"""
+    current_dir = os.path.abspath(start_dir)
+    
+    for level in range(max_levels):
+        logger.debug(f"탐색 중 ({level+1}/{max_levels}): {current_dir}")
+        try:
+            uproject_files = sorted(item for item in os.listdir(current_dir) if item.endswith('.uproject'))
+        except OSError:
+            logger.debug(f"경로 접근 불가: {current_dir}")
+            uproject_files = []
+        
+        if uproject_files:
+            logger.info(f"언리얼 프로젝트 발견: {current_dir}, 파일: {uproject_files}")
+            return current_dir, os.path.join(current_dir, uproject_files[0])
+        
+        # 루트 디렉토리에 도달하면 중단
+        parent_dir = os.path.dirname(current_dir)
+        if parent_dir == current_dir:
+            break
+        current_dir = parent_dir
+    
+    return None, None
+
+
+def find_engine_dir(engine_association):
+    """EngineAssociation으로 엔진 설치 폴더 찾기
+    
+    - Windows: 런처 설치는 HKLM 레지스트리, 소스 빌드는 HKCU Builds 키
+    - Linux/Mac: 소스 빌드가 등록되는 Epic/UnrealEngine/Install.ini
+    """
+    if not engine_association:
+        return None
+    
+    if os.name == 'nt':
+        if winreg is None:
+            return None
+        try:
+            registry_key = f"SOFTWARE\\EpicGames\\Unreal Engine\\{engine_association}"
+            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, registry_key) as key:
+                return winreg.QueryValueEx(key, "InstalledDirectory")[0]
+        except OSError:
+            pass
+        try:
+            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, "Software\\Epic Games\\Unreal Engine\\Builds") as key:
+                return winreg.QueryValueEx(key, engine_association)[0]
+        except OSError:
+            return None
+    
+    if sys.platform == 'darwin':
+        install_ini = os.path.expanduser("~/Library/Application Support/Epic/UnrealEngine/Install.ini")
+    else:
+        install_ini = os.path.expanduser("~/.config/Epic/UnrealEngine/Install.ini")
+    
+    try:
+        import configparser
+        parser = configparser.ConfigParser(strict=False)
+        parser.optionxform = str  # 키(GUID/버전) 대소문자 유지
+        if parser.read(install_ini, encoding='utf-8') and parser.has_option('Installations', engine_association):
+            return parser.get('Installations', engine_association)
+    except (OSError, configparser.Error) as e:
+        logger.debug(f"Install.ini 읽기 실패: {e}")
+    return None
+
+
+def get_engine_python_path(engine_dir):
+    """엔진 폴더 안의 파이썬 실행 파일 경로 (플랫폼별)"""
+    if os.name == 'nt':
+        platform_parts = ("Win64", "python.exe")
+    elif sys.platform == 'darwin':
+        platform_parts = ("Mac", "bin", "python3")
+    else:
+        platform_parts = ("Linux", "bin", "python3")
+    return os.path.join(engine_dir, "Engine", "Binaries", "ThirdParty", "Python3", *platform_parts)
+
+
+def _discover_project_uncached(start_dir):
+    """파일 시스템을 탐색하여 프로젝트/엔진 정보 수집"""
+    result = {
+        "project_dir": None,
+        "uproject": None,
+        "engine_association": None,
+        "engine_dir": None,
+        "python": None,
+        "config_path": None,
+    }
+    
+    project_dir, uproject_path = find_uproject(start_dir)
+    if not uproject_path:
+        return result
+    
+    result["project_dir"] = project_dir
+    result["uproject"] = uproject_path
+    result["config_path"] = os.path.join(project_dir, *TAPYTHON_PATH)
+    
+    try:
+        with open(uproject_path, 'r', encoding='utf-8') as f:
+            result["engine_association"] = json.load(f).get('EngineAssociation') or None
+    except (OSError, ValueError) as e:
+        logger.warning(f".uproject 파일 읽기 실패: {e}")
+        return result
+    
+    engine_dir = find_engine_dir(result["engine_association"])
+    if engine_dir:
+        result["engine_dir"] = engine_dir
+        python_path = get_engine_python_path(engine_dir)
+        if os.path.exists(python_path):
+            result["python"] = python_path
+    
+    return result
+
+
+def _get_discovery_stamps(result):
+    """캐시 유효성 검사용 파일 상태
+    
+    .uproject(엔진 변경)와 프로젝트 폴더(.uproject 추가/이름 변경), 엔진 파이썬은 mtime으로,
+    설정 파일은 저장할 때마다 mtime이 바뀌므로 존재 여부만 비교합니다.
+    """
+    mtimes = {}
+    for key in ("uproject", "project_dir", "python"):
+        path = result.get(key)
+        if path:
+            try:
+                mtimes[path] = os.stat(path).st_mtime_ns
+            except OSError:
+                mtimes[path] = None
+    
+    exists = {}
+    if result.get("config_path"):
+        exists[result["config_path"]] = os.path.exists(result["config_path"])
+    
+    return {"mtimes": mtimes, "exists": exists}
+
+
+def _load_discovery_cache():
+    try:
+        with open(get_discovery_cache_path(), 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        if cache.get("version") == DISCOVERY_CACHE_VERSION:
+            return cache
+    except (OSError, ValueError, AttributeError):
+        pass
+    return {"version": DISCOVERY_CACHE_VERSION, "entries": {}}
+
+
+def _save_discovery_entry(start_dir, result):
+    try:
+        cache = _load_discovery_cache()
+        entries = cache["entries"]
+        entries[start_dir] = {"result": result, "stamps": _get_discovery_stamps(result), "updated": time.time()}
+        
+        # 오래된 작업 공간 항목 정리
+        if len(entries) > DISCOVERY_CACHE_MAX_ENTRIES:
+            newest = sorted(entries, key=lambda key: entries[key].get("updated", 0), reverse=True)
+            cache["entries"] = {key: entries[key] for key in newest[:DISCOVERY_CACHE_MAX_ENTRIES]}
+        
+        cache_path = get_discovery_cache_path()
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        write_json_atomic(cache_path, cache, compact=True)
+    except Exception as e:
+        logger.debug(f"탐색 캐시 저장 실패: {e}")
+
+
+def discover_project(start_dir=None, use_cache=True):
+    """프로젝트/엔진 탐색 (캐시가 유효하면 파일 시스템 탐색 생략)
+    
+    Args:
+        start_dir: 탐색 시작 폴더 (기본: 이 스크립트 폴더)
+        use_cache: False면 캐시를 무시하고 다시 탐색
+    
+    Returns:
+        dict: project_dir, uproject, engine_association, engine_dir, python, config_path
+              (찾지 못한 항목은 None)
+    """
+    start_dir = os.path.abspath(start_dir or os.path.dirname(os.path.abspath(__file__)))
+    
+    if use_cache:
+        entry = _load_discovery_cache()["entries"].get(start_dir)
+        # 엔진 파이썬이 없는 항목은 엔진을 나중에 설치해도 스탬프로 알 수 없으므로 다시 탐색
+        if (entry and entry.get("result", {}).get("python")
+                and entry.get("stamps") == _get_discovery_stamps(entry["result"])):
+            logger.info(f"탐색 캐시 사용: {entry['result'].get('uproject')}")
+            return entry["result"]
+    
+    result = _discover_project_uncached(start_dir)
+    
+    # 프로젝트/엔진 파이썬을 찾지 못한 결과는 설치 후 바로 반영되도록 캐시하지 않음
+    if result["uproject"] and result["python"]:
+        _save_discovery_entry(start_dir, result)
+    return result
+
+
 def find_unreal_python():
     """
     .uproject 파일에서 EngineAssociation을 찾아 
-    윈도우 레지스트리에서 언리얼 엔진의 파이썬 경로를 반환
+    언리얼 엔진의 파이썬 경로를 반환 (Windows: 레지스트리, Linux/Mac: Install.ini)
+    
+    탐색 결과는 사용자별 캐시에 저장되어 다음 실행부터는 상위 폴더 탐색을 생략합니다.
     """
     try:
-        # 현재 스크립트에서 프로젝트 루트 찾기
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = current_dir
-        uproject_path = None
-        
-        # 상위 디렉토리로 올라가면서 .uproject 파일 찾기
-        for _ in range(10):  # 최대 10단계까지 상위로 검색
-            uproject_files = [f for f in os.listdir(project_root) if f.endswith('.uproject')]
-            if uproject_files:
-                uproject_path = os.path.join(project_root, uproject_files[0])
-                break
-            parent = os.path.dirname(project_root)
-            if parent == project_root:  # 루트에 도달
-                break
-            project_root = parent
+        discovery = discover_project()
         
-        if not uproject_path:
+        if not discovery["uproject"]:
             print("오류: .uproject 파일을 찾을 수 없습니다.")
             return None
         
-        # .uproject 파일에서 EngineAssociation 읽기
-        with open(uproject_path, 'r', encoding='utf-8') as f:
-            project_data = json.load(f)
-        
-        engine_version = project_data.get('EngineAssociation')
+        engine_version = discovery["engine_association"]
         if not engine_version:
             print("오류: .uproject 파일에서 EngineAssociation을 찾을 수 없습니다.")
             return None
         
         print(f"언리얼 엔진 버전: {engine_version}")
         
-        # 윈도우 레지스트리에서 언리얼 엔진 경로 찾기
-        if os.name == 'nt':  # Windows
-            try:
-                registry_key = f"SOFTWARE\\EpicGames\\Unreal Engine\\{engine_version}"
-                with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, registry_key) as key:
-                    install_dir = winreg.QueryValueEx(key, "InstalledDirectory")[0]
-                
-                # 언리얼 엔진의 파이썬 경로 구성
-                python_path = os.path.join(
-                    install_dir, 
-                    "Engine", "Binaries", "ThirdParty", "Python3", "Win64", "python.exe"
-                )
-                
-                if os.path.exists(python_path):
-                    print(f"언리얼 엔진 파이썬 경로: {python_path}")
-                    return python_path
-                else:
-                    print(f"오류: 언리얼 엔진 파이썬을 찾을 수 없습니다: {python_path}")
-                    return None
-                    
-            except (WindowsError, FileNotFoundError) as e:
-                print(f"오류: 레지스트리에서 언리얼 엔진 정보를 찾을 수 없습니다: {e}")
-                return None
-        else:
-            print("오류: 현재 Windows에서만 지원됩니다.")
+        if not discovery["engine_dir"]:
+            print(f"오류: 언리얼 엔진 설치 정보를 찾을 수 없습니다: {engine_version}")
             return None
+        
+        python_path = discovery["python"]
+        if python_path:
+            print(f"언리얼 엔진 파이썬 경로: {python_path}")
+            return python_path
+        
+        print(f"오류: 언리얼 엔진 파이썬을 찾을 수 없습니다: {get_engine_python_path(discovery['engine_dir'])}")
+        return None
             
     except Exception as e:
         print(f"언리얼 엔진 파이썬 경로 찾기 중 오류: {e}")
@@ -59,28 +59,37 @@ TAPython 확장 라이브러리 (https://www.tacolor.xyz/):
 버전: 1.0
 """
 
-# 주요 모듈들을 가져와서 패키지 레벨에서 접근 가능하게 함
-from . import asset_lib
-from . import util_lib
-from . import actor_sys
-from . import asset_sys
-from . import util_sys
-from . import level_lib
-from . import level_util
-from . import level_sys
-from . import asset_tool
-from . import asset_reg
-from . import loadsave_util
-from . import file_util
-from . import bp_lib
-from . import mat_lib
-from . import mesh_lib
-from . import tex_lib
-from . import data_lib
-from . import phys_lib
-from . import enum_lib
-from . import struct_lib
-from . import landscape_lib
+import importlib
+import sys
+import time
+from typing import TYPE_CHECKING
+
+# 하위 모듈은 처음 접근할 때 import합니다 (PEP 562 지연 로딩)
+# 일부 모듈은 import 시점에 unreal.Name(...) 기본값이나 TAPython 전용 클래스를 참조하므로
+# "from ue import asset_lib"가 나머지 모듈까지 모두 로딩하지 않도록 합니다.
+if TYPE_CHECKING:
+    # IDE/정적 분석기 자동완성용 (실행 시에는 import하지 않음)
+    from . import asset_lib
+    from . import util_lib
+    from . import actor_sys
+    from . import asset_sys
+    from . import util_sys
+    from . import level_lib
+    from . import level_util
+    from . import level_sys
+    from . import asset_tool
+    from . import asset_reg
+    from . import loadsave_util
+    from . import file_util
+    from . import bp_lib
+    from . import mat_lib
+    from . import mesh_lib
+    from . import tex_lib
+    from . import data_lib
+    from . import phys_lib
+    from . import enum_lib
+    from . import struct_lib
+    from . import landscape_lib
 
 # 패키지 정보
 __version__ = "1.0"
@@ -109,4 +118,71 @@ __all__ = [
     "enum_lib",
     "struct_lib",
     "landscape_lib"
-]
\ No newline at end of file
+]
+
+_SUBMODULES = frozenset(__all__)
+
+# 지연 로딩된 하위 모듈별 import 시간 (초)
+_import_times = {}
+
+
+def __getattr__(name):
+    """처음 접근한 하위 모듈을 import (이후에는 패키지 속성으로 바로 접근)"""
+    if name in _SUBMODULES:
+        start_time = time.perf_counter()
+        module = importlib.import_module(f"{__name__}.{name}")
+        _import_times[name] = time.perf_counter() - start_time
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """dir(ue)/대화형 자동완성에 아직 로딩되지 않은 하위 모듈도 표시"""
+    return sorted(set(globals()) | _SUBMODULES)
+
+
+def import_time_report(measure_all=False):
+    """하위 모듈 import 시간 보고서
+    
+    Args:
+        measure_all: True면 아직 로딩되지 않은 모듈도 import하여 전체를 미리 로딩했을 때의
+                     비용과 지연 로딩으로 절약된 시간을 함께 표시
+    
+    Returns:
+        str: 보고서 문자열
+    """
+    loaded_on_demand = {name: seconds for name, seconds in _import_times.items()}
+    pending = [name for name in __all__ if f"{__name__}.{name}" not in sys.modules]
+    
+    measured = {}
+    if measure_all:
+        for name in pending:
+            start_time = time.perf_counter()
+            try:
+                importlib.import_module(f"{__name__}.{name}")
+            except Exception as e:
+                print(f"⚠️ {name} import 실패: {e}")
+                continue
+            measured[name] = time.perf_counter() - start_time
+            _import_times[name] = measured[name]
+    
+    lines = ["📦 ue 하위 모듈 import 시간"]
+    for name in __all__:
+        if name in measured:
+            lines.append(f"  {name:<14} {measured[name] * 1000:8.2f} ms  (보고서용 측정)")
+        elif name in loaded_on_demand:
+            lines.append(f"  {name:<14} {loaded_on_demand[name] * 1000:8.2f} ms")
+        elif f"{__name__}.{name}" in sys.modules:
+            lines.append(f"  {name:<14} {'-':>8}     (직접 import됨)")
+        else:
+            lines.append(f"  {name:<14} {'-':>8}     (로딩 안 됨)")
+    
+    used_ms = sum(loaded_on_demand.values()) * 1000
+    lines.append(f"사용한 모듈: {len(loaded_on_demand)}개, {used_ms:.2f} ms")
+    if measure_all:
+        saved_ms = sum(measured.values()) * 1000
+        lines.append(f"전체 미리 로딩 시: {used_ms + saved_ms:.2f} ms → 지연 로딩으로 {saved_ms:.2f} ms 절약")
+    else:
+        lines.append(f"로딩되지 않은 모듈: {len(pending)}개 (measure_all=True로 절약 시간 측정)")
+    return "\n".join(lines)
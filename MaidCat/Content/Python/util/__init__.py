@@ -4,6 +4,11 @@ Unreal Python Utilities
 
 Available modules:
 - helper: Unreal Engine API shortcuts and helpers
+- asset_iter: Memory-bounded chunked asset iteration
+- startup_profiler: Startup import-time tree profiler and regression tracker
+- startup_scheduler: Prioritized, dependency-aware deferred startup tasks
+- module_index: Module-name index meta path finder for plugin Python folders
+- bytecode_bundle: Precompiled bytecode bundle build and loader
 """
 
-__all__ = ['helper']
+__all__ = ['helper', 'asset_iter', 'startup_profiler', 'startup_scheduler', 'module_index', 'bytecode_bundle']
@@ -0,0 +1,183 @@
+"""
+Unreal Asset Iteration Utilities
+프로젝트 전체 에셋을 메모리 한도 안에서 순회하기 위한 유틸리티
+
+대량의 에셋을 get_asset()/load_asset()으로 로드해 리스트에 보관하면
+UObject가 계속 살아 있어 에디터 메모리가 부족해집니다.
+이 모듈은 Asset Registry 데이터만으로 후보를 고른 뒤, N개씩 로드하여 넘겨주고
+청크 사이마다 참조를 끊고 가비지 컬렉션을 실행합니다.
+
+Usage:
+    from util import asset_iter
+
+    heavy_paths = []
+    materials = asset_iter.iter_asset_data("/Game", class_names={"Material"})
+    for asset_data, material in asset_iter.iter_loaded_assets(materials, chunk_size=200):
+        if is_heavy(material):
+            heavy_paths.append(str(asset_data.package_name))  # UObject 대신 경로 보관
+"""
+
+import sys
+import unreal
+from typing import Callable, Iterable, Iterator, Optional, Set, Tuple
+
+
+DEFAULT_CHUNK_SIZE = 100
+
+
+# ============================================================================
+# 메모리 측정
+# ============================================================================
+
+def get_process_memory_mb() -> Optional[float]:
+    """현재 에디터 프로세스의 메모리 사용량(MB) 반환 (측정 불가 시 None)"""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+    except ImportError:
+        pass
+
+    if sys.platform == "win32":
+        try:
+            import ctypes
+            from ctypes import wintypes
+
+            class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+                _fields_ = [
+                    ("cb", wintypes.DWORD),
+                    ("PageFaultCount", wintypes.DWORD),
+                    ("PeakWorkingSetSize", ctypes.c_size_t),
+                    ("WorkingSetSize", ctypes.c_size_t),
+                    ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                    ("PagefileUsage", ctypes.c_size_t),
+                    ("PeakPagefileUsage", ctypes.c_size_t),
+                ]
+
+            counters = PROCESS_MEMORY_COUNTERS()
+            counters.cb = ctypes.sizeof(PROCESS_MEMORY_COUNTERS)
+            process = ctypes.windll.kernel32.GetCurrentProcess()
+            if ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+                return counters.WorkingSetSize / (1024 * 1024)
+        except Exception:
+            return None
+        return None
+
+    try:
+        # Linux: /proc/self/statm 두 번째 값이 현재 RSS (페이지 단위)
+        import os
+        with open("/proc/self/statm", "r") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except Exception:
+        return None
+
+
+def collect_garbage():
+    """Unreal 가비지 컬렉션 실행"""
+    try:
+        unreal.SystemLibrary.collect_garbage()
+    except Exception as e:
+        unreal.log_warning(f"⚠️ 가비지 컬렉션 실패: {e}")
+
+
+# ============================================================================
+# 에셋 순회
+# ============================================================================
+
+def iter_asset_data(directory: str = "/Game/", class_names: Optional[Set[str]] = None,
+                    recursive: bool = True) -> Iterator[unreal.AssetData]:
+    """Asset Registry에서 에셋을 로드하지 않고 AssetData만 순회
+
+    Args:
+        directory: 검색할 경로
+        class_names: 포함할 클래스 이름 집합 (예: {"Material"}), None이면 전체
+        recursive: 하위 폴더 포함 여부
+    """
+    asset_registry = unreal.AssetRegistryHelpers.get_asset_registry()
+    package_path = directory.rstrip("/") or "/"
+    for asset_data in asset_registry.get_assets_by_path(package_path, recursive=recursive):
+        if class_names is None or str(asset_data.asset_class_path.asset_name) in class_names:
+            yield asset_data
+
+
+def _load_item(item):
+    """AssetData 또는 에셋 경로를 로드"""
+    if isinstance(item, str):
+        return unreal.EditorAssetLibrary.load_asset(item)
+    return item.get_asset()
+
+
+def _item_path(item) -> str:
+    """로그용 에셋 경로 (AssetData면 package_name)"""
+    if isinstance(item, str):
+        return item
+    return str(getattr(item, "package_name", item))
+
+
+def iter_loaded_assets(items: Iterable, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                       memory_limit_mb: Optional[float] = None,
+                       loader: Optional[Callable] = None,
+                       on_error: Optional[Callable] = None) -> Iterator[Tuple[object, object]]:
+    """AssetData(또는 경로)를 chunk_size개씩 로드하여 (item, asset) 순서로 넘겨줌
+
+    청크가 끝날 때마다 로드한 에셋 참조를 버리고 가비지 컬렉션을 실행합니다.
+    memory_limit_mb를 넘으면 청크 중간에도 즉시 가비지 컬렉션을 실행합니다.
+    호출하는 쪽은 결과를 UObject가 아닌 경로로 보관해야 메모리가 회수됩니다.
+    로드 중 예외가 발생한 항목은 경고를 남기고 건너뛰므로 순회가 중단되지 않습니다.
+
+    Args:
+        items: unreal.AssetData 또는 에셋 경로 문자열 목록/이터레이터
+        chunk_size: 가비지 컬렉션 사이에 로드할 에셋 수
+        memory_limit_mb: 프로세스 메모리 상한 (MB, None이면 검사하지 않음)
+        loader: item → 에셋 함수 (None이면 AssetData.get_asset() / load_asset())
+        on_error: 로드 실패 시 호출할 함수 (item, exception), 실패 목록이 필요할 때 사용
+    """
+    loader = loader or _load_item
+    chunk_size = max(1, int(chunk_size))
+    loaded_in_chunk = 0
+
+    for item in items:
+        try:
+            asset = loader(item)
+        except Exception as e:
+            unreal.log_warning(f"⚠️ 에셋 로드 실패 ({_item_path(item)}): {e}")
+            if on_error is not None:
+                on_error(item, e)
+            continue
+        if asset is None:
+            continue
+
+        yield item, asset
+        asset = None
+        loaded_in_chunk += 1
+
+        over_limit = False
+        if memory_limit_mb is not None:
+            memory_mb = get_process_memory_mb()
+            over_limit = memory_mb is not None and memory_mb > memory_limit_mb
+
+        if loaded_in_chunk >= chunk_size or over_limit:
+            collect_garbage()
+            loaded_in_chunk = 0
+
+    if loaded_in_chunk:
+        collect_garbage()
+
+
+def add_paths_to_collection(collection_name: str, asset_paths: Iterable[str]) -> int:
+    """에셋 경로 목록을 로컬 Collection에 추가 (에셋을 로드하지 않음, 추가된 개수 반환)"""
+    tag_system = unreal.get_engine_subsystem(unreal.AssetTagsSubsystem)
+    tag_system.create_collection(collection_name, share_type=unreal.CollectionShareType.LOCAL)
+
+    asset_datas = []
+    for asset_path in asset_paths:
+        asset_data = unreal.EditorAssetLibrary.find_asset_data(asset_path)
+        if asset_data.is_valid():
+            asset_datas.append(asset_data)
+
+    if asset_datas:
+        tag_system.add_asset_datas_to_collection(collection_name, asset_datas)
+    return len(asset_datas)
@@ -0,0 +1,357 @@
+"""
+MaidCat Bytecode Bundle
+플러그인 Python 모듈을 미리 컴파일한 바이트코드 번들 생성/로딩
+
+플러그인 폴더는 소스 컨트롤 때문에 읽기 전용인 경우가 많아 __pycache__를 쓰지 못하고,
+에디터를 켤 때마다 모든 모듈을 다시 컴파일합니다.
+빌드 단계에서 Content/Python을 엔진과 같은 Python으로 컴파일해 zip 번들(+매니페스트)로 만들고,
+init_unreal.py는 번들이 있고 현재 Python과 맞으면 번들의 코드 객체를 바로 실행합니다.
+
+- 모듈의 __file__/__path__는 원래 소스 경로 그대로 (데이터 파일 경로, 트레이스백, inspect 유지)
+- 소스가 번들을 만든 뒤 수정되었으면 (크기/mtime이 다르고 sha256도 다르면) 해당 모듈만 소스로 import
+- 번들에 없는 모듈/namespace 패키지는 다음 finder(모듈 인덱스 → 기본 PathFinder)가 처리
+
+빌드 (엔진 Python으로 Content/Python에서 실행):
+    "<Engine>/Binaries/ThirdParty/Python3/Win64/python.exe" -m util.bytecode_bundle
+"""
+
+import hashlib
+import importlib.machinery
+import importlib.util
+import json
+import marshal
+import os
+import sys
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+
+BUNDLE_FORMAT_VERSION = 1
+BUNDLE_FILE_NAME = "maidcat_python.zip"
+MANIFEST_NAME = "manifest.json"
+DEFAULT_OPTIMIZE = 1    # assert 제거 (docstring은 유지)
+SKIP_DIR_NAMES = {"__pycache__"}
+
+
+def get_default_bundle_path(python_root):
+    """Content/Python 옆 Content/PythonBundle/maidcat_python.zip 경로"""
+    return Path(python_root).parent / "PythonBundle" / BUNDLE_FILE_NAME
+
+
+def _file_sha256(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _python_tag():
+    return f"{sys.version_info.major}.{sys.version_info.minor}"
+
+
+# ============================================================================
+# 빌드
+# ============================================================================
+
+def iter_source_modules(source_root):
+    """source_root 아래 (모듈 이름, 소스 경로, 패키지 여부) 목록"""
+    source_root = Path(source_root)
+    for directory, dir_names, file_names in os.walk(source_root):
+        dir_names[:] = sorted(name for name in dir_names
+                              if name not in SKIP_DIR_NAMES and not name.startswith(".") and name.isidentifier())
+        relative_dir = Path(directory).relative_to(source_root)
+        package_parts = list(relative_dir.parts)
+        for file_name in sorted(file_names):
+            if not file_name.endswith(".py"):
+                continue
+            stem = file_name[:-3]
+            if stem == "__init__":
+                if not package_parts:
+                    continue
+                yield ".".join(package_parts), Path(directory) / file_name, True
+            elif stem.isidentifier():
+                yield ".".join(package_parts + [stem]), Path(directory) / file_name, False
+
+
+def build_bundle(source_root, bundle_path=None, optimize=DEFAULT_OPTIMIZE):
+    """source_root의 모든 모듈을 컴파일하여 번들 생성
+
+    Returns:
+        dict: 매니페스트 (컴파일 실패 모듈은 "errors"에 기록되고 번들에서 제외)
+    """
+    source_root = Path(source_root).resolve()
+    bundle_path = Path(bundle_path) if bundle_path else get_default_bundle_path(source_root)
+
+    manifest = {
+        "format": BUNDLE_FORMAT_VERSION,
+        "python": _python_tag(),
+        "python_full": sys.version.split()[0],
+        "magic": importlib.util.MAGIC_NUMBER.hex(),
+        "optimize": optimize,
+        "built": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "modules": {},
+        "errors": {},
+    }
+
+    bundle_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(prefix=bundle_path.name + ".", suffix=".tmp", dir=str(bundle_path.parent))
+    os.close(fd)
+    try:
+        with zipfile.ZipFile(temp_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            for module_name, source_path, is_package in iter_source_modules(source_root):
+                relative_path = source_path.relative_to(source_root).as_posix()
+                source_bytes = source_path.read_bytes()
+                try:
+                    code = compile(source_bytes, relative_path, "exec", dont_inherit=True, optimize=optimize)
+                except (SyntaxError, ValueError) as e:
+                    manifest["errors"][module_name] = f"{type(e).__name__}: {e}"
+                    continue
+
+                stat = source_path.stat()
+                entry_name = relative_path[:-3] + ".pyc"
+                archive.writestr(entry_name, marshal.dumps(code))
+                manifest["modules"][module_name] = {
+                    "source": relative_path,
+                    "code": entry_name,
+                    "package": is_package,
+                    "size": stat.st_size,
+                    "mtime": stat.st_mtime,
+                    "sha256": hashlib.sha256(source_bytes).hexdigest(),
+                }
+            archive.writestr(MANIFEST_NAME, json.dumps(manifest, ensure_ascii=False, indent=1))
+        # mkstemp는 0600으로 만들므로 일반 파일 권한으로 변경
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(temp_path, 0o666 & ~umask)
+        os.replace(temp_path, bundle_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+    return manifest
+
+
+# ============================================================================
+# 로딩
+# ============================================================================
+
+class BytecodeBundle:
+    """번들 zip과 매니페스트 (소스 최신 여부는 import/reload할 때마다 stat으로 확인)"""
+
+    def __init__(self, bundle_path, source_root):
+        self.bundle_path = Path(bundle_path)
+        self.source_root = Path(source_root)
+        self._archive = zipfile.ZipFile(self.bundle_path)
+        self.manifest = json.loads(self._archive.read(MANIFEST_NAME).decode("utf-8"))
+        self.modules = self.manifest.get("modules", {})
+        self._current = {}
+        self.loaded = 0
+        self.stale = []
+
+    def get_problem(self):
+        """현재 Python에서 번들을 쓸 수 없는 이유 (쓸 수 있으면 None)"""
+        if self.manifest.get("format") != BUNDLE_FORMAT_VERSION:
+            return f"번들 형식 버전 불일치 ({self.manifest.get('format')} != {BUNDLE_FORMAT_VERSION})"
+        if self.manifest.get("python") != _python_tag():
+            return f"Python 버전 불일치 (번들 {self.manifest.get('python')}, 엔진 {_python_tag()})"
+        if self.manifest.get("magic") != importlib.util.MAGIC_NUMBER.hex():
+            return "바이트코드 magic number 불일치"
+        return None
+
+    def get_source_path(self, module_name):
+        return self.source_root / self.modules[module_name]["source"]
+
+    def is_current(self, module_name):
+        """소스가 번들을 만든 뒤 바뀌지 않았는지 확인
+
+        소스 컨트롤 동기화로 mtime만 바뀌는 경우가 많으므로, 크기/mtime이 다르면 sha256으로 다시 비교합니다.
+        매번 stat으로 확인하고, 결과는 (크기, mtime)이 같은 동안만 재사용합니다.
+        (세션 중 소스를 수정하고 importlib.reload()하면 소스로 다시 로딩)
+        """
+        entry = self.modules[module_name]
+        source_path = self.get_source_path(module_name)
+        try:
+            stat = source_path.stat()
+        except OSError:
+            self._mark_stale(module_name)
+            return False
+
+        key = (stat.st_size, stat.st_mtime_ns)
+        cached = self._current.get(module_name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        current = stat.st_size == entry["size"] and stat.st_mtime == entry["mtime"]
+        if not current and stat.st_size == entry["size"]:
+            try:
+                current = _file_sha256(source_path) == entry["sha256"]
+            except OSError:
+                current = False
+
+        if not current:
+            self._mark_stale(module_name)
+        self._current[module_name] = (key, current)
+        return current
+
+    def _mark_stale(self, module_name):
+        if module_name not in self.stale:
+            self.stale.append(module_name)
+
+    def get_code(self, module_name):
+        """번들의 코드 객체 (co_filename을 실제 소스 경로로 보정)"""
+        entry = self.modules[module_name]
+        code = marshal.loads(self._archive.read(entry["code"]))
+        source_path = str(self.get_source_path(module_name))
+        fix_co_filename = getattr(sys.modules.get("_imp"), "_fix_co_filename", None)
+        if fix_co_filename:
+            fix_co_filename(code, source_path)
+        return code
+
+    def close(self):
+        self._archive.close()
+
+
+class BundleLoader:
+    """번들 코드 객체를 실행하는 loader (get_source/get_filename은 원래 소스 파일 사용)"""
+
+    def __init__(self, bundle, module_name):
+        self.bundle = bundle
+        self.name = module_name
+        self.path = str(bundle.get_source_path(module_name))
+
+    def create_module(self, spec):
+        return None
+
+    def exec_module(self, module):
+        code = self.bundle.get_code(self.name)
+        self.bundle.loaded += 1
+        exec(code, module.__dict__)
+
+    def is_package(self, fullname):
+        return self.bundle.modules[fullname]["package"]
+
+    def get_code(self, fullname):
+        return self.bundle.get_code(fullname)
+
+    def get_filename(self, fullname):
+        return self.path
+
+    def get_source(self, fullname):
+        return importlib.machinery.SourceFileLoader(fullname, self.path).get_source(fullname)
+
+
+class BundleFinder:
+    """번들에 있는 최신 모듈만 처리하는 meta path finder"""
+
+    def __init__(self, bundle):
+        self.bundle = bundle
+        self.source_root = os.path.normcase(os.path.abspath(bundle.source_root))
+        self.excluded = set()
+
+    def find_spec(self, fullname, path=None, target=None):
+        entry = self.bundle.modules.get(fullname)
+        if entry is None:
+            return None
+        if "." not in fullname and fullname in self.excluded:
+            return None
+
+        source_path = str(self.bundle.get_source_path(fullname))
+        # 하위 모듈은 부모 패키지의 __path__가 번들 소스 폴더일 때만 처리
+        if path is not None and "." in fullname:
+            module_dir = os.path.dirname(os.path.dirname(source_path) if entry["package"] else source_path)
+            module_dir = os.path.normcase(os.path.abspath(module_dir))
+            if not any(os.path.normcase(os.path.abspath(item)) == module_dir for item in path):
+                return None
+
+        if not self.bundle.is_current(fullname):
+            return None
+
+        loader = BundleLoader(self.bundle, fullname)
+        search_locations = [os.path.dirname(source_path)] if entry["package"] else None
+        spec = importlib.util.spec_from_file_location(
+            fullname, source_path, loader=loader, submodule_search_locations=search_locations)
+        spec.cached = None
+        return spec
+
+    def format_stats(self):
+        manifest = self.bundle.manifest
+        return (f"📦 바이트코드 번들: {len(self.bundle.modules)}개 모듈 (Python {manifest.get('python_full')}, "
+                f"{manifest.get('built')}), 로딩 {self.bundle.loaded}개, 소스 변경으로 제외 {len(self.bundle.stale)}개")
+
+
+def get_installed_finder():
+    """설치된 BundleFinder (없으면 None)"""
+    for finder in sys.meta_path:
+        if isinstance(finder, BundleFinder):
+            return finder
+    return None
+
+
+def install_bundle(source_root, bundle_path=None):
+    """번들이 있고 현재 Python과 맞으면 BundleFinder 설치
+
+    Returns:
+        (BundleFinder | None, str | None): (설치된 finder, 설치하지 않은 이유)
+    """
+    finder = get_installed_finder()
+    if finder is not None:
+        return finder, None
+
+    bundle_path = Path(bundle_path) if bundle_path else get_default_bundle_path(source_root)
+    if not bundle_path.exists():
+        return None, f"번들 없음: {bundle_path}"
+
+    try:
+        bundle = BytecodeBundle(bundle_path, source_root)
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile) as e:
+        return None, f"번들 읽기 실패: {e}"
+
+    problem = bundle.get_problem()
+    if problem:
+        bundle.close()
+        return None, problem
+
+    finder = BundleFinder(bundle)
+    try:
+        from util.module_index import get_other_path_names
+        finder.excluded = get_other_path_names(source_root)
+    except ImportError:
+        pass
+
+    # 모듈 인덱스/기본 PathFinder보다 앞에 설치
+    position = len(sys.meta_path)
+    for i, meta_finder in enumerate(sys.meta_path):
+        if meta_finder is importlib.machinery.PathFinder or type(meta_finder).__name__ == "ModuleIndexFinder":
+            position = i
+            break
+    sys.meta_path.insert(position, finder)
+    return finder, None
+
+
+def main(argv=None):
+    """번들 빌드 CLI"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="MaidCat Python 바이트코드 번들 빌드")
+    parser.add_argument("--source", default=str(Path(__file__).resolve().parent.parent),
+                        help="Content/Python 폴더 (기본: 이 파일 기준)")
+    parser.add_argument("--output", default=None, help="번들 경로 (기본: Content/PythonBundle/maidcat_python.zip)")
+    parser.add_argument("--optimize", type=int, default=DEFAULT_OPTIMIZE, choices=[0, 1, 2],
+                        help="컴파일 최적화 수준 (2는 docstring 제거)")
+    args = parser.parse_args(argv)
+
+    start_time = time.perf_counter()
+    output = args.output or get_default_bundle_path(args.source)
+    manifest = build_bundle(args.source, output, optimize=args.optimize)
+    duration = (time.perf_counter() - start_time) * 1000
+
+    print(f"✅ 번들 생성: {output}")
+    print(f"   📦 {len(manifest['modules'])}개 모듈, Python {manifest['python_full']}, optimize={args.optimize} ({duration:.0f}ms)")
+    for module_name, error in sorted(manifest["errors"].items()):
+        print(f"   ⚠️  컴파일 실패로 제외: {module_name} - {error}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
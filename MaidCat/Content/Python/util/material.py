@@ -1,71 +1,59 @@
 import unreal
 
-def find_heavy_materials(instruction_threshold, workingPath="/Game/"):
-    editorAssetLib = unreal.EditorAssetLibrary
+from util import asset_iter
+
+def find_heavy_materials(instruction_threshold, workingPath="/Game/", chunk_size=asset_iter.DEFAULT_CHUNK_SIZE,
+                         memory_limit_mb=None):
     materialEditingLib = unreal.MaterialEditingLibrary
 
-    allAssets = editorAssetLib.list_assets(workingPath, True, False)
-    allAssetsCount = len(allAssets)
-    selectedAssetPath = workingPath
+    # 에셋 로드 없이 Asset Registry에서 Material 후보만 수집
+    materialDataList = list(asset_iter.iter_asset_data(workingPath, class_names={"Material"}))
+    materialCount = len(materialDataList)
 
-    materialObjectList = []
+    # UObject 대신 경로만 보관하여 청크 사이에 메모리가 회수되도록 함
+    materialPathList = []
 
-    if (allAssetsCount > 0):
-        with unreal.ScopedSlowTask(allAssetsCount, selectedAssetPath) as slowTask:
+    if (materialCount > 0):
+        with unreal.ScopedSlowTask(materialCount, workingPath) as slowTask:
             slowTask.make_dialog(True)
-            for asset in allAssets:
-                assetData = editorAssetLib.find_asset_data(asset)
-                selectedAssetPath = assetData.asset_name
-                if(assetData.asset_class_path.asset_name == "Material"):
-                    mat = assetData.get_asset()
-                    stat = materialEditingLib.get_statistics(mat)
-                    if(stat.num_pixel_shader_instructions>instruction_threshold):
-                        materialObjectList.append(mat)
-                    if slowTask.should_cancel():
-                        break
-                    slowTask.enter_progress_frame(1, asset)
-
-    tagSystem = unreal.get_engine_subsystem(unreal.AssetTagsSubsystem)
+            for assetData, mat in asset_iter.iter_loaded_assets(materialDataList, chunk_size, memory_limit_mb):
+                stat = materialEditingLib.get_statistics(mat)
+                if(stat.num_pixel_shader_instructions>instruction_threshold):
+                    materialPathList.append(str(assetData.package_name))
+                if slowTask.should_cancel():
+                    break
+                slowTask.enter_progress_frame(1, str(assetData.asset_name))
+
     collectionName = "HeavyMaterials"
-    tagSystem.create_collection(collectionName, share_type=unreal.CollectionShareType.LOCAL)
-    tagSystem.add_asset_ptrs_to_collection(collectionName, materialObjectList)
+    asset_iter.add_paths_to_collection(collectionName, materialPathList)
+    return materialPathList
 
-def find_two_sided(workingPath="/Game/"):
-    
-    editorAssetLib = unreal.EditorAssetLibrary
+def find_two_sided(workingPath="/Game/", chunk_size=asset_iter.DEFAULT_CHUNK_SIZE, memory_limit_mb=None):
 
-    allAssets = editorAssetLib.list_assets(workingPath, True, False)
-    allAssetsCount = len(allAssets)
-    selectedAssetPath = workingPath
-    materialObjectList = []
+    materialClassNames = {"Material", "MaterialInstance", "MaterialInstanceConstant"}
+    materialDataList = list(asset_iter.iter_asset_data(workingPath, class_names=materialClassNames))
+    materialCount = len(materialDataList)
+    materialPathList = []
 
-    if (allAssetsCount > 0):
-        with unreal.ScopedSlowTask(allAssetsCount, selectedAssetPath) as slowTask:
+    if (materialCount > 0):
+        with unreal.ScopedSlowTask(materialCount, workingPath) as slowTask:
             slowTask.make_dialog(True)
-            for asset in allAssets:
-                assetData = editorAssetLib.find_asset_data(asset)
-                selectedAssetPath = assetData.asset_name
+            for assetData, mat in asset_iter.iter_loaded_assets(materialDataList, chunk_size, memory_limit_mb):
                 if(assetData.asset_class_path.asset_name == "Material"):
-                    mat = assetData.get_asset()
                     if(mat.get_editor_property("two_sided") == True):
-                    #materialAssetDataList.append(assetData)
-                        materialObjectList.append(mat)
+                        materialPathList.append(str(assetData.package_name))
 
-                elif (assetData.asset_class_path.asset_name == "MaterialInstance" or assetData.asset_class_path.asset_name == "MaterialInstanceConstant"):                
-                    mat = assetData.get_asset()
+                else:
                     baseOverrides = mat.get_editor_property("base_property_overrides")
                     if (baseOverrides.get_editor_property("override_two_sided") == True):
-                    #materialAssetDataList.append(assetData)
-                        materialObjectList.append(mat)
+                        materialPathList.append(str(assetData.package_name))
 
-                    if slowTask.should_cancel():
-                        break
-                    slowTask.enter_progress_frame(1, asset)
+                if slowTask.should_cancel():
+                    break
+                slowTask.enter_progress_frame(1, str(assetData.asset_name))
 
-    tagSystem = unreal.get_engine_subsystem(unreal.AssetTagsSubsystem)
-    tagSystem.create_collection("TwoSided", share_type=unreal.CollectionShareType.LOCAL)
-    #tagSystem.add_asset_datas_to_collection(unreal.Name("TwoSided"),materialAssetDataList)
-    tagSystem.add_asset_ptrs_to_collection(unreal.Name("TwoSided"), materialObjectList)
+    asset_iter.add_paths_to_collection("TwoSided", materialPathList)
+    return materialPathList
 
 def migrate_material_parameters():
     """
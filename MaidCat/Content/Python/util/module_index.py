@@ -0,0 +1,260 @@
+"""
+MaidCat Module Index Finder
+플러그인 Python 폴더의 모듈 이름 → 파일 인덱스로 import를 처리하는 meta path finder
+
+기본 import 시스템은 import할 때마다 sys.path 항목을 차례로 확인합니다.
+editor/tool/validator/ui처럼 __init__.py가 없는 namespace 패키지는 모든 sys.path 항목을 훑어야 하므로,
+플러그인 폴더가 네트워크 드라이브에 있으면 import마다 수백 ms가 걸릴 수 있습니다.
+
+ModuleIndexFinder는 세션마다 한 번 MaidCat 폴더를 스캔해 인덱스를 만들고,
+플러그인 모듈은 dict 조회 한 번으로 spec을 반환합니다. 그 외 모듈은 None을 반환해 기본 finder로 넘깁니다.
+
+- 다른 sys.path 항목에도 같은 최상위 이름이 있으면 (가리기/namespace 병합) 인덱스에서 제외
+- 인덱스에 없는 하위 모듈을 찾을 때만 해당 폴더의 mtime을 확인하고, 바뀌었으면 그 폴더만 다시 스캔
+- 인덱스에 있는 모듈은 파일이 아직 있는지 확인하고, 삭제/이름 변경되었으면 항목을 지우고 기본 finder로 넘김
+- importlib.invalidate_caches() 호출 시 인덱스 전체를 다시 생성
+
+사용법:
+    finder = install_module_index([plugin_python_dir, project_ta_python_dir])
+    print(finder.format_stats())
+"""
+
+import importlib.machinery
+import importlib.util
+import os
+import sys
+import time
+import zipfile
+
+
+SOURCE_SUFFIX = ".py"
+SKIP_DIR_NAMES = {"__pycache__"}
+
+
+def _normalize(path):
+    return os.path.normcase(os.path.abspath(path))
+
+
+def _list_top_level_names(path_entry):
+    """sys.path 항목 하나에서 import 가능한 최상위 이름 집합 (세션당 한 번)"""
+    names = set()
+    if os.path.isdir(path_entry):
+        try:
+            entries = os.listdir(path_entry)
+        except OSError:
+            return names
+        for entry in entries:
+            name = entry.split(".", 1)[0]
+            if name:
+                names.add(name)
+    elif zipfile.is_zipfile(path_entry):
+        try:
+            with zipfile.ZipFile(path_entry) as archive:
+                for member in archive.namelist():
+                    name = member.split("/", 1)[0].split(".", 1)[0]
+                    if name:
+                        names.add(name)
+        except (OSError, zipfile.BadZipFile):
+            pass
+    return names
+
+
+def get_other_path_names(root):
+    """root를 제외한 sys.path 항목들이 제공하는 최상위 이름 집합 (이 이름들은 root에서 바로 처리하면 안 됨)"""
+    root = _normalize(root)
+    names = set()
+    for entry in sys.path:
+        if entry and _normalize(entry) != root:
+            names |= _list_top_level_names(_normalize(entry))
+    return names
+
+
+class ModuleIndexFinder:
+    """플러그인 폴더 모듈 인덱스 기반 meta path finder
+
+    인덱스 항목: {"path": 파일 또는 폴더, "kind": "module" | "package" | "namespace", "parent_dir": 폴더}
+    """
+
+    def __init__(self, roots):
+        self.roots = [_normalize(root) for root in roots if os.path.isdir(root)]
+        self.index = {}
+        self.dir_mtimes = {}
+        self.excluded = set()
+        self.hits = 0
+        self.rescans = 0
+        self.build_ms = 0.0
+        self.build()
+
+    # ------------------------------------------------------------------------
+    # 인덱스 생성
+    # ------------------------------------------------------------------------
+
+    def build(self):
+        """모든 루트를 스캔하여 인덱스 생성"""
+        start_time = time.perf_counter()
+        self.index = {}
+        self.dir_mtimes = {}
+        self.excluded = set()
+
+        sys_path = [_normalize(entry) for entry in sys.path if entry]
+        for root in self.roots:
+            if root not in sys_path:
+                # sys.path에 없는 폴더는 원래 import되지 않으므로 인덱스에 넣지 않음
+                continue
+            self._scan_dir(root, "", get_other_path_names(root))
+
+        self.build_ms = (time.perf_counter() - start_time) * 1000
+
+    def _scan_dir(self, directory, prefix, excluded_names=None):
+        """폴더 하나를 스캔하여 인덱스에 추가 (하위 패키지는 재귀)"""
+        try:
+            self.dir_mtimes[directory] = os.stat(directory).st_mtime
+            entries = list(os.scandir(directory))
+        except OSError:
+            return
+
+        modules = {}
+        packages = {}
+        namespaces = {}
+        for entry in entries:
+            name = entry.name
+            if entry.is_dir():
+                if name in SKIP_DIR_NAMES or name.startswith(".") or not name.isidentifier():
+                    continue
+                if os.path.isfile(os.path.join(entry.path, "__init__" + SOURCE_SUFFIX)):
+                    packages[name] = entry.path
+                else:
+                    namespaces[name] = entry.path
+            elif name.endswith(SOURCE_SUFFIX):
+                stem = name[:-len(SOURCE_SUFFIX)]
+                if stem.isidentifier() and stem != "__init__":
+                    modules[stem] = entry.path
+
+        # 기본 FileFinder와 같은 우선순위: 패키지 > 모듈 > namespace 패키지
+        for name in set(modules) | set(packages) | set(namespaces):
+            if excluded_names is not None and name in excluded_names:
+                self.excluded.add(name)
+                continue
+            fullname = prefix + name
+            if name in packages:
+                self.index[fullname] = {"path": packages[name], "kind": "package", "parent_dir": directory}
+                self._scan_dir(_normalize(packages[name]), fullname + ".")
+            elif name in modules:
+                self.index[fullname] = {"path": modules[name], "kind": "module", "parent_dir": directory}
+            else:
+                self.index[fullname] = {"path": namespaces[name], "kind": "namespace", "parent_dir": directory}
+                self._scan_dir(_normalize(namespaces[name]), fullname + ".")
+
+    def _entry_exists(self, entry):
+        """인덱스 항목의 파일(패키지는 __init__.py)이 아직 있는지 확인"""
+        if entry["kind"] == "package":
+            return os.path.isfile(os.path.join(entry["path"], "__init__" + SOURCE_SUFFIX))
+        if entry["kind"] == "namespace":
+            return os.path.isdir(entry["path"])
+        return os.path.isfile(entry["path"])
+
+    def _drop(self, fullname):
+        """항목과 하위 모듈 항목 제거"""
+        prefix = fullname + "."
+        for name in [name for name in self.index if name == fullname or name.startswith(prefix)]:
+            del self.index[name]
+
+    def _rescan_if_changed(self, fullname):
+        """인덱스에 없는 하위 모듈 요청 시 부모 폴더가 바뀌었으면 다시 스캔 (다시 스캔했으면 True)"""
+        parent_name = fullname.rpartition(".")[0]
+        parent = self.index.get(parent_name)
+        if parent is None or parent["kind"] == "module":
+            return False
+
+        directory = _normalize(parent["path"])
+        try:
+            mtime = os.stat(directory).st_mtime
+        except OSError:
+            return False
+        if mtime == self.dir_mtimes.get(directory):
+            return False
+
+        prefix = parent_name + "."
+        for name in [name for name in self.index if name.startswith(prefix)]:
+            del self.index[name]
+        self._scan_dir(directory, prefix)
+        self.rescans += 1
+        return True
+
+    # ------------------------------------------------------------------------
+    # meta path finder 프로토콜
+    # ------------------------------------------------------------------------
+
+    def find_spec(self, fullname, path=None, target=None):
+        entry = self.index.get(fullname)
+        if entry is None:
+            if "." not in fullname or not self._rescan_if_changed(fullname):
+                return None
+            entry = self.index.get(fullname)
+            if entry is None:
+                return None
+
+        # 하위 모듈은 부모 패키지의 __path__가 인덱스의 폴더일 때만 처리
+        if path is not None and "." in fullname:
+            parent_dir = entry["parent_dir"]
+            if not any(_normalize(item) == parent_dir for item in path):
+                return None
+
+        # 세션 중 삭제/이름 변경된 파일 → FileNotFoundError 대신 기본 finder의 ModuleNotFoundError가 나도록 넘김
+        if not self._entry_exists(entry):
+            self._drop(fullname)
+            return None
+
+        self.hits += 1
+        if entry["kind"] == "namespace":
+            spec = importlib.machinery.ModuleSpec(fullname, None, is_package=True)
+            spec.submodule_search_locations = [entry["path"]]
+            return spec
+        if entry["kind"] == "package":
+            init_path = os.path.join(entry["path"], "__init__" + SOURCE_SUFFIX)
+            return importlib.util.spec_from_file_location(
+                fullname, init_path, submodule_search_locations=[entry["path"]])
+        return importlib.util.spec_from_file_location(fullname, entry["path"])
+
+    def invalidate_caches(self):
+        """importlib.invalidate_caches()에서 호출 → 인덱스 재생성"""
+        self.build()
+
+    def format_stats(self):
+        """인덱스 상태 문자열"""
+        return (f"📇 모듈 인덱스: {len(self.index)}개 모듈, 생성 {self.build_ms:.1f}ms, "
+                f"조회 {self.hits}회, 재스캔 {self.rescans}회, 제외 {len(self.excluded)}개")
+
+
+def get_installed_finder():
+    """설치된 ModuleIndexFinder (없으면 None)"""
+    for finder in sys.meta_path:
+        if isinstance(finder, ModuleIndexFinder):
+            return finder
+    return None
+
+
+def install_module_index(roots):
+    """ModuleIndexFinder를 기본 PathFinder 앞에 설치 (이미 설치되어 있으면 루트를 추가하고 재생성)"""
+    finder = get_installed_finder()
+    if finder is not None:
+        new_roots = [_normalize(root) for root in roots if os.path.isdir(root)]
+        finder.roots.extend(root for root in new_roots if root not in finder.roots)
+        finder.build()
+        return finder
+
+    finder = ModuleIndexFinder(roots)
+    position = len(sys.meta_path)
+    for i, meta_finder in enumerate(sys.meta_path):
+        if meta_finder is importlib.machinery.PathFinder:
+            position = i
+            break
+    sys.meta_path.insert(position, finder)
+    return finder
+
+
+def uninstall_module_index():
+    """설치된 ModuleIndexFinder 제거"""
+    finder = get_installed_finder()
+    if finder is not None:
+        sys.meta_path.remove(finder)
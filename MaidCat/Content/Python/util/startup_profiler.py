@@ -0,0 +1,352 @@
+"""
+MaidCat Startup Import Profiler
+플러그인 시작 시 import 트리를 측정하고 이전 실행과 비교하는 프로파일러
+
+python -X importtime처럼 모듈별 self 시간(하위 import 제외)과 누적 시간(하위 import 포함)을
+중첩 트리로 기록합니다. sys.meta_path 맨 앞에 finder를 끼워 넣어 각 모듈의 exec_module을 감싸므로
+import 문, importlib.import_module 어느 쪽으로 로딩되어도 측정됩니다.
+
+실행마다 Saved/MaidCat/startup_profile.jsonl에 한 줄씩 추가하고,
+최근 실행들의 중앙값(롤링 기준선)보다 임계값 이상 느려진 모듈을 경고합니다.
+
+사용법:
+    profiler = StartupProfiler()
+    profiler.start()
+    ...  # startup 모듈 import / 실행
+    profiler.stop()
+    print(profiler.format_tree())
+    regressions = profiler.save_and_compare(get_default_profile_path())
+"""
+
+import contextlib
+import json
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+
+
+PROFILE_FILE_NAME = "startup_profile.jsonl"
+
+# 트리/회귀 비교 대상 패키지
+TRACKED_PACKAGES = ("startup", "editor", "tool", "ue")
+
+BASELINE_RUNS = 10            # 기준선에 사용할 최근 실행 수
+REGRESSION_THRESHOLD = 0.5    # 기준선 대비 50% 이상 느려지면 경고
+REGRESSION_MIN_MS = 20.0      # 절대 증가량이 이보다 작으면 무시 (측정 잡음)
+MAX_STORED_RUNS = 100         # jsonl에 보관할 최대 실행 수
+
+
+def get_default_profile_path():
+    """Saved/MaidCat/startup_profile.jsonl 경로 반환"""
+    import unreal
+    return Path(unreal.SystemLibrary.get_project_saved_directory()) / "MaidCat" / PROFILE_FILE_NAME
+
+
+def is_tracked_module(module_name, packages=TRACKED_PACKAGES):
+    """모듈이 추적 대상 패키지에 속하는지 확인"""
+    return module_name.split(".", 1)[0] in packages
+
+
+# ============================================================================
+# import 훅
+# ============================================================================
+
+class _TimedLoader:
+    """원래 loader의 exec_module을 감싸 실행 시간을 프로파일러에 보고"""
+
+    def __init__(self, loader, profiler):
+        self._loader = loader
+        self._profiler = profiler
+
+    def create_module(self, spec):
+        create_module = getattr(self._loader, "create_module", None)
+        return create_module(spec) if create_module else None
+
+    def exec_module(self, module):
+        # 모듈에는 원래 loader가 남도록 되돌림 (get_data/get_resource_reader 등)
+        module.__loader__ = self._loader
+        if getattr(module, "__spec__", None) is not None:
+            module.__spec__.loader = self._loader
+        self._profiler._enter(module.__name__)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._exit(module.__name__)
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+
+class _ProfilingFinder:
+    """나머지 meta_path finder에 위임하고 찾은 spec의 loader만 교체"""
+
+    def __init__(self, profiler):
+        self._profiler = profiler
+
+    def find_spec(self, fullname, path=None, target=None):
+        if not self._profiler._is_recording_thread():
+            return None
+
+        for finder in sys.meta_path:
+            if finder is self:
+                continue
+            find_spec = getattr(finder, "find_spec", None)
+            if find_spec is None:
+                continue
+            spec = find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                spec.loader = _TimedLoader(spec.loader, self._profiler)
+            return spec
+        return None
+
+
+# ============================================================================
+# 프로파일러
+# ============================================================================
+
+class StartupProfiler:
+    """시작 시 import 트리 프로파일러
+
+    노드 dict:
+        {"module", "parent", "depth", "self_ms", "cumulative_ms", "order"}
+    """
+
+    def __init__(self, packages=TRACKED_PACKAGES):
+        self.packages = tuple(packages)
+        self.nodes = []
+        self.sections = []
+        self.started_at = None
+        self.total_ms = 0.0
+
+        self._finder = _ProfilingFinder(self)
+        self._thread_id = None
+        self._stack = []
+        self._start_time = None
+
+    # ------------------------------------------------------------------------
+    # 측정
+    # ------------------------------------------------------------------------
+
+    def start(self):
+        """import 측정 시작 (이전 결과 초기화, start()를 호출한 스레드의 import만 기록)"""
+        if self._finder in sys.meta_path:
+            return
+        self.nodes = []
+        self.sections = []
+        self._stack = []
+        self.total_ms = 0.0
+        self.started_at = time.strftime("%Y-%m-%dT%H:%M:%S")
+        self.resume()
+
+    def resume(self):
+        """일시 중지한 측정 재개 (결과 유지)"""
+        if self._finder in sys.meta_path:
+            return
+        self._thread_id = threading.get_ident()
+        self._start_time = time.perf_counter()
+        sys.meta_path.insert(0, self._finder)
+
+    def pause(self):
+        """측정 일시 중지 (total_ms는 측정 중이던 시간의 합)"""
+        if self._finder in sys.meta_path:
+            sys.meta_path.remove(self._finder)
+        if self._start_time is not None:
+            self.total_ms += (time.perf_counter() - self._start_time) * 1000
+            self._start_time = None
+        self._thread_id = None
+
+    def stop(self):
+        """import 측정 종료"""
+        self.pause()
+
+    @contextlib.contextmanager
+    def recording(self):
+        """with 블록 동안만 측정 (지연 실행되는 시작 작업용, 이미 측정 중이면 그대로 유지)"""
+        if self._finder in sys.meta_path:
+            yield self
+            return
+        self.resume()
+        try:
+            yield self
+        finally:
+            self.pause()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+        return False
+
+    def add_section(self, name, duration_ms, status="ok"):
+        """import 트리 외에 startup 파일 단위 실행 시간(main() 포함)을 기록"""
+        self.sections.append({"name": name, "ms": round(duration_ms, 3), "status": status})
+
+    def _is_recording_thread(self):
+        return self._thread_id is not None and threading.get_ident() == self._thread_id
+
+    def _enter(self, module_name):
+        if not self._is_recording_thread():
+            return
+        parent = self._stack[-1] if self._stack else None
+        node = {
+            "module": module_name,
+            "parent": parent["module"] if parent else None,
+            "depth": len(self._stack),
+            "self_ms": 0.0,
+            "cumulative_ms": 0.0,
+            "order": len(self.nodes),
+            "_start": time.perf_counter(),
+            "_children_ms": 0.0,
+        }
+        self.nodes.append(node)
+        self._stack.append(node)
+
+    def _exit(self, module_name):
+        if not self._is_recording_thread() or not self._stack:
+            return
+        node = self._stack.pop()
+        cumulative = (time.perf_counter() - node.pop("_start")) * 1000
+        node["cumulative_ms"] = round(cumulative, 3)
+        node["self_ms"] = round(max(0.0, cumulative - node.pop("_children_ms")), 3)
+        # 부모의 self 시간에서 빠지도록 하위 시간에 더함
+        if self._stack:
+            self._stack[-1]["_children_ms"] += cumulative
+
+    # ------------------------------------------------------------------------
+    # 결과
+    # ------------------------------------------------------------------------
+
+    def to_record(self):
+        """jsonl 한 줄에 저장할 실행 기록"""
+        return {
+            "started": self.started_at,
+            "python": f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
+            "total_ms": round(self.total_ms, 3),
+            "sections": self.sections,
+            "modules": [
+                {key: node[key] for key in ("module", "parent", "depth", "self_ms", "cumulative_ms")}
+                for node in self.nodes if "_start" not in node
+            ],
+        }
+
+    def format_tree(self, min_ms=1.0, tracked_only=True):
+        """-X importtime 형식의 트리 문자열
+
+        Args:
+            min_ms: 누적 시간이 이보다 작은 노드는 생략
+            tracked_only: True면 추적 대상 패키지 모듈만 표시
+        """
+        lines = [f"{'self [ms]':>10} | {'cumulative':>10} | imported package"]
+        for node in self.nodes:
+            if "_start" in node or node["cumulative_ms"] < min_ms:
+                continue
+            if tracked_only and not is_tracked_module(node["module"], self.packages):
+                continue
+            indent = "  " * node["depth"]
+            lines.append(f"{node['self_ms']:10.1f} | {node['cumulative_ms']:10.1f} | {indent}{node['module']}")
+        return "\n".join(lines)
+
+    def save_and_compare(self, profile_path, threshold=REGRESSION_THRESHOLD,
+                         min_delta_ms=REGRESSION_MIN_MS, baseline_runs=BASELINE_RUNS):
+        """이전 실행들과 비교한 뒤 이번 실행을 저장
+
+        Returns:
+            list: 느려진 모듈 [{"module", "current_ms", "baseline_ms", "delta_ms", "ratio"}, ...]
+        """
+        history = load_profile_history(profile_path)
+        record = self.to_record()
+        regressions = find_regressions(record, history[-baseline_runs:], self.packages,
+                                       threshold=threshold, min_delta_ms=min_delta_ms)
+        append_profile_record(profile_path, record, history_length=len(history))
+        return regressions
+
+
+# ============================================================================
+# 저장 / 회귀 비교
+# ============================================================================
+
+def load_profile_history(profile_path):
+    """jsonl의 이전 실행 기록 목록 (깨진 줄은 무시)"""
+    path = Path(profile_path)
+    if not path.exists():
+        return []
+
+    history = []
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    history.append(json.loads(line))
+                except ValueError:
+                    continue
+    except OSError as e:
+        print(f"⚠️ 시작 프로파일 기록 읽기 실패: {e}")
+    return history
+
+
+def append_profile_record(profile_path, record, history_length=None):
+    """실행 기록을 jsonl에 추가 (MAX_STORED_RUNS를 넘으면 오래된 기록 정리)"""
+    path = Path(profile_path)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if history_length is not None and history_length >= MAX_STORED_RUNS:
+            kept = load_profile_history(path)[-(MAX_STORED_RUNS - 1):]
+            with open(path, "w", encoding="utf-8") as f:
+                for old_record in kept:
+                    f.write(json.dumps(old_record, ensure_ascii=False))
+                    f.write("\n")
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False))
+            f.write("\n")
+    except OSError as e:
+        print(f"⚠️ 시작 프로파일 저장 실패: {e}")
+
+
+def find_regressions(record, history, packages=TRACKED_PACKAGES,
+                     threshold=REGRESSION_THRESHOLD, min_delta_ms=REGRESSION_MIN_MS):
+    """이번 실행에서 기준선(최근 실행들의 누적 시간 중앙값)보다 느려진 모듈 목록"""
+    baseline_values = {}
+    for old_record in history:
+        for module in old_record.get("modules", []):
+            baseline_values.setdefault(module["module"], []).append(module["cumulative_ms"])
+
+    regressions = []
+    for module in record.get("modules", []):
+        name = module["module"]
+        if not is_tracked_module(name, packages) or name not in baseline_values:
+            continue
+        baseline = statistics.median(baseline_values[name])
+        current = module["cumulative_ms"]
+        delta = current - baseline
+        if delta < min_delta_ms or current <= baseline * (1.0 + threshold):
+            continue
+        regressions.append({
+            "module": name,
+            "current_ms": current,
+            "baseline_ms": round(baseline, 3),
+            "delta_ms": round(delta, 3),
+            "ratio": (current / baseline) if baseline else None,
+        })
+
+    regressions.sort(key=lambda item: item["delta_ms"], reverse=True)
+    return regressions
+
+
+def format_regressions(regressions):
+    """회귀 경고 문자열"""
+    lines = [f"⚠️ 시작 시간 회귀 ({len(regressions)}개 모듈):"]
+    for item in regressions:
+        ratio = f" (x{item['ratio']:.1f})" if item["ratio"] else ""
+        lines.append(
+            f"   🐌 {item['module']}: {item['baseline_ms']:.1f}ms → {item['current_ms']:.1f}ms "
+            f"(+{item['delta_ms']:.1f}ms){ratio}")
+    return "\n".join(lines)
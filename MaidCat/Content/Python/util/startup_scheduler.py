@@ -0,0 +1,331 @@
+"""
+MaidCat Startup Scheduler
+우선순위/의존성을 가진 시작 작업 스케줄러
+
+에디터 시작 시 모든 startup 모듈을 동기적으로 import/실행하면 에디터가 뜨는 시간이 늘어납니다.
+작업은 우선순위와 의존성을 선언하고,
+- PRIORITY_CRITICAL 작업(UClass/UStruct 등록 등)과 그 의존 작업은 부팅 중 바로 실행하고
+- 나머지(메뉴, 컨텍스트 메뉴 등)는 에디터가 조작 가능해진 뒤 슬레이트 틱마다
+  시간 예산만큼 나눠서 실행합니다.
+각 작업은 스케줄러(get_scheduler()) 수명 동안 정확히 한 번만 실행됩니다.
+
+작업 대상(target):
+    "package.module"            → 모듈 import 후 main()이 있으면 호출
+    "package.module:function"   → 모듈 import 후 function() 호출
+
+사용법:
+    scheduler = get_scheduler()
+    scheduler.add(StartupTask("bp_func", "startup.bp_func", priority=PRIORITY_CRITICAL))
+    scheduler.add(StartupTask("menus", "startup.extend_editor:initialize", depends=["bp_func"]))
+    scheduler.run_critical()
+    scheduler.start_deferred(on_finished=lambda s: print(s.format_summary()))
+"""
+
+import contextlib
+import importlib
+import time
+
+
+# 우선순위 (숫자가 작을수록 먼저 실행)
+PRIORITY_CRITICAL = 0     # 부팅 중 즉시 실행
+PRIORITY_HIGH = 10
+PRIORITY_NORMAL = 50
+PRIORITY_LOW = 100
+
+# 작업 상태
+STATE_PENDING = "pending"
+STATE_RUNNING = "running"
+STATE_DONE = "done"
+STATE_FAILED = "failed"
+STATE_SKIPPED = "skipped"
+
+DEFERRED_WARMUP_TICKS = 30        # 지연 작업 시작 전 건너뛸 슬레이트 틱 수 (에디터 안정화)
+DEFERRED_TICK_BUDGET_MS = 8.0     # 틱 하나에서 지연 작업에 쓸 시간 (최소 1개는 실행)
+DEFERRED_BUSY_FRAME_MS = 100.0    # 이보다 긴 프레임은 에디터가 바쁜 것으로 보고 대기
+DEFERRED_MAX_BUSY_TICKS = 300     # 바쁜 프레임 대기 한도 (넘으면 그대로 진행)
+
+
+class StartupTask:
+    """시작 작업 선언
+
+    Args:
+        name: 작업 이름 (고유)
+        target: "module" 또는 "module:function"
+        priority: 우선순위 (PRIORITY_CRITICAL이면 부팅 중 실행)
+        depends: 먼저 완료되어야 하는 작업 이름 목록
+        description: 로그용 설명
+    """
+
+    def __init__(self, name, target, priority=PRIORITY_NORMAL, depends=None, description=""):
+        self.name = name
+        self.target = target
+        self.priority = priority
+        self.depends = list(depends or [])
+        self.description = description
+
+        self.state = STATE_PENDING
+        self.duration_ms = 0.0
+        self.error = None
+        self.order = 0
+
+    @property
+    def is_critical(self):
+        return self.priority <= PRIORITY_CRITICAL
+
+    @property
+    def module_name(self):
+        return self.target.split(":", 1)[0]
+
+    def execute(self):
+        """대상 모듈 import 후 함수 호출"""
+        module_name, _, function_name = self.target.partition(":")
+        module = importlib.import_module(module_name)
+        if function_name:
+            getattr(module, function_name)()
+        elif callable(getattr(module, "main", None)):
+            module.main()
+
+    def __repr__(self):
+        return f"StartupTask({self.name!r}, {self.target!r}, priority={self.priority}, state={self.state!r})"
+
+
+class StartupScheduler:
+    """우선순위/의존성 기반 시작 작업 스케줄러
+
+    Args:
+        task_context: 작업 하나를 실행하는 동안 사용할 컨텍스트 매니저 팩토리 (예: 프로파일러 기록)
+        on_task_finished: 작업 완료/실패 시 호출 (task)
+    """
+
+    def __init__(self, task_context=None, on_task_finished=None):
+        self.tasks = {}
+        self.task_context = task_context
+        self.on_task_finished = on_task_finished
+
+        self._tick_handle = None
+        self._ticks = 0
+        self._busy_ticks = 0
+        self._on_finished = None
+
+    # ------------------------------------------------------------------------
+    # 작업 등록
+    # ------------------------------------------------------------------------
+
+    def add(self, task):
+        """작업 등록 (같은 이름이 이미 있으면 기존 작업 반환 → 중복 실행 방지)"""
+        existing = self.tasks.get(task.name)
+        if existing is not None:
+            return existing
+        task.order = len(self.tasks)
+        self.tasks[task.name] = task
+        return task
+
+    def add_all(self, tasks):
+        for task in tasks:
+            self.add(task)
+
+    def get_pending(self):
+        return [task for task in self.tasks.values() if task.state == STATE_PENDING]
+
+    @property
+    def is_finished(self):
+        return not self.get_pending()
+
+    # ------------------------------------------------------------------------
+    # 실행
+    # ------------------------------------------------------------------------
+
+    def _collect_with_dependencies(self, tasks):
+        """작업들과 (재귀적인) 의존 작업 이름 집합"""
+        names = set()
+        stack = [task.name for task in tasks]
+        while stack:
+            name = stack.pop()
+            if name in names or name not in self.tasks:
+                continue
+            names.add(name)
+            stack.extend(self.tasks[name].depends)
+        return names
+
+    def _next_ready_task(self, allowed=None):
+        """의존성이 모두 완료된 대기 작업 중 우선순위가 가장 높은 작업
+
+        의존 작업이 실패/건너뜀이면 해당 작업을 건너뜀 처리합니다.
+        """
+        while True:
+            ready = []
+            skipped_any = False
+            for task in self.get_pending():
+                if allowed is not None and task.name not in allowed:
+                    continue
+                dependency_states = [self.tasks[name].state if name in self.tasks else None
+                                     for name in task.depends]
+                if any(state in (STATE_FAILED, STATE_SKIPPED) for state in dependency_states):
+                    task.state = STATE_SKIPPED
+                    task.error = "의존 작업 실패"
+                    skipped_any = True
+                    self._notify_finished(task)
+                elif all(state == STATE_DONE for state in dependency_states):
+                    ready.append(task)
+            if ready:
+                return min(ready, key=lambda task: (task.priority, task.order))
+            if not skipped_any:
+                return None
+
+    def _fail_unresolved(self, allowed=None):
+        """실행할 수 없는 대기 작업 (없는 의존성 / 순환 의존성) 실패 처리"""
+        for task in self.get_pending():
+            if allowed is not None and task.name not in allowed:
+                continue
+            missing = [name for name in task.depends if name not in self.tasks]
+            task.state = STATE_FAILED
+            task.error = f"없는 의존 작업: {', '.join(missing)}" if missing else "순환 의존성"
+            self._notify_finished(task)
+
+    def run_task(self, task):
+        """작업 하나 실행 (이미 실행된 작업은 무시, 성공 여부 반환)"""
+        if task.state != STATE_PENDING:
+            return task.state == STATE_DONE
+
+        task.state = STATE_RUNNING
+        start_time = time.perf_counter()
+        try:
+            context = self.task_context() if self.task_context else contextlib.nullcontext()
+            with context:
+                task.execute()
+            task.state = STATE_DONE
+        except Exception as e:
+            task.state = STATE_FAILED
+            task.error = str(e)
+        task.duration_ms = (time.perf_counter() - start_time) * 1000
+        self._notify_finished(task)
+        return task.state == STATE_DONE
+
+    def _notify_finished(self, task):
+        if self.on_task_finished:
+            try:
+                self.on_task_finished(task)
+            except Exception as e:
+                print(f"⚠️ 시작 작업 콜백 오류 ({task.name}): {e}")
+
+    def run_critical(self):
+        """PRIORITY_CRITICAL 작업과 그 의존 작업을 즉시 실행 (실행한 작업 수 반환)"""
+        critical = [task for task in self.get_pending() if task.is_critical]
+        allowed = self._collect_with_dependencies(critical)
+
+        executed = 0
+        while True:
+            task = self._next_ready_task(allowed)
+            if task is None:
+                break
+            self.run_task(task)
+            executed += 1
+        self._fail_unresolved(allowed)
+        return executed
+
+    def run_all(self):
+        """남은 작업을 모두 즉시 실행 (슬레이트 틱이 없는 환경 / 수동 실행용)"""
+        executed = 0
+        while True:
+            task = self._next_ready_task()
+            if task is None:
+                break
+            self.run_task(task)
+            executed += 1
+        self._fail_unresolved()
+        return executed
+
+    def run_slice(self, budget_ms=DEFERRED_TICK_BUDGET_MS):
+        """시간 예산 안에서 준비된 작업 실행 (최소 1개, 남은 작업이 없으면 True)"""
+        start_time = time.perf_counter()
+        while True:
+            task = self._next_ready_task()
+            if task is None:
+                self._fail_unresolved()
+                return True
+            self.run_task(task)
+            if (time.perf_counter() - start_time) * 1000 >= budget_ms:
+                return self.is_finished
+
+    # ------------------------------------------------------------------------
+    # 에디터 슬레이트 틱 연동
+    # ------------------------------------------------------------------------
+
+    def start_deferred(self, on_finished=None):
+        """남은 작업을 슬레이트 틱에서 나눠 실행 (완료 시 on_finished(scheduler) 호출)"""
+        self._on_finished = on_finished
+        if self.is_finished:
+            self._finish()
+            return
+        if self._tick_handle is not None:
+            return
+
+        self._ticks = 0
+        self._busy_ticks = 0
+        try:
+            import unreal
+            self._tick_handle = unreal.register_slate_post_tick_callback(self._on_slate_tick)
+        except Exception as e:
+            # 슬레이트가 없는 환경 (커맨드렛 등) → 바로 실행
+            print(f"⚠️ 슬레이트 틱 등록 실패, 지연 작업을 바로 실행합니다: {e}")
+            self.run_all()
+            self._finish()
+
+    def cancel_deferred(self):
+        """지연 실행 중단 (남은 작업은 대기 상태로 유지)"""
+        if self._tick_handle is not None:
+            import unreal
+            unreal.unregister_slate_post_tick_callback(self._tick_handle)
+            self._tick_handle = None
+
+    def _on_slate_tick(self, delta_seconds):
+        self._ticks += 1
+        if self._ticks <= DEFERRED_WARMUP_TICKS:
+            return
+        # 에셋 로딩 등으로 프레임이 긴 동안은 기다림
+        if delta_seconds * 1000 > DEFERRED_BUSY_FRAME_MS and self._busy_ticks < DEFERRED_MAX_BUSY_TICKS:
+            self._busy_ticks += 1
+            return
+
+        try:
+            finished = self.run_slice()
+        except Exception as e:
+            print(f"❌ 지연 시작 작업 실행 실패: {e}")
+            finished = True
+
+        if finished:
+            self.cancel_deferred()
+            self._finish()
+
+    def _finish(self):
+        on_finished = self._on_finished
+        self._on_finished = None
+        if on_finished:
+            on_finished(self)
+
+    # ------------------------------------------------------------------------
+    # 결과
+    # ------------------------------------------------------------------------
+
+    def format_summary(self):
+        """작업별 상태/시간 요약 문자열"""
+        icons = {STATE_DONE: "✅", STATE_FAILED: "❌", STATE_SKIPPED: "⏭️", STATE_PENDING: "⏳", STATE_RUNNING: "🔄"}
+        lines = []
+        for task in sorted(self.tasks.values(), key=lambda task: task.order):
+            phase = "부팅" if task.is_critical else "지연"
+            line = f"   {icons[task.state]} [{phase}] {task.name}: {task.duration_ms:.1f}ms"
+            if task.error:
+                line += f" - {task.error}"
+            lines.append(line)
+        return "\n".join(lines)
+
+
+_scheduler = None
+
+
+def get_scheduler():
+    """프로세스 전역 스케줄러 (init_unreal을 다시 실행해도 작업이 중복 실행되지 않도록 공유)"""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = StartupScheduler()
+    return _scheduler
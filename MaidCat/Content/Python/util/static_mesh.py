@@ -1,42 +1,37 @@
 import unreal
 
+from util import asset_iter
+
 # @unreal.uclass()
 # class GetEditorAssetLibrary(unreal.EditorAssetLibrary):
 #     pass
 
 # editorAssetLib = GetEditorAssetLibrary()
 
-def find_uv_channel_count(threshold, path_to_find="/Game/"):
+def find_uv_channel_count(threshold, path_to_find="/Game/", chunk_size=asset_iter.DEFAULT_CHUNK_SIZE,
+                          memory_limit_mb=None):
     """
-    Finds all Static Mesh assets in the specified working path that have more than 2 UV channels.
+    Finds all Static Mesh assets in the specified working path that have more than `threshold` UV channels.
     Tags these assets in a collection named "StaticMeshes2+UV".
+    Meshes are loaded in chunks with garbage collection in between; results are kept as paths.
     """
 
-    editorAssetLib = unreal.EditorAssetLibrary
-
-    allAssets = editorAssetLib.list_assets(path_to_find, True, False)
-    allAssetsCount = len(allAssets)
-    #materialAssetDataList = []
-    meshList = []
+    meshDataList = list(asset_iter.iter_asset_data(path_to_find, class_names={"StaticMesh"}))
+    meshCount = len(meshDataList)
+    meshPathList = []
 
-    if (allAssetsCount > 0):
-        with unreal.ScopedSlowTask(allAssetsCount, path_to_find) as slowTask:
+    if (meshCount > 0):
+        with unreal.ScopedSlowTask(meshCount, path_to_find) as slowTask:
             slowTask.make_dialog(True)
-            for asset in allAssets:
-                assetData = editorAssetLib.find_asset_data(asset)
-                path_to_find = assetData.asset_name
-                if(assetData.asset_class_path.asset_name == "StaticMesh"):
-                    mesh = assetData.get_asset()
-                    num_uv_channels = unreal.EditorStaticMeshLibrary.get_num_uv_channels(mesh,0)
-                    if(num_uv_channels > threshold):
-                        meshList.append(mesh)
-
-                    if slowTask.should_cancel():
-                        break
-                    slowTask.enter_progress_frame(1, asset)
-
-    tagSystem = unreal.get_engine_subsystem(unreal.AssetTagsSubsystem)
+            for assetData, mesh in asset_iter.iter_loaded_assets(meshDataList, chunk_size, memory_limit_mb):
+                num_uv_channels = unreal.EditorStaticMeshLibrary.get_num_uv_channels(mesh,0)
+                if(num_uv_channels > threshold):
+                    meshPathList.append(str(assetData.package_name))
+
+                if slowTask.should_cancel():
+                    break
+                slowTask.enter_progress_frame(1, str(assetData.asset_name))
+
     collectionName = "StaticMeshes2+UV" #Unreal Name 은 공백 특수문자 불가
-    tagSystem.create_collection(collectionName, share_type=unreal.CollectionShareType.LOCAL)
-    #tagSystem.add_asset_datas_to_collection(unreal.Name("TwoSided"),materialAssetDataList)
-    tagSystem.add_asset_ptrs_to_collection(collectionName, meshList)
\ No newline at end of file
+    asset_iter.add_paths_to_collection(collectionName, meshPathList)
+    return meshPathList
@@ -0,0 +1,336 @@
+"""
+MaidCat Batch Validation Runner
+빌드 머신에서 여러 에디터 프로세스로 레벨 검증을 나누어 실행하는 헤드리스 러너
+
+구성:
+- Controller: 패키지 목록을 N개 샤드로 나누고 샤드마다 UnrealEditor-Cmd 프로세스 실행,
+  완료 후 샤드별 JSONL 리포트를 하나로 병합 (unreal 모듈 불필요)
+- Worker: 에디터 안(-run=pythonscript)에서 샤드의 레벨을 하나씩 로드하여
+  validator.level_validator의 Validator로 검증하고 JSONL로 스트리밍 기록
+- List: 에디터 안에서 Asset Registry 쿼리로 레벨 패키지 목록 생성
+
+사용법:
+    # 패키지 목록 파일로 4개 프로세스 실행
+    python validator/batch_runner.py --editor "C:/UE_5.4/Engine/Binaries/Win64/UnrealEditor-Cmd.exe" \
+        --project "D:/MyGame/MyGame.uproject" --packages maps.txt --workers 4 --output levels.jsonl
+
+    # Asset Registry 쿼리로 레벨 목록을 만든 뒤 실행
+    python validator/batch_runner.py --editor ... --project ... --query /Game/Maps --workers 8 \
+        --output levels.jsonl
+
+Worker/List 모드는 Controller가 아래와 같이 실행합니다:
+    UnrealEditor-Cmd.exe MyGame.uproject -run=pythonscript \
+        -script="batch_runner.py --worker --packages shard_0.txt --output shard_0.jsonl"
+
+-script 값은 따옴표로 감싸고, 공백이 있는 인자는 shlex로 작은따옴표 처리합니다.
+에디터는 -script 인자를 공백 기준으로만 나누므로 Worker/List 모드에서 shlex로 다시 분리합니다.
+"""
+
+import os
+import shlex
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional
+
+# 스크립트로 직접 실행될 때도 validator 패키지를 찾을 수 있도록 Content/Python 추가
+_PYTHON_ROOT = Path(__file__).resolve().parent.parent
+if str(_PYTHON_ROOT) not in sys.path:
+    sys.path.append(str(_PYTHON_ROOT))
+
+from validator.validation_report import merge_reports  # noqa: E402
+
+
+WORLD_CLASS_NAME = "World"
+
+
+# =============================================================================
+# 패키지 목록 / 샤드
+# =============================================================================
+
+def read_package_list(path) -> List[str]:
+    """패키지 목록 파일 읽기 (한 줄에 하나, 빈 줄과 '#' 주석 무시)"""
+    packages = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                packages.append(line)
+    return packages
+
+
+def write_package_list(path, packages):
+    """패키지 목록 파일 쓰기"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        for package in packages:
+            f.write(f"{package}\n")
+
+
+def shard_packages(packages, shard_count: int) -> List[List[str]]:
+    """패키지 목록을 shard_count개로 분할
+
+    정렬 후 라운드 로빈으로 나누어 같은 폴더의 큰 레벨들이 한 샤드에 몰리지 않게 합니다.
+    빈 샤드는 반환하지 않습니다.
+    """
+    shard_count = max(1, int(shard_count))
+    ordered = sorted(dict.fromkeys(packages))
+    shards = [ordered[i::shard_count] for i in range(shard_count)]
+    return [shard for shard in shards if shard]
+
+
+def find_level_packages(query: str, registry=None) -> List[str]:
+    """Asset Registry에서 query 경로 아래의 레벨(World) 패키지 목록 조회
+
+    Args:
+        query: 검색할 패키지 경로 (예: "/Game/Maps")
+        registry: get_assets_by_path()를 제공하는 Asset Registry (None이면 에디터 레지스트리)
+    """
+    if registry is None:
+        import unreal
+        registry = unreal.AssetRegistryHelpers.get_asset_registry()
+
+    packages = []
+    for asset_data in registry.get_assets_by_path(query, recursive=True):
+        if str(asset_data.asset_class_path.asset_name) == WORLD_CLASS_NAME:
+            packages.append(str(asset_data.package_name))
+    return sorted(dict.fromkeys(packages))
+
+
+# =============================================================================
+# Worker - 에디터 프로세스 내부
+# =============================================================================
+
+def _load_level(package_path: str):
+    """레벨을 에디터 월드로 로드 (Validator가 에디터 월드의 액터를 검사하므로)"""
+    import unreal
+    try:
+        world = unreal.EditorLoadingAndSavingUtils.load_map(package_path)
+        if world:
+            return world
+    except Exception as e:
+        unreal.log_warning(f"⚠️ load_map 실패, load_asset으로 대체: {package_path} ({e})")
+    return unreal.EditorAssetLibrary.load_asset(package_path)
+
+
+def run_worker(packages, output_path, loader=None, validators=None, gc_interval: int = 1) -> int:
+    """샤드의 레벨들을 검증하여 JSONL로 기록 (검증한 레벨 수 반환)
+
+    Args:
+        packages: 검증할 레벨 패키지 경로 목록
+        output_path: 샤드 JSONL 리포트 경로
+        loader: 패키지 경로 → World 객체 함수 (None이면 에디터에서 로드)
+        validators: Validator 인스턴스 목록 (None이면 MaidCat Level Validator 전체)
+        gc_interval: 가비지 컬렉션 사이에 검증할 레벨 수
+    """
+    from util import asset_iter
+    from validator import level_validator as lv
+
+    loader = loader or _load_level
+    if validators is None:
+        validators = [
+            lv.MaidCatLevelNamingValidator(),
+            lv.MaidCatLevelPerformanceValidator(),
+            lv.MaidCatLevelContentValidator(),
+        ]
+
+    def _load(package_path):
+        print(f"🔍 검증 중: {package_path}")
+        try:
+            world = loader(package_path)
+        except Exception as e:
+            print(f"❌ 레벨 로드 실패 ({package_path}): {e}")
+            return None
+        if not world:
+            print(f"⚠️ 레벨을 로드할 수 없습니다: {package_path}")
+        return world
+
+    validated_count = 0
+    with lv.report_to(output_path, "jsonl"):
+        for package_path, world in asset_iter.iter_loaded_assets(packages, gc_interval, loader=_load):
+            try:
+                lv._validate_level_asset(world, validators)
+                validated_count += 1
+            except Exception as e:
+                print(f"❌ 레벨 검증 실패 ({package_path}): {e}")
+    print(f"🎉 검증 완료: {validated_count}/{len(packages)}개")
+    return validated_count
+
+
+# =============================================================================
+# Controller - 빌드 머신 (unreal 불필요)
+# =============================================================================
+
+def build_editor_command(editor: str, project: str, script_args: List[str],
+                         log_path: Optional[str] = None) -> List[str]:
+    """UnrealEditor-Cmd -run=pythonscript 명령줄 생성
+
+    -script/-abslog 값은 따옴표로 감쌉니다 (감싸지 않으면 에디터가 첫 공백까지만 읽음).
+    """
+    script = shlex.join([Path(__file__).resolve().as_posix()] + script_args)
+    command = [
+        editor,
+        project,
+        "-run=pythonscript",
+        f'-script="{script}"',
+        "-unattended",
+        "-nopause",
+        "-nosplash",
+        "-stdout",
+    ]
+    if log_path:
+        command.append(f'-abslog="{log_path}"')
+    return command
+
+
+def format_command_line(command: List[str]) -> str:
+    """명령 목록 → 명령줄 문자열 (이미 따옴표가 있는 -key="value" 인자는 그대로 유지)"""
+    return " ".join(f'"{arg}"' if " " in arg and '"' not in arg else arg for arg in command)
+
+
+def _to_posix_argv(command: List[str]) -> List[str]:
+    """Linux/Mac용 argv (에디터가 공백이 있는 -key=value 인자의 값을 직접 따옴표로 감싸므로 벗겨서 전달)"""
+    argv = []
+    for arg in command:
+        key, sep, value = arg.partition("=")
+        if sep and len(value) >= 2 and value[0] == value[-1] == '"':
+            arg = f"{key}={value[1:-1]}"
+        argv.append(arg)
+    return argv
+
+
+def _run_processes(commands, dry_run: bool = False) -> List[int]:
+    """명령들을 동시에 실행하고 종료 코드 목록 반환"""
+    if dry_run:
+        for command in commands:
+            print(format_command_line(command))
+        return [0] * len(commands)
+
+    # Windows에서 목록을 넘기면 인자 안의 따옴표가 \"로 이스케이프되므로 명령줄 문자열로 전달
+    processes = [subprocess.Popen(format_command_line(command) if os.name == "nt" else _to_posix_argv(command))
+                 for command in commands]
+    return [process.wait() for process in processes]
+
+
+def resolve_query(editor: str, project: str, query: str, work_dir: Path,
+                  dry_run: bool = False) -> List[str]:
+    """에디터 프로세스 하나로 query를 레벨 패키지 목록으로 변환"""
+    list_path = work_dir / "query_packages.txt"
+    command = build_editor_command(
+        editor, project,
+        ["--list", "--query", query, "--output", list_path.as_posix()],
+        log_path=(work_dir / "query.log").as_posix(),
+    )
+    _run_processes([command], dry_run=dry_run)
+    if not list_path.exists():
+        return []
+    return read_package_list(list_path)
+
+
+def run_controller(editor: str, project: str, packages, output_path, workers: int = 4,
+                   work_dir=None, dry_run: bool = False) -> int:
+    """패키지를 샤드로 나누어 워커 프로세스로 검증하고 결과를 병합
+
+    Returns:
+        실패한 워커 수 (0이면 모두 성공)
+    """
+    output_path = Path(output_path)
+    work_dir = Path(work_dir) if work_dir else output_path.parent / f"{output_path.stem}_shards"
+    work_dir.mkdir(parents=True, exist_ok=True)
+
+    shards = shard_packages(packages, workers)
+    print(f"📋 레벨 {sum(len(shard) for shard in shards)}개 → 워커 {len(shards)}개")
+
+    commands = []
+    shard_reports = []
+    for index, shard in enumerate(shards):
+        list_path = work_dir / f"shard_{index}.txt"
+        report_path = work_dir / f"shard_{index}.jsonl"
+        write_package_list(list_path, shard)
+        shard_reports.append(report_path)
+        commands.append(build_editor_command(
+            editor, project,
+            ["--worker", "--packages", list_path.as_posix(), "--output", report_path.as_posix()],
+            log_path=(work_dir / f"shard_{index}.log").as_posix(),
+        ))
+
+    start_time = time.time()
+    return_codes = _run_processes(commands, dry_run=dry_run)
+    failed = [index for index, code in enumerate(return_codes) if code != 0]
+    for index in failed:
+        print(f"❌ 워커 {index} 실패 (종료 코드 {return_codes[index]}), 로그: {work_dir / f'shard_{index}.log'}")
+
+    if dry_run:
+        return 0
+
+    issue_count = merge_reports(shard_reports, output_path)
+    print(f"🎉 병합 완료: 이슈 {issue_count}개 → {output_path} ({time.time() - start_time:.1f}s)")
+    return len(failed)
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def _get_script_argv() -> List[str]:
+    """스크립트 인자 (에디터 안에서는 공백으로 나뉜 sys.argv를 다시 합쳐 shlex로 분리)"""
+    try:
+        import unreal  # noqa: F401
+    except ImportError:
+        return sys.argv[1:]
+    return shlex.split(" ".join(sys.argv[1:]))
+
+
+def main(argv=None) -> int:
+    """CLI 엔트리 포인트 (Controller / --worker / --list 모드)"""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="batch_runner",
+        description="MaidCat 헤드리스 레벨 검증 러너",
+    )
+    parser.add_argument("--worker", action="store_true", help="에디터 내부 워커 모드")
+    parser.add_argument("--list", action="store_true", help="에디터 내부 쿼리 목록 생성 모드")
+    parser.add_argument("--packages", help="레벨 패키지 목록 파일 (한 줄에 하나)")
+    parser.add_argument("--query", help="레벨을 검색할 패키지 경로 (예: /Game/Maps)")
+    parser.add_argument("--output", required=True, help="결과 JSONL (list 모드: 패키지 목록) 경로")
+    parser.add_argument("--editor", help="UnrealEditor-Cmd 실행 파일 경로")
+    parser.add_argument("--project", help=".uproject 경로")
+    parser.add_argument("--workers", type=int, default=4, help="워커 프로세스 수 (기본 4)")
+    parser.add_argument("--work-dir", help="샤드 목록/리포트/로그를 저장할 폴더")
+    parser.add_argument("--dry-run", action="store_true", help="실행할 명령만 출력")
+    args = parser.parse_args(_get_script_argv() if argv is None else argv)
+
+    if args.list:
+        write_package_list(args.output, find_level_packages(args.query or "/Game"))
+        return 0
+
+    if args.worker:
+        run_worker(read_package_list(args.packages), args.output)
+        return 0
+
+    if not args.editor or not args.project:
+        parser.error("Controller 모드에는 --editor와 --project가 필요합니다")
+
+    if args.packages:
+        packages = read_package_list(args.packages)
+    elif args.query:
+        output_path = Path(args.output)
+        work_dir = Path(args.work_dir) if args.work_dir else output_path.parent / f"{output_path.stem}_shards"
+        work_dir.mkdir(parents=True, exist_ok=True)
+        packages = resolve_query(args.editor, args.project, args.query, work_dir, dry_run=args.dry_run)
+    else:
+        parser.error("--packages 또는 --query가 필요합니다")
+
+    return 1 if run_controller(args.editor, args.project, packages, args.output,
+                               workers=args.workers, work_dir=args.work_dir,
+                               dry_run=args.dry_run) else 0
+
+
+if __name__ == "__main__":
+    # 에디터 내부(-run=pythonscript)에서는 성공 시 SystemExit를 발생시키지 않음
+    _exit_code = main()
+    if _exit_code:
+        sys.exit(_exit_code)
@@ -7,54 +7,154 @@ Features:
 - Level open/close event handling
 - Asset validation on level changes
 - Auto-fix capabilities for common issues
+- Streaming JSONL/SARIF validation reports (validator.validation_report)
 """
 
+import contextlib
+import time
+
 import unreal
 
+from util import asset_iter
+from validator.validation_report import make_finding, open_report_writer
+
 
 # =============================================================================
 # Level Event Manager - Level 열기/닫기 이벤트 처리
 # =============================================================================
 
+class DebouncedDispatcher:
+    """짧은 시간 안에 들어온 여러 알림을 한 번의 호출로 합치는 디스패처
+
+    notify()가 호출될 때마다 대기 시간이 갱신되고, 마지막 알림 후 delay초 동안
+    추가 알림이 없으면 callback이 한 번 실행됩니다. 대기 중에만 Slate tick에 등록됩니다.
+    """
+    
+    def __init__(self, callback, delay: float = 0.5, clock=time.monotonic):
+        self._callback = callback
+        self._delay = delay
+        self._clock = clock
+        self._deadline = None
+        self._tick_handle = None
+    
+    @property
+    def pending(self) -> bool:
+        """실행 대기 중인 알림이 있는지 여부"""
+        return self._deadline is not None
+    
+    def notify(self):
+        """알림 등록 (대기 시간 재시작)"""
+        self._deadline = self._clock() + self._delay
+        if self._tick_handle is None:
+            self._tick_handle = unreal.register_slate_post_tick_callback(self._on_tick)
+    
+    def _on_tick(self, delta_time: float):
+        """Slate tick 콜백"""
+        self.poll()
+    
+    def poll(self) -> bool:
+        """대기 시간이 지났으면 callback 실행 (실행 여부 반환)"""
+        if self._deadline is None or self._clock() < self._deadline:
+            return False
+        self._deadline = None
+        self._unregister_tick()
+        self._callback()
+        return True
+    
+    def cancel(self):
+        """대기 중인 알림 취소"""
+        self._deadline = None
+        self._unregister_tick()
+    
+    def _unregister_tick(self):
+        if self._tick_handle is not None:
+            unreal.unregister_slate_post_tick_callback(self._tick_handle)
+            self._tick_handle = None
+
+
 class LevelEventManager:
-    """Level 열기/닫기 이벤트를 관리하는 클래스"""
+    """Level 열기/닫기 이벤트를 관리하는 클래스
+
+    editor.level_events의 맵 열림/변경 델리게이트를 구독하고,
+    DebouncedDispatcher로 연속된 알림을 한 번의 레벨 확인으로 합칩니다.
+    """
+    
+    # WorldTearDown 알림은 검증 대상이 아님 (editor.level_events 참고)
+    MAP_CHANGE_TEARDOWN = 3
     
-    def __init__(self):
+    def __init__(self, debounce_delay: float = 0.5):
         self._current_level = None
         self._validation_enabled = True
+        self._listening = False
+        self._dispatcher = DebouncedDispatcher(self.check_current_level, debounce_delay)
         self._setup_level_events()
     
     def _setup_level_events(self):
-        """Level 이벤트 콜백 설정"""
+        """Level 이벤트 델리게이트 구독"""
         try:
-            # Level Editor 서브시스템 가져오기
-            level_editor_subsystem = unreal.get_editor_subsystem(unreal.LevelEditorSubsystem)
-            if level_editor_subsystem:
-                unreal.log("🎯 Level Event Manager 초기화 성공")
-                
-                # Level 변경 감지를 위한 타이머 설정 (실제 이벤트 대신 폴링 방식)
-                self._setup_level_monitoring()
+            from editor import level_events
+            
+            # 리스너 전용 등록 (디버그 출력/저장 훅이 있는 LevelEventHandler는 시작하지 않음)
+            if (level_events.add_level_event_listener("map_opened", self._on_map_opened)
+                    and level_events.add_level_event_listener("map_changed", self._on_map_changed)):
+                self._listening = True
+                unreal.log("🎯 Level Event Manager 초기화 성공 (이벤트 기반)")
             else:
-                unreal.log_warning("⚠️ LevelEditorSubsystem을 가져올 수 없습니다")
+                level_events.remove_level_event_listener("map_opened", self._on_map_opened)
+                unreal.log_warning("⚠️ Level 이벤트 델리게이트를 등록할 수 없습니다")
+            
+            # 이미 열려 있는 레벨도 디스패처를 통해 한 번 확인
+            self._dispatcher.notify()
                 
         except Exception as e:
             unreal.log_error(f"❌ Level 이벤트 설정 실패: {e}")
     
-    def _setup_level_monitoring(self):
-        """Level 모니터링 설정 (폴링 방식)"""
+    def _on_map_opened(self, filename: str, as_template: bool):
+        """맵 열림 델리게이트 → 디바운스 알림"""
+        self._dispatcher.notify()
+    
+    def _on_map_changed(self, map_change_flags: int):
+        """맵 변경 델리게이트 → 디바운스 알림 (TearDown 제외)"""
+        if map_change_flags == self.MAP_CHANGE_TEARDOWN:
+            return
+        self._dispatcher.notify()
+    
+    def check_current_level(self) -> bool:
+        """현재 에디터 월드를 확인하고 레벨이 바뀌었으면 닫힘/열림 처리 (변경 여부 반환)"""
         try:
-            # 현재 레벨 추적을 위한 초기 설정 (최신 API 사용)
             editor_subsystem = unreal.get_editor_subsystem(unreal.UnrealEditorSubsystem)
-            if editor_subsystem:
-                current_world = editor_subsystem.get_editor_world()
-                if current_world:
-                    current_level_path = current_world.get_path_name()
-                    if current_level_path != self._current_level:
-                        self._current_level = current_level_path
-                        self.on_level_opened(current_level_path)
-                    
+            if not editor_subsystem:
+                return False
+            
+            current_world = editor_subsystem.get_editor_world()
+            if not current_world:
+                return False
+            
+            current_level_path = current_world.get_path_name()
+            if current_level_path == self._current_level:
+                return False
+            
+            if self._current_level:
+                self.on_level_closed(self._current_level)
+            self.on_level_opened(current_level_path)
+            return True
+            
+        except Exception as e:
+            unreal.log_error(f"❌ Level 변경 확인 실패: {e}")
+            return False
+    
+    def shutdown(self):
+        """델리게이트 구독 해제 및 대기 중인 검증 취소"""
+        self._dispatcher.cancel()
+        if not self._listening:
+            return
+        try:
+            from editor import level_events
+            level_events.remove_level_event_listener("map_opened", self._on_map_opened)
+            level_events.remove_level_event_listener("map_changed", self._on_map_changed)
         except Exception as e:
-            unreal.log_error(f"❌ Level 모니터링 설정 실패: {e}")
+            unreal.log_error(f"❌ Level 이벤트 해제 실패: {e}")
+        self._listening = False
     
     def on_level_opened(self, level_path: str):
         """Level이 열렸을 때 호출되는 콜백"""
@@ -152,6 +252,47 @@ Unreal Engine Asset Validation 시스템 개요:
 - 커맨드라인: -run=DataValidation
 """
 
+# =============================================================================
+# Validation Report 스트리밍
+# =============================================================================
+
+# 현재 활성화된 리포트 Writer (report_to() 컨텍스트 안에서만 설정됨)
+_active_report_writer = None
+
+
+@contextlib.contextmanager
+def report_to(report_path, report_format=None):
+    """컨텍스트 안에서 발생한 Validator 이슈를 리포트 파일로 스트리밍 기록
+
+    Args:
+        report_path: 리포트 파일 경로 (.jsonl 또는 .sarif)
+        report_format: "jsonl" 또는 "sarif" (None이면 확장자로 판단)
+    """
+    global _active_report_writer
+    previous_writer = _active_report_writer
+    writer = open_report_writer(report_path, report_format)
+    _active_report_writer = writer
+    try:
+        yield writer
+    finally:
+        _active_report_writer = previous_writer
+        writer.close()
+
+
+def _report_issue(validator, rule: str, asset, message: str, level: str = "error"):
+    """활성 리포트 Writer가 있으면 Validator 이슈를 finding으로 기록"""
+    if _active_report_writer is None:
+        return
+    try:
+        asset_path = asset.get_path_name()
+    except Exception:
+        asset_path = str(asset)
+    validator_name = type(validator).__name__
+    _active_report_writer.write(
+        make_finding(f"{validator_name}.{rule}", asset_path, message, level, validator_name)
+    )
+
+
 @unreal.uclass()
 class MaidCatLevelNamingValidator(unreal.EditorValidatorBase):
     """
@@ -214,6 +355,7 @@ class MaidCatLevelNamingValidator(unreal.EditorValidatorBase):
             # 검증 실패 - 시스템에 실패 알림 및 오류 메시지 전달
             error_message = f"Level 이름 규칙 위반: '{asset_name}'은(는) 'LV_' 접두사가 필요합니다."
             self.asset_fails(asset, unreal.Text(error_message))
+            _report_issue(self, "prefix", asset, error_message)
             unreal.log_warning(f"❌ {error_message} (경로: {asset_path})")
             return unreal.DataValidationResult.INVALID
 
@@ -243,7 +385,9 @@ class MaidCatLevelPerformanceValidator(unreal.EditorValidatorBase):
             # 현재 레벨의 액터들 분석 (최신 API 사용)
             editor_actor_subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
             if not editor_actor_subsystem:
-                self.asset_fails(asset, unreal.Text("EditorActorSubsystem을 가져올 수 없습니다."))
+                error_msg = "EditorActorSubsystem을 가져올 수 없습니다."
+                self.asset_fails(asset, unreal.Text(error_msg))
+                _report_issue(self, "subsystem", asset, error_msg)
                 return unreal.DataValidationResult.INVALID
                 
             all_actors = editor_actor_subsystem.get_all_level_actors()
@@ -253,10 +397,12 @@ class MaidCatLevelPerformanceValidator(unreal.EditorValidatorBase):
             if actor_count > 2000:
                 warning_msg = f"액터 개수가 많습니다 ({actor_count}개). 성능 최적화를 고려하세요."
                 self.asset_fails(asset, unreal.Text(warning_msg))
+                _report_issue(self, "actor_count", asset, warning_msg)
                 return unreal.DataValidationResult.INVALID
             elif actor_count > 1000:
                 warning_msg = f"액터 개수 주의 ({actor_count}개). 성능 모니터링이 필요합니다."
                 self.asset_passes(asset)  # 경고지만 통과
+                _report_issue(self, "actor_count", asset, warning_msg, level="warning")
                 unreal.log_warning(warning_msg)
                 return unreal.DataValidationResult.VALID
             else:
@@ -266,6 +412,7 @@ class MaidCatLevelPerformanceValidator(unreal.EditorValidatorBase):
         except Exception as e:
             error_msg = f"성능 검증 중 오류 발생: {e}"
             self.asset_fails(asset, unreal.Text(error_msg))
+            _report_issue(self, "exception", asset, error_msg)
             return unreal.DataValidationResult.INVALID
 
 
@@ -303,8 +450,9 @@ class MaidCatLevelContentValidator(unreal.EditorValidatorBase):
             self._check_world_settings(asset, validation_issues)
             
             if validation_issues:
-                for issue in validation_issues:
+                for rule, issue in validation_issues:
                     self.asset_fails(asset, unreal.Text(issue))
+                    _report_issue(self, rule, asset, issue)
                 return unreal.DataValidationResult.INVALID
             else:
                 self.asset_passes(asset)
@@ -313,14 +461,15 @@ class MaidCatLevelContentValidator(unreal.EditorValidatorBase):
         except Exception as e:
             error_msg = f"콘텐츠 검증 중 오류 발생: {e}"
             self.asset_fails(asset, unreal.Text(error_msg))
+            _report_issue(self, "exception", asset, error_msg)
             return unreal.DataValidationResult.INVALID
     
     def _check_essential_actors(self, issues):
-        """필수 액터들이 있는지 확인"""
+        """필수 액터들이 있는지 확인 (issues에 (규칙 ID, 메시지) 추가)"""
         try:
             editor_actor_subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
             if not editor_actor_subsystem:
-                issues.append("EditorActorSubsystem을 가져올 수 없습니다.")
+                issues.append(("subsystem", "EditorActorSubsystem을 가져올 수 없습니다."))
                 return
                 
             all_actors = editor_actor_subsystem.get_all_level_actors()
@@ -329,17 +478,17 @@ class MaidCatLevelContentValidator(unreal.EditorValidatorBase):
             player_starts = [actor for actor in all_actors 
                            if isinstance(actor, unreal.PlayerStart)]
             if not player_starts:
-                issues.append("PlayerStart 액터가 없습니다. 플레이어 스폰 지점이 필요합니다.")
+                issues.append(("player_start", "PlayerStart 액터가 없습니다. 플레이어 스폰 지점이 필요합니다."))
             
         except Exception as e:
-            issues.append(f"필수 액터 확인 실패: {e}")
+            issues.append(("essential_actors", f"필수 액터 확인 실패: {e}"))
     
     def _check_lighting_setup(self, issues):
         """라이팅 설정 확인"""
         try:
             editor_actor_subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
             if not editor_actor_subsystem:
-                issues.append("EditorActorSubsystem을 가져올 수 없습니다.")
+                issues.append(("subsystem", "EditorActorSubsystem을 가져올 수 없습니다."))
                 return
                 
             all_actors = editor_actor_subsystem.get_all_level_actors()
@@ -348,10 +497,10 @@ class MaidCatLevelContentValidator(unreal.EditorValidatorBase):
             directional_lights = [actor for actor in all_actors 
                                 if isinstance(actor, unreal.DirectionalLight)]
             if not directional_lights:
-                issues.append("Directional Light가 없습니다. 기본 조명이 필요합니다.")
+                issues.append(("directional_light", "Directional Light가 없습니다. 기본 조명이 필요합니다."))
             
         except Exception as e:
-            issues.append(f"라이팅 설정 확인 실패: {e}")
+            issues.append(("lighting", f"라이팅 설정 확인 실패: {e}"))
     
     def _check_world_settings(self, asset, issues):
         """월드 설정 확인"""
@@ -360,7 +509,7 @@ class MaidCatLevelContentValidator(unreal.EditorValidatorBase):
             unreal.log(f"🌍 월드 설정 확인: {asset.get_name()}")
             
         except Exception as e:
-            issues.append(f"월드 설정 확인 실패: {e}")
+            issues.append(("world_settings", f"월드 설정 확인 실패: {e}"))
 
 
 # =============================================================================
@@ -420,111 +569,112 @@ def get_level_event_manager():
 # =============================================================================
 
 def monitor_level_changes():
-    """Level 변경 감지 (수동 호출용)"""
-    try:
-        manager = get_level_event_manager()
-        editor_subsystem = unreal.get_editor_subsystem(unreal.UnrealEditorSubsystem)
-        
-        if editor_subsystem:
-            current_world = editor_subsystem.get_editor_world()
-            
-            if current_world:
-                current_level_path = current_world.get_path_name()
-                
-                # 레벨이 변경되었는지 확인
-                if current_level_path != manager._current_level:
-                    old_level = manager._current_level
-                    
-                    # 이전 레벨 닫힘 이벤트
-                    if old_level:
-                        manager.on_level_closed(old_level)
-                    
-                    # 새 레벨 열림 이벤트
-                    manager.on_level_opened(current_level_path)
-                    
-                    return True  # 변경 감지됨
-        
-        return False  # 변경 없음
-        
-    except Exception as e:
-        unreal.log_error(f"❌ Level 변경 감지 실패: {e}")
-        return False
+    """Level 변경 감지 (수동 호출용)
+
+    평소에는 맵 이벤트 델리게이트가 자동으로 처리하므로 직접 호출할 필요가 없습니다.
+    """
+    manager = get_level_event_manager()
+    return manager.check_current_level()
 
 
 def setup_level_change_callback():
-    """Level 변경 콜백 설정 (에디터 이벤트 기반)"""
-    try:
-        # Asset Registry를 통한 레벨 변경 감지 시도
-        asset_registry = unreal.AssetRegistryHelpers.get_asset_registry()
-        if asset_registry:
-            unreal.log("📡 Asset Registry를 통한 Level 변경 감지 설정")
-            # 실제 콜백 연결은 C++ 레벨에서 더 안정적임
-        
-        return True
-        
-    except Exception as e:
-        unreal.log_error(f"❌ Level 변경 콜백 설정 실패: {e}")
-        return False
+    """Level 변경 콜백 설정 (에디터 이벤트 기반)
+
+    LevelEventManager가 editor.level_events의 맵 열림/변경 델리게이트를 구독합니다.
+    """
+    manager = get_level_event_manager()
+    if not manager._listening:
+        manager._setup_level_events()
+    return manager._listening
+
+
+def _validate_level_asset(world_asset, validators):
+    """Validator들로 World 에셋 하나를 검증하여 결과 리스트 반환"""
+    results = []
+    for validator in validators:
+        try:
+            result = validator.validate_loaded_asset(world_asset, None)
+            results.append({
+                "validator": type(validator).__name__,
+                "result": str(result)
+            })
+        except Exception as e:
+            _report_issue(validator, "exception", world_asset, f"Validator 실행 실패: {e}")
+            results.append({
+                "validator": type(validator).__name__,
+                "result": f"ERROR: {e}"
+            })
+    return results
+
 
+def _load_level_package(asset_data):
+    """AssetData의 패키지 경로로 Level 에셋 로드"""
+    return unreal.EditorAssetLibrary.load_asset(str(asset_data.package_name))
 
-def force_validate_all_levels():
-    """프로젝트 내 모든 Level에 대한 강제 검증"""
+
+def force_validate_all_levels(report_path=None, report_format=None, chunk_size=4, memory_limit_mb=None):
+    """프로젝트 내 모든 Level에 대한 강제 검증
+
+    Level은 chunk_size개씩 로드되며, 청크 사이마다 가비지 컬렉션으로 메모리를 회수합니다.
+
+    Args:
+        report_path: 지정하면 결과를 메모리에 모으지 않고 JSONL/SARIF 리포트로 스트리밍 기록
+        report_format: "jsonl" 또는 "sarif" (None이면 report_path 확장자로 판단)
+        chunk_size: 가비지 컬렉션 사이에 로드할 Level 수
+        memory_limit_mb: 넘으면 즉시 가비지 컬렉션을 실행할 메모리 상한 (MB)
+
+    Returns:
+        report_path가 없으면 레벨별 결과 리스트, 있으면 기록된 리포트 경로
+    """
     try:
         unreal.log("🔍 프로젝트 내 모든 Level 검증 시작...")
         
-        # 프로젝트 내 모든 World 에셋 찾기
-        asset_registry = unreal.AssetRegistryHelpers.get_asset_registry()
-        
-        # World 클래스 필터 (대안 방법 사용)
-        world_assets = []
+        # 프로젝트 내 모든 World 에셋 찾기 (Asset Registry 데이터만 사용, 로드하지 않음)
         try:
-            # EditorAssetLibrary를 사용한 에셋 검색
-            all_game_assets = unreal.EditorAssetLibrary.list_assets("/Game", recursive=True, include_folder=False)
-            
-            for asset_path in all_game_assets:
-                asset_data = asset_registry.get_asset_by_object_path(asset_path)
-                if asset_data and asset_data.asset_class_path.asset_name == "World":
-                    world_assets.append(asset_data)
-                    
+            world_assets = list(asset_iter.iter_asset_data("/Game", class_names={"World"}))
         except Exception as e:
             unreal.log_error(f"❌ World 에셋 검색 실패: {e}")
             return []
         
         unreal.log(f"📋 발견된 Level: {len(world_assets)}개")
         
+        # 각 Validator는 한 번만 생성하여 재사용
+        validators = [
+            MaidCatLevelNamingValidator(),
+            MaidCatLevelPerformanceValidator(),
+            MaidCatLevelContentValidator()
+        ]
+        
+        if report_path:
+            # 스트리밍 모드: 이슈를 즉시 파일에 기록하고 결과는 보관하지 않음
+            validated_count = 0
+            with report_to(report_path, report_format) as writer:
+                for asset_data, world_asset in asset_iter.iter_loaded_assets(
+                        world_assets, chunk_size, memory_limit_mb, loader=_load_level_package):
+                    try:
+                        _validate_level_asset(world_asset, validators)
+                        validated_count += 1
+                    except Exception as e:
+                        unreal.log_error(f"❌ Level 검증 실패 ({asset_data.package_name}): {e}")
+                issue_count = writer.count
+            
+            unreal.log(f"🎉 전체 Level 검증 완료: {validated_count}개 처리, 이슈 {issue_count}개")
+            unreal.log(f"📄 리포트 기록: {report_path}")
+            return str(report_path)
+        
         validation_results = []
         
-        for asset_data in world_assets:
+        for asset_data, world_asset in asset_iter.iter_loaded_assets(
+                world_assets, chunk_size, memory_limit_mb, loader=_load_level_package):
             try:
                 asset_path = str(asset_data.package_name)
                 unreal.log(f"🔍 검증 중: {asset_path}")
                 
-                # 에셋 로드
-                world_asset = unreal.EditorAssetLibrary.load_asset(asset_path)
-                if world_asset:
-                    # 각 Validator로 검증
-                    validators = [
-                        MaidCatLevelNamingValidator(),
-                        MaidCatLevelPerformanceValidator(),
-                        MaidCatLevelContentValidator()
-                    ]
-                    
-                    level_result = {"path": asset_path, "results": []}
-                    
-                    for validator in validators:
-                        try:
-                            result = validator.validate_loaded_asset(world_asset, None)
-                            level_result["results"].append({
-                                "validator": type(validator).__name__,
-                                "result": str(result)
-                            })
-                        except Exception as e:
-                            level_result["results"].append({
-                                "validator": type(validator).__name__,
-                                "result": f"ERROR: {e}"
-                            })
-                    
-                    validation_results.append(level_result)
+                # 결과는 경로와 문자열만 보관 (World 객체는 보관하지 않음)
+                validation_results.append({
+                    "path": asset_path,
+                    "results": _validate_level_asset(world_asset, validators)
+                })
                 
             except Exception as e:
                 unreal.log_error(f"❌ Level 검증 실패 ({asset_data.package_name}): {e}")
@@ -604,8 +754,13 @@ def enable_level_validation(enabled: bool = True):
     manager.enable_validation(enabled)
 
 
-def get_validation_report():
-    """현재 레벨의 검증 리포트 생성"""
+def get_validation_report(report_path=None, report_format=None):
+    """현재 레벨의 검증 리포트 생성
+
+    Args:
+        report_path: 지정하면 현재 레벨의 Validator 이슈를 JSONL/SARIF 리포트로 기록
+        report_format: "jsonl" 또는 "sarif" (None이면 report_path 확장자로 판단)
+    """
     try:
         editor_subsystem = unreal.get_editor_subsystem(unreal.UnrealEditorSubsystem)
         if not editor_subsystem:
@@ -638,6 +793,17 @@ def get_validation_report():
         else:
             report.append("액터 정보를 가져올 수 없습니다.")
         
+        if report_path:
+            validators = [
+                MaidCatLevelNamingValidator(),
+                MaidCatLevelPerformanceValidator(),
+                MaidCatLevelContentValidator()
+            ]
+            with report_to(report_path, report_format) as writer:
+                _validate_level_asset(current_world, validators)
+                issue_count = writer.count
+            report.append(f"\n검증 이슈: {issue_count}개 (리포트: {report_path})")
+        
         report.append("=" * 60)
         
         return "\n".join(report)
@@ -752,6 +918,8 @@ def show_validator_help():
     
     📊 정보 및 리포트:
     - get_validation_report(): 현재 레벨 검증 리포트 생성
+    - force_validate_all_levels(report_path="levels.jsonl"): JSONL/SARIF 스트리밍 리포트
+    - python -m validator.validation_report delta old.jsonl new.jsonl: 실행 간 새/해결 이슈 비교
     
     🧪 테스트:
     - test_validator_system(): 전체 시스템 테스트
@@ -857,6 +1025,8 @@ def reset_validation_system():
     global _level_event_manager, _system_initialized
     
     unreal.log("🔄 Level Validation System 리셋...")
+    if _level_event_manager:
+        _level_event_manager.shutdown()
     _level_event_manager = None
     _system_initialized = False
     
@@ -879,6 +1049,7 @@ def show_system_status():
         validation_enabled = '✅ Yes' if _level_event_manager._validation_enabled else '❌ No'
         unreal.log(f"현재 레벨: {current_level}")
         unreal.log(f"검증 활성화: {validation_enabled}")
+        unreal.log(f"이벤트 구독: {'✅ Yes' if _level_event_manager._listening else '❌ No'}")
     
     unreal.log("=" * 60)
 
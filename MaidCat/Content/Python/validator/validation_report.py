@@ -0,0 +1,328 @@
+"""
+MaidCat Validation Report
+검증 결과를 스트리밍 방식으로 기록하고, 두 리포트 간 변경분(delta)을 비교하는 모듈
+
+Features:
+- JSONL / SARIF 리포트 스트리밍 기록 (결과를 메모리에 쌓지 않음)
+- 규칙 + 에셋 경로 기반 fingerprint로 실행 간 동일 이슈 식별
+- 두 리포트 비교: 새로 생긴 이슈 / 해결된 이슈만 출력
+
+이 모듈은 unreal 모듈 없이도 동작하므로 CI에서 바로 사용할 수 있습니다.
+
+사용법:
+    # 에디터 내부 (validator.level_validator)
+    lv.force_validate_all_levels(report_path="C:/Reports/levels.jsonl")
+
+    # CI: 이전 실행 대비 새 이슈가 있으면 종료 코드 1
+    python -m validator.validation_report delta old.jsonl new.jsonl --fail-on-new
+"""
+
+import hashlib
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+
+REPORT_FORMATS = ("jsonl", "sarif")
+
+# SARIF 결과 레벨 (error / warning / note)
+SEVERITY_LEVELS = ("error", "warning", "note")
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+SARIF_VERSION = "2.1.0"
+FINGERPRINT_KEY = "maidcat/v1"
+
+
+# =============================================================================
+# Finding 생성
+# =============================================================================
+
+def make_fingerprint(rule: str, asset: str) -> str:
+    """규칙과 에셋 경로로 이슈 fingerprint 생성
+
+    메시지는 액터 개수처럼 실행마다 바뀌는 값을 포함할 수 있으므로
+    fingerprint에서 제외합니다.
+    """
+    return hashlib.sha1(f"{rule}|{asset}".encode("utf-8")).hexdigest()
+
+
+def make_finding(rule: str, asset: str, message: str, level: str = "error",
+                 validator: str = "") -> Dict[str, str]:
+    """리포트에 기록할 finding 딕셔너리 생성
+
+    Args:
+        rule: 규칙 ID (예: "MaidCatLevelNamingValidator.prefix")
+        asset: 에셋 경로
+        message: 사용자에게 보여줄 메시지
+        level: "error", "warning", "note" 중 하나
+        validator: 결과를 생성한 Validator 클래스 이름
+    """
+    if level not in SEVERITY_LEVELS:
+        level = "error"
+    return {
+        "kind": "finding",
+        "rule": rule,
+        "level": level,
+        "asset": asset,
+        "message": message,
+        "validator": validator or rule.split(".")[0],
+        "fingerprint": make_fingerprint(rule, asset),
+    }
+
+
+# =============================================================================
+# Report Writers - 스트리밍 기록
+# =============================================================================
+
+class JsonlReportWriter:
+    """finding을 한 줄씩 JSONL 파일에 기록하는 Writer
+
+    첫 줄은 실행 정보(kind="run"), 이후 각 줄이 finding 하나입니다.
+    """
+
+    format = "jsonl"
+
+    def __init__(self, path, tool_name: str = "MaidCat"):
+        self.path = Path(path)
+        self.count = 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "w", encoding="utf-8")
+        self._write_line({
+            "kind": "run",
+            "tool": tool_name,
+            "started": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        })
+
+    def _write_line(self, record: dict):
+        self._file.write(json.dumps(record, ensure_ascii=False))
+        self._file.write("\n")
+
+    def write(self, finding: dict):
+        """finding 하나 기록 (즉시 flush하여 중단 시에도 결과 보존)"""
+        self._write_line(finding)
+        self._file.flush()
+        self.count += 1
+
+    def close(self):
+        """파일 닫기"""
+        if self._file and not self._file.closed:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+
+class SarifReportWriter:
+    """finding을 SARIF 2.1.0 형식으로 스트리밍 기록하는 Writer
+
+    results 배열을 열어 둔 채 결과를 하나씩 덧붙이고, close() 시 문서를 닫습니다.
+    """
+
+    format = "sarif"
+
+    def __init__(self, path, tool_name: str = "MaidCat"):
+        self.path = Path(path)
+        self.count = 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "w", encoding="utf-8")
+        header = {
+            "$schema": SARIF_SCHEMA,
+            "version": SARIF_VERSION,
+        }
+        driver = json.dumps({"driver": {"name": tool_name}}, ensure_ascii=False)
+        # 마지막 '}'를 제거하고 runs 배열을 열어 둠
+        self._file.write(json.dumps(header, ensure_ascii=False)[:-1])
+        self._file.write(f', "runs": [{{"tool": {driver}, "results": [\n')
+
+    def write(self, finding: dict):
+        """finding 하나를 SARIF result로 변환하여 기록"""
+        result = {
+            "ruleId": finding["rule"],
+            "level": finding["level"],
+            "message": {"text": finding["message"]},
+            "locations": [{
+                "physicalLocation": {"artifactLocation": {"uri": finding["asset"]}}
+            }],
+            "partialFingerprints": {FINGERPRINT_KEY: finding["fingerprint"]},
+            "properties": {"validator": finding.get("validator", "")},
+        }
+        if self.count:
+            self._file.write(",\n")
+        self._file.write(json.dumps(result, ensure_ascii=False))
+        self._file.flush()
+        self.count += 1
+
+    def close(self):
+        """SARIF 문서를 닫고 파일 닫기"""
+        if self._file and not self._file.closed:
+            self._file.write("\n]}]}\n")
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+
+def open_report_writer(path, report_format: Optional[str] = None):
+    """경로 확장자 또는 지정된 형식에 맞는 Writer 생성
+
+    Args:
+        path: 리포트 파일 경로
+        report_format: "jsonl" 또는 "sarif" (None이면 확장자로 판단)
+    """
+    path = Path(path)
+    if report_format is None:
+        report_format = "sarif" if path.suffix.lower() == ".sarif" else "jsonl"
+
+    if report_format == "sarif":
+        return SarifReportWriter(path)
+    if report_format == "jsonl":
+        return JsonlReportWriter(path)
+    raise ValueError(f"지원하지 않는 리포트 형식: {report_format} (지원: {', '.join(REPORT_FORMATS)})")
+
+
+# =============================================================================
+# Report 읽기 및 비교
+# =============================================================================
+
+def iter_findings(path) -> Iterator[dict]:
+    """리포트 파일에서 finding을 하나씩 읽기
+
+    JSONL은 한 줄씩 스트리밍으로 읽고, SARIF는 문서를 파싱한 뒤 결과를 변환합니다.
+    """
+    path = Path(path)
+    if path.suffix.lower() == ".sarif":
+        with open(path, "r", encoding="utf-8") as f:
+            document = json.load(f)
+        for run in document.get("runs", []):
+            for result in run.get("results", []):
+                locations = result.get("locations") or [{}]
+                asset = (locations[0].get("physicalLocation", {})
+                         .get("artifactLocation", {}).get("uri", ""))
+                rule = result.get("ruleId", "")
+                fingerprint = (result.get("partialFingerprints", {}).get(FINGERPRINT_KEY)
+                               or make_fingerprint(rule, asset))
+                yield {
+                    "kind": "finding",
+                    "rule": rule,
+                    "level": result.get("level", "error"),
+                    "asset": asset,
+                    "message": result.get("message", {}).get("text", ""),
+                    "validator": result.get("properties", {}).get("validator", ""),
+                    "fingerprint": fingerprint,
+                }
+        return
+
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            if record.get("kind", "finding") != "finding":
+                continue
+            if "fingerprint" not in record:
+                record["fingerprint"] = make_fingerprint(record.get("rule", ""), record.get("asset", ""))
+            yield record
+
+
+def diff_reports(old_path, new_path) -> Dict[str, list]:
+    """두 리포트를 비교하여 새로 생긴 이슈와 해결된 이슈 반환
+
+    이전 리포트의 fingerprint만 메모리에 올린 뒤 새 리포트를 스트리밍으로 비교합니다.
+
+    Returns:
+        {"new": [새 finding...], "fixed": [해결된 finding...]}
+    """
+    previous = {}
+    for finding in iter_findings(old_path):
+        previous.setdefault(finding["fingerprint"], finding)
+
+    new_findings = []
+    seen = set()
+    for finding in iter_findings(new_path):
+        fingerprint = finding["fingerprint"]
+        if fingerprint in seen:
+            continue
+        seen.add(fingerprint)
+        if fingerprint in previous:
+            del previous[fingerprint]
+        else:
+            new_findings.append(finding)
+
+    return {"new": new_findings, "fixed": list(previous.values())}
+
+
+def merge_reports(report_paths, output_path) -> int:
+    """여러 리포트(샤드 결과)를 하나의 JSONL 리포트로 병합 (병합된 finding 개수 반환)
+
+    존재하지 않는 리포트는 건너뜁니다. 각 finding은 스트리밍으로 복사됩니다.
+    """
+    with JsonlReportWriter(output_path) as writer:
+        for report_path in report_paths:
+            if not Path(report_path).exists():
+                continue
+            for finding in iter_findings(report_path):
+                writer.write(finding)
+        return writer.count
+
+
+def _format_finding(finding: dict) -> str:
+    return f"[{finding['level']}] {finding['rule']} {finding['asset']}: {finding['message']}"
+
+
+def main(argv=None) -> int:
+    """CLI 엔트리 포인트
+
+    python -m validator.validation_report delta OLD NEW [--fail-on-new] [--output DELTA.jsonl]
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="validation_report",
+        description="MaidCat 검증 리포트 도구",
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    delta_parser = subparsers.add_parser("delta", help="두 리포트의 새 이슈/해결된 이슈 비교")
+    delta_parser.add_argument("old", help="이전 리포트 (.jsonl 또는 .sarif)")
+    delta_parser.add_argument("new", help="새 리포트 (.jsonl 또는 .sarif)")
+    delta_parser.add_argument("--fail-on-new", action="store_true",
+                              help="새 이슈가 있으면 종료 코드 1 반환")
+    delta_parser.add_argument("--output", help="delta 결과를 JSONL로 저장할 경로")
+
+    args = parser.parse_args(argv)
+    if args.command != "delta":
+        parser.print_help()
+        return 2
+
+    delta = diff_reports(args.old, args.new)
+
+    for finding in delta["new"]:
+        print(f"+ {_format_finding(finding)}")
+    for finding in delta["fixed"]:
+        print(f"- {_format_finding(finding)}")
+    print(f"새 이슈: {len(delta['new'])}개, 해결된 이슈: {len(delta['fixed'])}개")
+
+    if args.output:
+        with JsonlReportWriter(args.output) as writer:
+            for status in ("new", "fixed"):
+                for finding in delta[status]:
+                    writer.write(dict(finding, delta=status))
+
+    if args.fail_on_new and delta["new"]:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())